@@ -0,0 +1,46 @@
+"""vulnerabilities 상태 인덱스에 updated_at INCLUDE
+
+목록 ETag의 (건수, max(updated_at)) 집계가 인덱스만 읽도록
+ix_vulnerabilities_status / ix_vulnerabilities_assessment_id_status를
+INCLUDE (updated_at)로 다시 만듭니다. (점검별 상태 인덱스는 없으면 새로 생성)
+
+운영 중 테이블 잠금을 피하려고 새 인덱스를 CONCURRENTLY로 만든 뒤 교체합니다.
+(이미 INCLUDE로 만들어진 DB에서 실행해도 같은 인덱스로 다시 만들어질 뿐)
+
+Revision ID: 3f2a9c1d7b4e
+Revises: 6c1e0f5a2b9d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f2a9c1d7b4e"
+down_revision: Union[str, None] = "6c1e0f5a2b9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 키 컬럼)
+INDEXES = [
+    ("ix_vulnerabilities_status", "status"),
+    ("ix_vulnerabilities_assessment_id_status", "assessment_id, status"),
+]
+
+
+def _replace(name: str, definition: str) -> None:
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}_new")
+        op.execute(f"CREATE INDEX CONCURRENTLY {name}_new ON vulnerabilities {definition}")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        _replace(name, f"({columns}) INCLUDE (updated_at)")
+
+
+def downgrade() -> None:
+    for name, columns in INDEXES:
+        _replace(name, f"({columns})")
@@ -0,0 +1,37 @@
+"""목록 keyset 페이지네이션 인덱스 (created_at, id)
+
+운영 중 테이블 잠금을 피하려고 CONCURRENTLY로 만듭니다. (이미 있으면 건너뜀)
+
+Revision ID: 6fb4a59e0b7a
+Revises: b64e87717ec0
+Create Date: 2026-10-18 13:10:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6fb4a59e0b7a"
+down_revision: Union[str, None] = "b64e87717ec0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 키 컬럼)
+INDEXES = [
+    ("ix_users_created_at_id", "users", "created_at, id"),
+    ("ix_vulnerabilities_created_at_id", "vulnerabilities", "created_at, id"),
+    ("ix_vuln_action_logs_vulnerability_id_created_at_id", "vuln_action_logs", "vulnerability_id, created_at, id"),
+    ("ix_vuln_action_logs_created_at_id", "vuln_action_logs", "created_at, id"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,23 @@
+"""collection_jobs.config (수집 유형별 설정)
+
+Revision ID: 8a1dad269ef6
+Revises: bb6230211cb1
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a1dad269ef6"
+down_revision: Union[str, None] = "bb6230211cb1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE collection_jobs ADD COLUMN IF NOT EXISTS config JSON")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE collection_jobs DROP COLUMN IF EXISTS config")
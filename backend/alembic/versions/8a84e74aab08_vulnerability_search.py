@@ -0,0 +1,56 @@
+"""취약점/사용자 검색 (tsvector 생성 컬럼 + GIN / 트라이그램 인덱스)
+
+- pg_trgm 확장 (트라이그램 인덱스용)
+- vulnerabilities.search_vector: item(A) / content+issue(B) / action_plan(C) 가중치 tsvector (STORED)
+- 검색 GIN 인덱스는 운영 중 잠금을 피하려고 CONCURRENTLY로 생성
+
+STORED 생성 컬럼 추가는 테이블을 다시 쓰므로 그동안 vulnerabilities 쓰기가 막힙니다.
+(이미 컬럼/인덱스가 있으면 건너뜀)
+
+Revision ID: 8a84e74aab08
+Revises: 9c4e1ad5ab5a
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a84e74aab08"
+down_revision: Union[str, None] = "9c4e1ad5ab5a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(item, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(content, '') || ' ' || coalesce(issue, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(action_plan, '')), 'C')"
+)
+
+# (인덱스 이름, 테이블, 정의)
+INDEXES = [
+    ("ix_vulnerabilities_search_vector", "vulnerabilities", "USING gin (search_vector)"),
+    ("ix_vulnerabilities_item_trgm", "vulnerabilities", "USING gin (item gin_trgm_ops)"),
+    ("ix_vulnerabilities_content_trgm", "vulnerabilities", "USING gin (content gin_trgm_ops)"),
+    ("ix_users_name_trgm", "users", "USING gin (name gin_trgm_ops)"),
+    ("ix_users_email_trgm", "users", "USING gin (email gin_trgm_ops)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE vulnerabilities ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        for name, table, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute("ALTER TABLE vulnerabilities DROP COLUMN IF EXISTS search_vector")
+    # pg_trgm은 다른 객체가 쓸 수 있으므로 남겨 둠
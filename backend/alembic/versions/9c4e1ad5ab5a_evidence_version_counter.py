@@ -0,0 +1,75 @@
+"""증빙 버전 카운터 / 최신 파일 포인터 (evidence_types.current_version / current_file_id)
+
+1. evidence_types에 current_version / current_file_id 추가
+2. 동시 업로드로 버전이 겹친 유형은 (version, id) 순서로 버전을 다시 매김 (겹친 유형만)
+3. (evidence_type_id, version DESC) 유니크 인덱스 생성
+4. 기존 파일로 카운터/포인터 백필 (카운터가 0이면 다음 업로드가 버전 1을 받아 유니크 위반)
+
+이미 컬럼이 있는 DB에서도 카운터가 최신 버전보다 작거나 포인터가 비어 있는 유형만 고칩니다.
+
+Revision ID: 9c4e1ad5ab5a
+Revises: e7ecdb97b590
+Create Date: 2026-10-18 13:50:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1ad5ab5a"
+down_revision: Union[str, None] = "e7ecdb97b590"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE evidence_types ADD COLUMN IF NOT EXISTS current_version INTEGER DEFAULT 0 NOT NULL")
+    op.execute("ALTER TABLE evidence_types ADD COLUMN IF NOT EXISTS current_file_id INTEGER")
+    op.execute("""
+        DO $$ BEGIN
+            ALTER TABLE evidence_types ADD CONSTRAINT fk_evidence_types_current_file_id
+                FOREIGN KEY (current_file_id) REFERENCES evidence_files (id) ON DELETE SET NULL;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$
+    """)
+
+    op.execute("""
+        UPDATE evidence_files f
+           SET version = r.new_version
+          FROM (
+                SELECT id, row_number() OVER (PARTITION BY evidence_type_id ORDER BY version, id) AS new_version
+                  FROM evidence_files
+                 WHERE evidence_type_id IN (
+                       SELECT evidence_type_id FROM evidence_files
+                        GROUP BY evidence_type_id, version
+                       HAVING count(*) > 1
+                 )
+          ) r
+         WHERE f.id = r.id AND f.version <> r.new_version
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_evidence_files_type_version "
+            "ON evidence_files (evidence_type_id, version DESC)"
+        )
+
+    op.execute("""
+        UPDATE evidence_types t
+           SET current_version = GREATEST(t.current_version, latest.version),
+               current_file_id = latest.id
+          FROM (
+                SELECT DISTINCT ON (evidence_type_id) evidence_type_id, id, version
+                  FROM evidence_files
+                 ORDER BY evidence_type_id, version DESC, id DESC
+          ) latest
+         WHERE latest.evidence_type_id = t.id
+           AND (t.current_version < latest.version OR t.current_file_id IS NULL)
+    """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_evidence_files_type_version")
+    op.execute("ALTER TABLE evidence_types DROP CONSTRAINT IF EXISTS fk_evidence_types_current_file_id")
+    op.execute("ALTER TABLE evidence_types DROP COLUMN IF EXISTS current_file_id")
+    op.execute("ALTER TABLE evidence_types DROP COLUMN IF EXISTS current_version")
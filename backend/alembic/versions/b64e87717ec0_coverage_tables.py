@@ -0,0 +1,104 @@
+"""증빙 수집 현황 집계 테이블 (control_coverage / framework_coverage)
+
+통제/증빙 유형 FK 인덱스를 추가하고 집계 테이블을 만든 뒤 기존 데이터로 채웁니다.
+(이미 있는 테이블/인덱스는 건너뛰고, 집계는 다시 계산해 덮어씀)
+
+Revision ID: b64e87717ec0
+Revises: 3f2a9c1d7b4e
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b64e87717ec0"
+down_revision: Union[str, None] = "3f2a9c1d7b4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_index("ix_controls_framework_id", "controls", ["framework_id"], if_not_exists=True)
+    op.create_index("ix_evidence_types_control_id", "evidence_types", ["control_id"], if_not_exists=True)
+
+    op.create_table(
+        "control_coverage",
+        sa.Column("control_id", sa.Integer(), nullable=False),
+        sa.Column("framework_id", sa.Integer(), nullable=False),
+        sa.Column("evidence_total", sa.Integer(), nullable=False),
+        sa.Column("evidence_collected", sa.Integer(), nullable=False),
+        sa.Column("last_collected_at", sa.DateTime(timezone=True), nullable=True),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["control_id"], ["controls.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["framework_id"], ["frameworks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("control_id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_control_coverage_framework_id", "control_coverage", ["framework_id"], if_not_exists=True
+    )
+    op.create_table(
+        "framework_coverage",
+        sa.Column("framework_id", sa.Integer(), nullable=False),
+        sa.Column("control_total", sa.Integer(), nullable=False),
+        sa.Column("evidence_total", sa.Integer(), nullable=False),
+        sa.Column("evidence_collected", sa.Integer(), nullable=False),
+        sa.Column("last_collected_at", sa.DateTime(timezone=True), nullable=True),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(["framework_id"], ["frameworks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("framework_id"),
+        if_not_exists=True,
+    )
+
+    # 기존 데이터 집계 (services.coverage_service.rebuild_coverage와 같은 계산)
+    op.execute("""
+        INSERT INTO control_coverage
+            (control_id, framework_id, evidence_total, evidence_collected, last_collected_at)
+        SELECT c.id, c.framework_id,
+               count(t.id),
+               count(t.id) FILTER (WHERE EXISTS (
+                   SELECT 1 FROM evidence_files f WHERE f.evidence_type_id = t.id
+               )),
+               (SELECT max(f.collected_at) FROM evidence_files f
+                  JOIN evidence_types ft ON ft.id = f.evidence_type_id
+                 WHERE ft.control_id = c.id)
+          FROM controls c
+          LEFT JOIN evidence_types t ON t.control_id = c.id
+         GROUP BY c.id
+        ON CONFLICT (control_id) DO UPDATE SET
+            framework_id = excluded.framework_id,
+            evidence_total = excluded.evidence_total,
+            evidence_collected = excluded.evidence_collected,
+            last_collected_at = excluded.last_collected_at,
+            updated_at = now()
+    """)
+    op.execute("""
+        INSERT INTO framework_coverage
+            (framework_id, control_total, evidence_total, evidence_collected, last_collected_at)
+        SELECT framework_id, count(*), sum(evidence_total), sum(evidence_collected), max(last_collected_at)
+          FROM control_coverage
+         GROUP BY framework_id
+        ON CONFLICT (framework_id) DO UPDATE SET
+            control_total = excluded.control_total,
+            evidence_total = excluded.evidence_total,
+            evidence_collected = excluded.evidence_collected,
+            last_collected_at = excluded.last_collected_at,
+            updated_at = now()
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("framework_coverage", if_exists=True)
+    op.drop_index("ix_control_coverage_framework_id", table_name="control_coverage", if_exists=True)
+    op.drop_table("control_coverage", if_exists=True)
+    op.drop_index("ix_evidence_types_control_id", table_name="evidence_types", if_exists=True)
+    op.drop_index("ix_controls_framework_id", table_name="controls", if_exists=True)
@@ -0,0 +1,31 @@
+"""evidence_files.sha256 (내용 주소 저장소 키)
+
+기존 파일은 NULL로 남으며 (이전 경로 그대로 사용) 새로 저장하는 파일부터 채워집니다.
+
+Revision ID: bb6230211cb1
+Revises: 6fb4a59e0b7a
+Create Date: 2026-10-18 13:20:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bb6230211cb1"
+down_revision: Union[str, None] = "6fb4a59e0b7a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE evidence_files ADD COLUMN IF NOT EXISTS sha256 VARCHAR(64)")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_evidence_files_sha256 ON evidence_files (sha256)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_evidence_files_sha256")
+    op.execute("ALTER TABLE evidence_files DROP COLUMN IF EXISTS sha256")
@@ -0,0 +1,30 @@
+"""SLA 점검용 미완료 취약점 기한 부분 인덱스 (ix_vulnerabilities_due_date_open)
+
+운영 중 테이블 잠금을 피하려고 CONCURRENTLY로 만듭니다. (이미 있으면 건너뜀)
+
+Revision ID: c3ca45bb620f
+Revises: 8a84e74aab08
+Create Date: 2026-10-18 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3ca45bb620f"
+down_revision: Union[str, None] = "8a84e74aab08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vulnerabilities_due_date_open "
+            "ON vulnerabilities (due_date) INCLUDE (assignee_id, approver_id) WHERE status <> 'DONE'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vulnerabilities_due_date_open")
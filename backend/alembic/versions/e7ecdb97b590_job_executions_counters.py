@@ -0,0 +1,27 @@
+"""job_executions 처리량 (bytes_processed / lines_processed / lines_matched)
+
+Revision ID: e7ecdb97b590
+Revises: 8a1dad269ef6
+Create Date: 2026-10-18 13:40:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7ecdb97b590"
+down_revision: Union[str, None] = "8a1dad269ef6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["bytes_processed", "lines_processed", "lines_matched"]
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE job_executions ADD COLUMN IF NOT EXISTS {column} BIGINT")
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE job_executions DROP COLUMN IF EXISTS {column}")
@@ -0,0 +1,144 @@
+import os
+import uuid
+from typing import Optional
+import anyio
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.deps import require_admin, require_vuln_access
+from app.core.responses import json_response
+from app.core.user_cache import AuthUser
+from app.schemas.vulnerability import (
+    AssessmentCreate,
+    AssessmentUpdate,
+    AssessmentResponse,
+    AssessmentListResponse,
+    VulnerabilityImportStatus,
+    VulnerabilityImportTask,
+)
+from app.services.assessment_service import AssessmentService
+from app.tasks.vulnerability_import import import_vulnerabilities_excel
+
+router = APIRouter()
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+@router.get("", response_model=AssessmentListResponse)
+async def list_assessments(
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=500),
+    assessment_status: Optional[str] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """점검 목록 조회 (진행 현황 포함)"""
+    service = AssessmentService(db)
+    assessments, total = await service.get_list(page=page, size=size, status=assessment_status)
+    return json_response(AssessmentListResponse, {
+        "items": await service.to_responses(assessments),
+        "total": total,
+    })
+
+
+@router.post("", response_model=AssessmentResponse, status_code=status.HTTP_201_CREATED)
+async def create_assessment(
+    data: AssessmentCreate,
+    db: AsyncSession = Depends(get_db),
+    _: AuthUser = Depends(require_admin),
+):
+    """점검 생성 (관리자 전용)"""
+    service = AssessmentService(db)
+    assessment = await service.create(data)
+    return (await service.to_responses([assessment]))[0]
+
+
+@router.get("/{assessment_id}", response_model=AssessmentResponse)
+async def get_assessment(
+    assessment_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """점검 상세 조회 (진행 현황 포함)"""
+    service = AssessmentService(db)
+    assessment = await service.get_by_id(assessment_id)
+    if assessment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="점검을 찾을 수 없습니다.")
+    return (await service.to_responses([assessment]))[0]
+
+
+@router.patch("/{assessment_id}", response_model=AssessmentResponse)
+async def update_assessment(
+    assessment_id: int,
+    data: AssessmentUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: AuthUser = Depends(require_admin),
+):
+    """점검 정보 수정 (관리자 전용)"""
+    service = AssessmentService(db)
+    assessment = await service.update(assessment_id, data)
+    if assessment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="점검을 찾을 수 없습니다.")
+    return (await service.to_responses([assessment]))[0]
+
+
+@router.post(
+    "/{assessment_id}/import",
+    response_model=VulnerabilityImportTask,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_vulnerabilities(
+    assessment_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    _: AuthUser = Depends(require_admin),
+):
+    """점검 결과 엑셀 일괄 등록 (관리자 전용, 비동기 처리)"""
+    if await AssessmentService(db).get_by_id(assessment_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="점검을 찾을 수 없습니다.")
+    if not (file.filename or "").lower().endswith(".xlsx"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="xlsx 파일만 업로드할 수 있습니다.")
+
+    # 워커가 읽을 수 있도록 공유 스토리지에 청크 단위로 저장
+    import_dir = os.path.join(settings.STORAGE_PATH, "imports")
+    os.makedirs(import_dir, exist_ok=True)
+    file_path = os.path.join(import_dir, f"{uuid.uuid4().hex}.xlsx")
+
+    max_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    written = 0
+    try:
+        # 파일 쓰기는 스레드에서 (큰 엑셀 업로드가 이벤트 루프를 막지 않도록)
+        async with await anyio.open_file(file_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"파일 크기는 {settings.MAX_FILE_SIZE_MB}MB를 초과할 수 없습니다.",
+                    )
+                await out.write(chunk)
+    except BaseException:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+
+    task = import_vulnerabilities_excel.delay(assessment_id, file_path)
+    return VulnerabilityImportTask(task_id=task.id, assessment_id=assessment_id)
+
+
+@router.get("/imports/{task_id}", response_model=VulnerabilityImportStatus)
+async def get_import_status(
+    task_id: str,
+    _: AuthUser = Depends(require_admin),
+):
+    """일괄 등록 진행 현황 조회"""
+    result = AsyncResult(task_id, app=celery_app)
+
+    if result.state == "FAILURE":
+        return VulnerabilityImportStatus(task_id=task_id, state=result.state, detail=str(result.info))
+    if isinstance(result.info, dict):
+        return VulnerabilityImportStatus(task_id=task_id, state=result.state, **result.info)
+    return VulnerabilityImportStatus(task_id=task_id, state=result.state)
@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.deps import get_current_user
-from app.models.user import User
+from app.core.user_cache import AuthUser
 from app.schemas.auth import LoginRequest, TokenResponse
 from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
+from app.services.user_service import UserService
 
 router = APIRouter()
 
@@ -34,7 +35,9 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_user),
 ):
     """현재 로그인한 사용자 정보"""
-    return UserResponse.model_validate(current_user)
+    user = await UserService(db).get_by_id(current_user.id)
+    return UserResponse.model_validate(user)
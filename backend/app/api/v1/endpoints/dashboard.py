@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dashboard_cache import get_snapshot, store_snapshot
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.core.user_cache import AuthUser
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService, dashboard_scope
+
+router = APIRouter()
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    # 무효화 직후 재계산이 복제 지연된 데이터를 새 세대로 캐시하지 않도록 주 DB에서 집계
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(get_current_user),
+):
+    """
+    대시보드 현황 (취약점 상태별/팀별 기한 초과/결재 대기/증빙 수집률)
+    역할·팀 범위별 스냅샷을 Redis에 두고, 캐시 적중 시 저장된 JSON을 그대로 반환합니다.
+    """
+    scope = dashboard_scope(current_user)
+    cached, generation = await get_snapshot(scope)
+    if cached is None:
+        snapshot = await DashboardService(db).build(current_user)
+        cached = snapshot.model_dump_json()
+        await store_snapshot(scope, generation, cached)
+    return Response(content=cached, media_type="application/json")
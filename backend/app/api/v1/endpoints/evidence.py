@@ -0,0 +1,99 @@
+from typing import Optional
+from urllib.parse import quote
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.deps import require_evidence_access
+from app.core.user_cache import AuthUser
+from app.schemas.evidence import EvidenceFileResponse, EvidenceFileWithHistory
+from app.services.evidence_service import EvidenceService
+from app.services.evidence_storage import FileTooLargeError, absolute_path, store_stream
+
+router = APIRouter()
+
+
+@router.post(
+    "/types/{evidence_type_id}/files",
+    response_model=EvidenceFileResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_evidence_file(
+    evidence_type_id: int,
+    request: Request,
+    file_name: str = Query(..., min_length=1, max_length=500),
+    db: AsyncSession = Depends(get_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """증빙 파일 업로드 (요청 본문을 파일 내용 그대로 스트리밍 전송)"""
+    service = EvidenceService(db)
+    if await service.get_type(evidence_type_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="증빙 유형을 찾을 수 없습니다.")
+
+    max_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기는 {settings.MAX_FILE_SIZE_MB}MB를 초과할 수 없습니다.",
+        )
+
+    try:
+        stored = await store_stream(request.stream())
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+
+    evidence_file = await service.add_file(evidence_type_id, file_name, stored)
+    return EvidenceFileResponse.model_validate(evidence_file)
+
+
+@router.get("/types/{evidence_type_id}/files", response_model=EvidenceFileWithHistory)
+async def get_evidence_files(
+    evidence_type_id: int,
+    size: int = Query(20, ge=1, le=100),
+    before_version: Optional[int] = Query(None, ge=1, description="이 버전 미만의 이력 조회 (이전 응답의 next_before_version)"),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """증빙 파일 현재 버전 + 이력 조회"""
+    service = EvidenceService(db)
+    current = await service.get_current(evidence_type_id)
+    if current is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="등록된 증빙 파일이 없습니다.")
+
+    history, next_before_version = await service.get_history(
+        evidence_type_id, before_version or current.version, size,
+    )
+    return EvidenceFileWithHistory(
+        current=EvidenceFileResponse.model_validate(current),
+        history=[EvidenceFileResponse.model_validate(f) for f in history],
+        next_before_version=next_before_version,
+    )
+
+
+@router.get("/files/{file_id}/download")
+async def download_evidence_file(
+    file_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """증빙 파일 다운로드 (Range 요청 지원, nginx 설정 시 X-Accel-Redirect로 위임)"""
+    service = EvidenceService(db)
+    evidence_file = await service.get_file(file_id)
+    if evidence_file is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="증빙 파일을 찾을 수 없습니다.")
+
+    if settings.STORAGE_ACCEL_REDIRECT_PREFIX:
+        prefix = settings.STORAGE_ACCEL_REDIRECT_PREFIX.rstrip("/")
+        return Response(
+            headers={
+                "X-Accel-Redirect": f"{prefix}/{evidence_file.file_path}",
+                "Content-Disposition": f"attachment; filename*=utf-8''{quote(evidence_file.file_name)}",
+            },
+        )
+
+    return FileResponse(
+        absolute_path(evidence_file.file_path),
+        filename=evidence_file.file_name,
+    )
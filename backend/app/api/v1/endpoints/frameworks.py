@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_read_db
+from app.core.deps import require_evidence_access
+from app.core.etag import collection_state, etag_matches, not_modified, read_states, weak_etag, with_etag
+from app.core.responses import json_response
+from app.core.user_cache import AuthUser
+from app.models.coverage import ControlCoverage, FrameworkCoverage
+from app.models.evidence import Control, Framework
+from app.schemas.evidence import FrameworkResponse, ControlResponse
+from app.services.framework_service import FrameworkService
+
+router = APIRouter()
+
+
+@router.get("", response_model=list[FrameworkResponse])
+async def list_frameworks(
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """프레임워크 목록 조회 (증빙 수집 현황 포함)"""
+    etag = weak_etag(request, await read_states(db, collection_state(Framework), collection_state(FrameworkCoverage)))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    service = FrameworkService(db)
+    return with_etag(json_response(list[FrameworkResponse], await service.get_list()), etag)
+
+
+@router.get("/{framework_id}", response_model=FrameworkResponse)
+async def get_framework(
+    framework_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """프레임워크 상세 조회"""
+    service = FrameworkService(db)
+    framework = await service.get_by_id(framework_id)
+    if framework is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프레임워크를 찾을 수 없습니다.")
+    return framework
+
+
+@router.get("/{framework_id}/controls", response_model=list[ControlResponse])
+async def list_controls(
+    framework_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_evidence_access),
+):
+    """통제 항목 목록 조회 (통제별 증빙 수집 현황 포함)"""
+    states = await read_states(
+        db,
+        collection_state(Control, Control.framework_id == framework_id),
+        collection_state(ControlCoverage, ControlCoverage.framework_id == framework_id),
+    )
+    etag = weak_etag(request, states)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    service = FrameworkService(db)
+    return with_etag(json_response(list[ControlResponse], await service.get_controls(framework_id)), etag)
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.deps import authenticate_token, get_stream_user
+from app.core.notifications import PENDING_EVENT_TYPES, clear_pending, notification_hub, take_pending
+from app.core.user_cache import AuthUser
+
+router = APIRouter()
+
+
+def _format(message: dict) -> str:
+    data = json.dumps(message["data"], ensure_ascii=False, default=str)
+    return f"event: {message['type']}\ndata: {data}\n\n"
+
+
+async def _still_allowed(token: str) -> bool:
+    """
+    연결 중인 스트림의 인증 재확인 (토큰 만료, 계정 비활성화, 권한 회수)
+    스트리밍 중에는 요청 세션이 이미 닫혀 있으므로 새 세션으로 (보통은 사용자 캐시 적중)
+    """
+    try:
+        async with async_session() as db:
+            user = await authenticate_token(token, db)
+    except HTTPException:
+        return False
+    return user.permission_vuln
+
+
+@router.get("/stream")
+async def stream_notifications(
+    token: str = Query(...),
+    current_user: AuthUser = Depends(get_stream_user),
+):
+    """
+    알림 스트림 (Server-Sent Events)
+    EventSource('/api/v1/notifications/stream?token=...')로 연결하며,
+    본인이 담당자/결재자인 취약점의 조치 이력·결재 요청 이벤트만 전달됩니다.
+    접속하지 않은 동안 보관된 알림(SLA 요약 등)은 연결 직후 먼저 보냅니다.
+    하트비트마다 인증을 다시 확인해 비활성화된 사용자의 스트림은 닫습니다.
+    """
+    if not current_user.permission_vuln:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="취약점 관리 기능에 대한 접근 권한이 없습니다.",
+        )
+
+    async def event_stream():
+        async with notification_hub.subscribe(current_user.id) as queue:
+            yield "retry: 3000\n\n"
+            # 구독 후에 꺼내야 그 사이 발행된 알림을 놓치지 않음
+            for message in await take_pending(current_user.id):
+                yield _format(message)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=settings.NOTIFICATION_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if not await _still_allowed(token):
+                        return  # 재연결은 인증 단계에서 거절됨
+                    yield ": ping\n\n"  # 프록시 유휴 연결 종료 방지
+                    continue
+                yield _format(message)
+                if message["type"] in PENDING_EVENT_TYPES:
+                    await clear_pending(current_user.id, message["type"])
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,8 +1,12 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.etag import collection_state, etag_matches, not_modified, read_states, weak_etag, with_etag
+from app.core.pagination import CountMode
+from app.core.responses import json_response
 from app.core.deps import get_current_user, require_admin
+from app.core.user_cache import AuthUser
 from app.models.user import User
 from app.schemas.user import (
     UserCreate,
@@ -18,24 +22,42 @@ from app.services.user_service import UserService
 router = APIRouter()
 
 
+async def users_etag(request: Request, db: AsyncSession) -> str:
+    """사용자 목록 ETag - 테이블이 작아 필터와 무관하게 전체 상태로"""
+    return weak_etag(request, await read_states(db, collection_state(User)))
+
+
 @router.get("", response_model=UserListResponse)
 async def list_users(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     role: Optional[str] = Query(None),
     user_status: Optional[str] = Query(None, alias="status"),
     search: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 무시)"),
+    count: CountMode = Query(CountMode.EXACT),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_admin),
 ):
-    """사용자 목록 조회 (관리자 전용)"""
+    """사용자 목록 조회 (관리자 전용, ETag는 count=exact일 때만)"""
+    etag = None
+    if count == CountMode.EXACT:
+        etag = await users_etag(request, db)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
     service = UserService(db)
-    users, total = await service.get_list(
-        page=page, size=size, role=role, status=user_status, search=search
-    )
-    return UserListResponse(
-        items=[UserResponse.model_validate(u) for u in users],
-        total=total,
+    try:
+        users, total, next_cursor = await service.get_list(
+            page=page, size=size, role=role, status=user_status, search=search,
+            cursor=cursor, count_mode=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_etag(
+        json_response(UserListResponse, {"items": users, "total": total, "next_cursor": next_cursor}),
+        etag,
     )
 
 
@@ -43,7 +65,7 @@ async def list_users(
 async def create_user(
     data: UserCreate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    _: AuthUser = Depends(require_admin),
 ):
     """사용자 생성 (관리자 전용)"""
     service = UserService(db)
@@ -56,32 +78,42 @@ async def create_user(
 
 @router.get("/approvers", response_model=list[UserBrief])
 async def list_approvers(
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_user),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(get_current_user),
 ):
     """결재자 목록 조회"""
+    etag = await users_etag(request, db)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     service = UserService(db)
     approvers = await service.get_approvers()
-    return [UserBrief.model_validate(u) for u in approvers]
+    return with_etag(json_response(list[UserBrief], approvers), etag)
 
 
 @router.get("/developers", response_model=list[UserBrief])
 async def list_developers(
+    request: Request,
     team: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(get_current_user),
 ):
     """개발자 목록 조회"""
+    etag = await users_etag(request, db)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     service = UserService(db)
     developers = await service.get_developers(team=team)
-    return [UserBrief.model_validate(u) for u in developers]
+    return with_etag(json_response(list[UserBrief], developers), etag)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_admin),
 ):
     """사용자 상세 조회 (관리자 전용)"""
     service = UserService(db)
@@ -96,7 +128,7 @@ async def update_user(
     user_id: int,
     data: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    _: AuthUser = Depends(require_admin),
 ):
     """사용자 정보 수정 (관리자 전용)"""
     service = UserService(db)
@@ -110,7 +142,7 @@ async def update_user(
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_admin),
+    _: AuthUser = Depends(require_admin),
 ):
     """사용자 비활성화 (관리자 전용)"""
     service = UserService(db)
@@ -124,7 +156,7 @@ async def delete_user(
 async def change_my_password(
     data: UserPasswordUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthUser = Depends(get_current_user),
 ):
     """내 비밀번호 변경"""
     service = UserService(db)
@@ -0,0 +1,321 @@
+import os
+import uuid
+from typing import Optional
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import get_db, get_read_db, sync_read_session
+from app.core.deps import (
+    require_admin,
+    require_approver_or_admin,
+    require_evidence_access,
+    require_vuln_access,
+)
+from app.core.etag import collection_state, etag_matches, not_modified, read_states, weak_etag, with_etag
+from app.core.pagination import CountMode
+from app.core.responses import json_response
+from app.core.user_cache import AuthUser
+from app.models.user import User
+from app.models.vulnerability import ApprovalStatus, Vulnerability, VulnStatus
+from app.schemas.vulnerability import (
+    VulnerabilityResponse,
+    VulnerabilityListResponse,
+    VulnerabilitySearchResponse,
+    VulnActionLogListResponse,
+    ApprovalRequestResponse,
+    VulnerabilityExportStatus,
+    VulnerabilityExportTask,
+    VulnerabilityBulkAssign,
+    VulnerabilityBulkSchedule,
+    VulnerabilityBulkApproval,
+    VulnerabilityBulkResult,
+    VulnerabilityTransitionResponse,
+)
+from app.services.evidence_service import EvidenceService
+from app.services.vulnerability_export_service import VulnerabilityExportService, export_file_name
+from app.services.vulnerability_service import VulnerabilityService, vuln_list_filters
+from app.services.vulnerability_workflow import (
+    TransitionResult,
+    VulnerabilityWorkflow,
+    WorkflowAction,
+    WorkflowError,
+)
+from app.tasks.vulnerability_export import export_vulnerabilities_excel
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+router = APIRouter()
+
+
+@router.get("", response_model=VulnerabilityListResponse)
+async def list_vulnerabilities(
+    request: Request,
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=500),
+    assessment_id: Optional[int] = Query(None),
+    vuln_status: Optional[str] = Query(None, alias="status"),
+    assignee_id: Optional[int] = Query(None),
+    approver_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 page 무시)"),
+    count: CountMode = Query(CountMode.EXACT),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """
+    취약점 목록 조회
+    count=exact면 ETag(필터 대상 + 담당자/결재자 정보)를 붙이고, 그 집계의 건수를 총 건수로 씁니다.
+    """
+    etag = total = None
+    if count == CountMode.EXACT:
+        states = await read_states(
+            db,
+            collection_state(Vulnerability, *vuln_list_filters(assessment_id, vuln_status, assignee_id, approver_id)),
+            collection_state(User),
+        )
+        etag = weak_etag(request, states)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        total = states[0][0]
+
+    service = VulnerabilityService(db)
+    try:
+        vulns, total, next_cursor = await service.get_list(
+            page=page, size=size, assessment_id=assessment_id, status=vuln_status,
+            assignee_id=assignee_id, approver_id=approver_id,
+            cursor=cursor, count_mode=count, total=total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_etag(json_response(VulnerabilityListResponse, {
+        "items": [service.response_data(v) for v in vulns],
+        "total": total,
+        "next_cursor": next_cursor,
+    }), etag)
+
+
+@router.get("/search", response_model=VulnerabilitySearchResponse)
+async def search_vulnerabilities(
+    q: str = Query(..., min_length=1, max_length=200),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    assessment_id: Optional[int] = Query(None),
+    vuln_status: Optional[str] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """취약점 검색 (항목/내용/문제점/조치 계획, 관련도순 + 일치 부분 하이라이트)"""
+    service = VulnerabilityService(db)
+    hits, next_page = await service.search(
+        q, page=page, size=size, assessment_id=assessment_id, status=vuln_status,
+    )
+    return json_response(VulnerabilitySearchResponse, {
+        "items": [service.search_hit_data(*hit) for hit in hits],
+        "next_page": next_page,
+    })
+
+
+def _export_to_file(assessment_id: Optional[int], vuln_status: Optional[str]) -> str:
+    tmp_dir = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    out_path = os.path.join(tmp_dir, f"export_{uuid.uuid4().hex}.xlsx")
+    try:
+        with sync_read_session() as session:
+            VulnerabilityExportService(session).export_workbook(out_path, assessment_id, vuln_status)
+    except BaseException:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
+    return out_path
+
+
+@router.get("/export")
+async def export_vulnerabilities(
+    assessment_id: Optional[int] = Query(None),
+    vuln_status: Optional[str] = Query(None, alias="status"),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """취약점 관리대장 엑셀 다운로드 (xlsx는 zip 형식이라 임시 파일로 완성한 뒤 전송)"""
+    out_path = await run_in_threadpool(_export_to_file, assessment_id, vuln_status)
+    return FileResponse(
+        out_path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename=export_file_name(assessment_id),
+        background=BackgroundTask(os.remove, out_path),
+    )
+
+
+@router.post(
+    "/export/tasks",
+    response_model=VulnerabilityExportTask,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_export_task(
+    evidence_type_id: int = Query(..., description="결과를 등록할 증빙 유형"),
+    assessment_id: Optional[int] = Query(None),
+    vuln_status: Optional[str] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_db),
+    _: AuthUser = Depends(require_vuln_access),
+    __: AuthUser = Depends(require_evidence_access),
+):
+    """대용량 관리대장 내보내기 (워커에서 생성 후 증빙 파일로 등록)"""
+    if await EvidenceService(db).get_type(evidence_type_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="증빙 유형을 찾을 수 없습니다.")
+    task = export_vulnerabilities_excel.delay(evidence_type_id, assessment_id, vuln_status)
+    return VulnerabilityExportTask(task_id=task.id)
+
+
+@router.get("/export/tasks/{task_id}", response_model=VulnerabilityExportStatus)
+async def get_export_status(
+    task_id: str,
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """관리대장 내보내기 진행 현황 조회 (완료 시 evidence_file_id로 다운로드)"""
+    result = AsyncResult(task_id, app=celery_app)
+
+    if result.state == "FAILURE":
+        return VulnerabilityExportStatus(task_id=task_id, state=result.state, detail=str(result.info))
+    if isinstance(result.info, dict):
+        return VulnerabilityExportStatus(task_id=task_id, state=result.state, **result.info)
+    return VulnerabilityExportStatus(task_id=task_id, state=result.state)
+
+
+# ========================================
+# 조치 워크플로 (일괄 상태 전이)
+# ========================================
+async def _transition(db: AsyncSession, action: WorkflowAction, user: AuthUser, data, **kwargs):
+    try:
+        result: TransitionResult = await VulnerabilityWorkflow(db).apply(
+            action,
+            user,
+            vulnerability_ids=data.vulnerability_ids,
+            assessment_id=data.assessment_id,
+            comment=data.comment,
+            **kwargs,
+        )
+    except WorkflowError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return VulnerabilityTransitionResponse(
+        action=result.action.value,
+        updated=len(result.updated_ids),
+        updated_ids=result.updated_ids,
+        skipped_ids=result.skipped_ids,
+    )
+
+
+@router.post("/assign", response_model=VulnerabilityTransitionResponse)
+async def assign_vulnerabilities(
+    data: VulnerabilityBulkAssign,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(require_admin),
+):
+    """담당자 일괄 지정 (관리자 전용)"""
+    return await _transition(
+        db, WorkflowAction.ASSIGN, current_user, data,
+        values={"assignee_id": data.assignee_id},
+    )
+
+
+@router.post("/schedule", response_model=VulnerabilityTransitionResponse)
+async def schedule_vulnerabilities(
+    data: VulnerabilityBulkSchedule,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(require_vuln_access),
+):
+    """조치 일정 등록 및 결재 요청 (담당자 본인 건)"""
+    return await _transition(
+        db, WorkflowAction.SCHEDULE, current_user, data,
+        values={"due_date": data.due_date, "approver_id": data.approver_id, "action_plan": data.action_plan},
+    )
+
+
+@router.post("/approval", response_model=VulnerabilityTransitionResponse)
+async def decide_approvals(
+    data: VulnerabilityBulkApproval,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(require_approver_or_admin),
+):
+    """결재 일괄 승인/반려 (결재자 본인 건, 대상 생략 시 대기 중인 전체)"""
+    if data.action == ApprovalStatus.APPROVED:
+        return await _transition(db, WorkflowAction.APPROVE, current_user, data)
+    if data.action == ApprovalStatus.REJECTED:
+        if not data.reject_reason:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="반려 사유를 입력해야 합니다.")
+        return await _transition(
+            db, WorkflowAction.REJECT, current_user, data, reject_reason=data.reject_reason,
+        )
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="승인 또는 반려만 선택할 수 있습니다.")
+
+
+@router.post("/result", response_model=VulnerabilityTransitionResponse)
+async def submit_action_results(
+    data: VulnerabilityBulkResult,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthUser = Depends(require_vuln_access),
+):
+    """조치 결과 제출 (done: 완료 처리, in_progress: 중간 보고)"""
+    if data.status == VulnStatus.DONE:
+        action = WorkflowAction.COMPLETE
+    elif data.status == VulnStatus.IN_PROGRESS:
+        action = WorkflowAction.START
+    else:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="완료 또는 조치중 상태만 제출할 수 있습니다.")
+    return await _transition(
+        db, action, current_user, data,
+        values={"action_result": data.action_result},
+        attachment_path=data.attachment_path,
+    )
+
+
+@router.get("/{vuln_id}", response_model=VulnerabilityResponse)
+async def get_vulnerability(
+    vuln_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """취약점 상세 조회"""
+    service = VulnerabilityService(db)
+    vuln = await service.get_by_id(vuln_id)
+    if vuln is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="취약점을 찾을 수 없습니다.")
+    return service.to_response(vuln)
+
+
+@router.get("/{vuln_id}/logs", response_model=VulnActionLogListResponse)
+async def list_action_logs(
+    vuln_id: int,
+    size: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.NONE),
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """취약점 조치 이력 조회"""
+    service = VulnerabilityService(db)
+    try:
+        logs, total, next_cursor = await service.get_action_logs(
+            vuln_id, size=size, cursor=cursor, count_mode=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return json_response(VulnActionLogListResponse, {
+        "items": [service.log_data(log) for log in logs],
+        "total": total,
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/{vuln_id}/approvals", response_model=list[ApprovalRequestResponse])
+async def list_approval_requests(
+    vuln_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    _: AuthUser = Depends(require_vuln_access),
+):
+    """취약점 결재 요청 이력 조회"""
+    service = VulnerabilityService(db)
+    requests = await service.get_approval_requests(vuln_id)
+    return json_response(list[ApprovalRequestResponse], [service.approval_data(r) for r in requests])
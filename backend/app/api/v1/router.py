@@ -1,11 +1,21 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users
+from app.api.v1.endpoints import auth, users, assessments, frameworks, evidence, vulnerabilities, notifications, dashboard
 
 api_router = APIRouter()
 
 # Phase 1: 인증 / 사용자
 api_router.include_router(auth.router, prefix="/auth", tags=["인증"])
 api_router.include_router(users.router, prefix="/users", tags=["사용자"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["대시보드"])
+
+# 증빙 수집
+api_router.include_router(frameworks.router, prefix="/frameworks", tags=["프레임워크"])
+api_router.include_router(evidence.router, prefix="/evidence", tags=["증빙"])
+
+# 취약점 관리
+api_router.include_router(assessments.router, prefix="/assessments", tags=["점검"])
+api_router.include_router(vulnerabilities.router, prefix="/vulnerabilities", tags=["취약점"])
+api_router.include_router(notifications.router, prefix="/notifications", tags=["알림"])
 
 
 @api_router.get("/")
@@ -0,0 +1,17 @@
+# 수집 유형별 수집기를 등록합니다 (JobType → Collector)
+from app.collectors.base import (
+    COLLECTORS,
+    CollectionError,
+    get_collector,
+    register_collector,
+    register_evidence,
+    resolve_sources,
+    save_evidence,
+)
+from app.collectors import excel_extract, log_extract, web_scraping  # noqa: F401
+
+__all__ = [
+    "COLLECTORS", "CollectionError",
+    "get_collector", "register_collector", "register_evidence",
+    "resolve_sources", "save_evidence",
+]
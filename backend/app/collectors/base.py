@@ -0,0 +1,86 @@
+import glob
+import os
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from app.models.evidence import (
+    CollectionJob,
+    CollectionMethod,
+    EvidenceFile,
+    JobExecution,
+    JobType,
+)
+from app.core.config import settings
+from app.services.evidence_service import register_file
+from app.services.evidence_storage import StoredObject, store_file
+
+
+class CollectionError(Exception):
+    """수집 실패 (JobExecution.error_message에 기록)"""
+
+    def __init__(self, message: str, trace_file_path: Optional[str] = None):
+        super().__init__(message)
+        self.trace_file_path = trace_file_path  # 실패 시점 추적 파일 (저장소 상대 경로)
+
+
+# 수집기: (작업, 실행 기록, 세션) → 증빙 파일 등록까지 수행
+Collector = Callable[[CollectionJob, JobExecution, Session], None]
+
+COLLECTORS: dict[JobType, Collector] = {}
+
+
+def register_collector(job_type: JobType) -> Callable[[Collector], Collector]:
+    def decorator(func: Collector) -> Collector:
+        COLLECTORS[job_type] = func
+        return func
+    return decorator
+
+
+def get_collector(job_type: JobType) -> Collector:
+    collector = COLLECTORS.get(job_type)
+    if collector is None:
+        raise CollectionError(f"지원하지 않는 수집 유형입니다: {job_type.value}")
+    return collector
+
+
+def resolve_sources(patterns: list[str]) -> list[str]:
+    """config의 원본 경로(glob 패턴)를 COLLECTION_SOURCE_PATH 안의 파일 목록으로 변환"""
+    root = os.path.realpath(settings.COLLECTION_SOURCE_PATH)
+    paths: set[str] = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(root, pattern), recursive=True):
+            real = os.path.realpath(path)
+            if os.path.commonpath([root, real]) != root:
+                raise CollectionError(f"허용되지 않은 원본 경로입니다: {pattern}")
+            if os.path.isfile(real):
+                paths.add(real)
+    if not paths:
+        raise CollectionError("수집할 원본 파일이 없습니다.")
+    return sorted(paths)
+
+
+def save_evidence(
+    session: Session,
+    job: CollectionJob,
+    execution: JobExecution,
+    src_path: str,
+    file_name: str,
+) -> EvidenceFile:
+    """수집 결과 파일을 저장소에 보관하고 새 버전의 증빙 파일로 등록"""
+    if job.evidence_type_id is None:
+        raise CollectionError("수집 작업에 증빙 유형이 지정되지 않았습니다.")
+    return register_evidence(session, job, execution, store_file(src_path), file_name)
+
+
+def register_evidence(
+    session: Session,
+    job: CollectionJob,
+    execution: JobExecution,
+    stored: StoredObject,
+    file_name: str,
+) -> EvidenceFile:
+    """이미 저장소에 기록된 객체를 새 버전의 증빙 파일로 등록 (커밋은 호출 측)"""
+    if job.evidence_type_id is None:
+        raise CollectionError("수집 작업에 증빙 유형이 지정되지 않았습니다.")
+    return register_file(
+        session, job.evidence_type_id, file_name, stored, CollectionMethod.AUTO, execution.id,
+    )
@@ -0,0 +1,135 @@
+"""
+엑셀 추출 수집기 (JobType.EXCEL_EXTRACT)
+
+job.config 예시:
+    {
+        "sources": ["access_review/2025Q1/*.xlsx"],   # COLLECTION_SOURCE_PATH 기준 glob
+        "sheets": ["권한목록"],                         # 생략 시 모든 시트
+        "columns": ["사번", "성명", "권한"],             # 생략 시 모든 열
+        "header_row": 1,
+        "output_name": "접근권한_검토.xlsx"
+    }
+
+원본 파일은 프로세스 풀에서 파일 단위로 병렬 추출하고(read-only 모드),
+결과는 부모 프로세스에서 write-only 통합 시트 하나로 합친 뒤 증빙 파일로 등록합니다.
+"""
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Optional
+from billiard import Pool
+from openpyxl import Workbook, load_workbook
+from sqlalchemy.orm import Session
+from app.collectors.base import CollectionError, register_collector, resolve_sources, save_evidence
+from app.core.config import settings
+from app.models.evidence import CollectionJob, JobExecution, JobType
+
+# 통합 결과 앞쪽에 붙는 출처 열
+SOURCE_COLUMNS = ["원본 파일", "시트"]
+
+
+def _cell_text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _extract_workbook(args: tuple) -> tuple[str, Optional[str], list[str], Optional[str]]:
+    """
+    워커 프로세스: 원본 1개에서 지정 시트/열을 추출해 부분 파일(pickle 스트림)로 기록
+    반환: (원본 경로, 부분 파일 경로, 첫 시트 헤더, 오류 메시지)
+    """
+    src_path, part_path, sheets, columns, header_row = args
+    first_header: list[str] = []
+    try:
+        wb = load_workbook(src_path, read_only=True, data_only=True)
+        try:
+            targets = [ws for ws in wb.worksheets if not sheets or ws.title in sheets]
+            with open(part_path, "wb") as out:
+                for ws in targets:
+                    row_iter = ws.iter_rows(min_row=header_row, values_only=True)
+                    header = next(row_iter, None)
+                    if header is None:
+                        continue
+                    names = [_cell_text(v) for v in header]
+                    first_header = first_header or list(columns or names)
+                    if columns:
+                        index = {name: i for i, name in enumerate(names) if name}
+                        picks = [index.get(name) for name in columns]
+                    else:
+                        picks = list(range(len(names)))
+
+                    for values in row_iter:
+                        if not values or all(v is None for v in values):
+                            continue
+                        record = [
+                            values[i] if i is not None and i < len(values) else None
+                            for i in picks
+                        ]
+                        pickle.dump((ws.title, record), out, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            wb.close()
+    except Exception as e:
+        return src_path, None, [], f"{e.__class__.__name__}: {e}"
+    return src_path, part_path, first_header, None
+
+
+def _read_part(part_path: str):
+    with open(part_path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+@register_collector(JobType.EXCEL_EXTRACT)
+def collect_excel_extract(job: CollectionJob, execution: JobExecution, session: Session) -> None:
+    config = job.config or {}
+    sources = resolve_sources(config.get("sources") or [])
+    sheets = config.get("sheets") or None
+    columns = config.get("columns") or None
+    header_row = int(config.get("header_row") or 1)
+
+    root = os.path.realpath(settings.COLLECTION_SOURCE_PATH)
+    tmp_root = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_root, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="excel_extract_", dir=tmp_root)
+
+    try:
+        tasks = [
+            (src, os.path.join(work_dir, f"{i}.part"), sheets, columns, header_row)
+            for i, src in enumerate(sources)
+        ]
+        processes = max(1, min(settings.EXCEL_EXTRACT_WORKERS, len(tasks)))
+        with Pool(processes=processes) as pool:
+            results = sorted(pool.imap_unordered(_extract_workbook, tasks))
+
+        failures = [(src, error) for src, _, _, error in results if error]
+        if len(failures) == len(results):
+            raise CollectionError(f"모든 원본 파일 추출에 실패했습니다: {failures[0][1]}")
+
+        # 열 미지정 시 첫 번째 원본의 헤더를 통합 헤더로 사용
+        header = list(columns) if columns else next((h for _, _, h, e in results if not e and h), [])
+
+        out_path = os.path.join(work_dir, "result.xlsx")
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("추출 결과")
+        ws.append(SOURCE_COLUMNS + header)
+        for src, part_path, _, error in results:
+            if error:
+                continue
+            relative = os.path.relpath(src, root)
+            for sheet_title, record in _read_part(part_path):
+                ws.append([relative, sheet_title, *record])
+        wb.save(out_path)
+
+        file_name = config.get("output_name") or f"{job.name}_{datetime.now():%Y%m%d}.xlsx"
+        save_evidence(session, job, execution, out_path, file_name)
+
+        if failures:
+            execution.error_message = "\n".join(
+                f"{os.path.relpath(src, root)}: {error}" for src, error in failures
+            )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
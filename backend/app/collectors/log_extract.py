@@ -0,0 +1,191 @@
+"""
+로그 추출 수집기 (JobType.LOG_EXTRACT)
+
+job.config 예시:
+    {
+        "sources": ["fw/2025-*/*.log", "fw/archive/*.log.gz"],  # COLLECTION_SOURCE_PATH 기준 glob
+        "include": ["DENY", "action=drop"],     # 하나라도 일치하는 줄만 (정규식, 생략 시 전체)
+        "exclude": ["healthcheck"],             # 일치하면 제외 (정규식)
+        "time_pattern": "^(?P<ts>\\\\S+ \\\\S+)",   # 시각 추출 정규식 (ts 그룹, 생략 시 ISO 형식 탐색)
+        "time_format": "%Y-%m-%d %H:%M:%S",     # 생략 시 ISO 8601 파싱
+        "window_hours": 24,                     # 또는 "since"/"until" (ISO 문자열)
+        "output_name": "방화벽_차단로그.log.gz"
+    }
+
+파일은 mmap(일반 파일) 또는 스트림(.gz)으로 한 줄씩 읽고, 조건에 맞는 줄만
+gzip 출력에 바로 기록합니다. 파일 전체를 메모리에 올리지 않습니다.
+"""
+import gzip
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+from sqlalchemy.orm import Session
+from app.collectors.base import CollectionError, register_collector, resolve_sources, save_evidence
+from app.core.config import settings
+from app.models.evidence import CollectionJob, JobExecution, JobType
+
+DEFAULT_TIME_PATTERN = rb"(?P<ts>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)"
+
+
+@dataclass
+class ExtractCounters:
+    bytes_processed: int = 0
+    lines_processed: int = 0
+    lines_matched: int = 0
+
+
+@dataclass
+class TimeWindow:
+    pattern: re.Pattern
+    time_format: Optional[str]
+    since: Optional[datetime]
+    until: Optional[datetime]
+
+    def parse(self, line: bytes) -> Optional[datetime]:
+        match = self.pattern.search(line)
+        if match is None:
+            return None
+        raw = match.group("ts").decode("ascii", "replace")
+        try:
+            if self.time_format:
+                ts = datetime.strptime(raw, self.time_format)
+            else:
+                ts = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        # 시간대가 있는 값은 로컬 시각으로 맞춰 비교
+        return ts.astimezone().replace(tzinfo=None) if ts.tzinfo else ts
+
+    def contains(self, line: bytes) -> bool:
+        ts = self.parse(line)
+        if ts is None:
+            return False
+        if self.since is not None and ts < self.since:
+            return False
+        if self.until is not None and ts >= self.until:
+            return False
+        return True
+
+
+# ========================================
+# 파이프라인 단계 (제너레이터)
+# ========================================
+@contextmanager
+def _open_lines(path: str) -> Iterator[Iterable[bytes]]:
+    """일반 파일은 mmap, .gz는 버퍼 스트림으로 줄 단위 순회"""
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as raw:
+            yield iter(lambda: raw.readline(), b"")
+        return
+
+    with open(path, "rb", buffering=settings.LOG_EXTRACT_CHUNK_BYTES) as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield iter(())
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield iter(mm.readline, b"")
+
+
+def _count(lines: Iterable[bytes], counters: ExtractCounters) -> Iterator[bytes]:
+    for line in lines:
+        counters.bytes_processed += len(line)
+        counters.lines_processed += 1
+        yield line
+
+
+def _filter(
+    lines: Iterable[bytes],
+    include: Optional[re.Pattern],
+    exclude: Optional[re.Pattern],
+    window: Optional[TimeWindow],
+) -> Iterator[bytes]:
+    for line in lines:
+        if include is not None and include.search(line) is None:
+            continue
+        if exclude is not None and exclude.search(line) is not None:
+            continue
+        if window is not None and not window.contains(line):
+            continue
+        yield line
+
+
+# ========================================
+# 설정 해석
+# ========================================
+def _compile_any(patterns: Optional[list[str]], field: str) -> Optional[re.Pattern]:
+    """여러 정규식을 하나의 alternation으로 컴파일 (줄당 검색 1회)"""
+    if not patterns:
+        return None
+    try:
+        return re.compile(b"|".join(b"(?:" + p.encode() + b")" for p in patterns))
+    except re.error as e:
+        raise CollectionError(f"{field} 정규식이 올바르지 않습니다: {e}")
+
+
+def _parse_bound(value: Optional[str], field: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        raise CollectionError(f"{field} 시각 형식이 올바르지 않습니다: {value}")
+    return ts.astimezone().replace(tzinfo=None) if ts.tzinfo else ts
+
+
+def _build_window(config: dict) -> Optional[TimeWindow]:
+    since = _parse_bound(config.get("since"), "since")
+    until = _parse_bound(config.get("until"), "until")
+    if config.get("window_hours"):
+        until = until or datetime.now()
+        since = until - timedelta(hours=float(config["window_hours"]))
+    if since is None and until is None:
+        return None
+
+    time_pattern = config.get("time_pattern")
+    try:
+        pattern = re.compile(time_pattern.encode() if time_pattern else DEFAULT_TIME_PATTERN)
+    except re.error as e:
+        raise CollectionError(f"time_pattern 정규식이 올바르지 않습니다: {e}")
+    if "ts" not in pattern.groupindex:
+        raise CollectionError("time_pattern에는 (?P<ts>...) 그룹이 필요합니다.")
+    return TimeWindow(pattern, config.get("time_format"), since, until)
+
+
+@register_collector(JobType.LOG_EXTRACT)
+def collect_log_extract(job: CollectionJob, execution: JobExecution, session: Session) -> None:
+    config = job.config or {}
+    sources = resolve_sources(config.get("sources") or [])
+    include = _compile_any(config.get("include"), "include")
+    exclude = _compile_any(config.get("exclude"), "exclude")
+    window = _build_window(config)
+
+    root = os.path.realpath(settings.COLLECTION_SOURCE_PATH)
+    tmp_dir = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    out_path = os.path.join(tmp_dir, f"log_extract_{execution.id}.log.gz")
+    counters = ExtractCounters()
+
+    try:
+        with gzip.open(out_path, "wb", compresslevel=settings.LOG_EXTRACT_COMPRESS_LEVEL) as out:
+            for src in sources:
+                out.write(f"# ==> {os.path.relpath(src, root)} <==\n".encode())
+                with _open_lines(src) as lines:
+                    for line in _filter(_count(lines, counters), include, exclude, window):
+                        out.write(line if line.endswith(b"\n") else line + b"\n")
+                        counters.lines_matched += 1
+
+        execution.bytes_processed = counters.bytes_processed
+        execution.lines_processed = counters.lines_processed
+        execution.lines_matched = counters.lines_matched
+
+        file_name = config.get("output_name") or f"{job.name}_{datetime.now():%Y%m%d}.log.gz"
+        save_evidence(session, job, execution, out_path, file_name)
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
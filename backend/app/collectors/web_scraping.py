@@ -0,0 +1,206 @@
+"""
+웹 화면 수집기 (JobType.WEB_SCRAPING)
+
+job.config 예시:
+    {
+        "targets": [
+            {"url": "https://admin.example.com/users", "capture": "screenshot", "wait_for": "#grid"},
+            {"url": "https://admin.example.com/policy", "capture": "pdf", "file_name": "정책.pdf"}
+        ],
+        "viewport": {"width": 1920, "height": 1080},
+        "ignore_https_errors": false
+    }
+
+- 브라우저는 워커 프로세스당 하나를 띄워 재사용하고, 작업마다 격리된 컨텍스트를 만듭니다.
+- 대상 호스트별 동시 접속 수는 Redis sorted set(보유자별 만료 시각)으로 전체 워커에 걸쳐 제한합니다.
+- 캡처 결과는 디스크를 거치지 않고 바로 증빙 저장소에 기록합니다.
+- Playwright 추적(trace)은 실패한 경우에만 저장합니다.
+"""
+import logging
+import os
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+from celery.signals import worker_process_shutdown
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+from sqlalchemy.orm import Session
+from app.collectors.base import CollectionError, register_collector, register_evidence
+from app.core.config import settings
+from app.core.redis import get_sync_redis, try_acquire_slot
+from app.models.evidence import CollectionJob, JobExecution, JobType
+from app.services.evidence_storage import StoredObject, store_bytes, store_file
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_EXTENSIONS = {"screenshot": "png", "pdf": "pdf"}
+
+
+# ========================================
+# 브라우저 풀 (워커 프로세스당 1개)
+# ========================================
+class BrowserPool:
+    def __init__(self):
+        self._pid: Optional[int] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._jobs = 0
+
+    def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        launcher = getattr(self._playwright, settings.WEB_SCRAPING_BROWSER)
+        self._browser = launcher.launch(headless=True)
+        self._jobs = 0
+        logger.info("브라우저 시작 (pid=%s, %s)", os.getpid(), settings.WEB_SCRAPING_BROWSER)
+        return self._browser
+
+    def browser(self) -> Browser:
+        if self._pid != os.getpid():
+            # fork로 물려받은 상태는 부모 프로세스 소유이므로 버리고 새로 시작
+            self._pid = os.getpid()
+            self._playwright = None
+            self._browser = None
+
+        browser = self._browser
+        if browser is None or not browser.is_connected():
+            return self._launch()
+        if self._jobs >= settings.WEB_SCRAPING_BROWSER_MAX_JOBS:
+            browser.close()
+            return self._launch()
+        return browser
+
+    @contextmanager
+    def context(self, **options) -> Iterator[BrowserContext]:
+        context = self.browser().new_context(**options)
+        self._jobs += 1
+        try:
+            yield context
+        finally:
+            context.close()
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            return
+        try:
+            if self._browser is not None and self._browser.is_connected():
+                self._browser.close()
+            if self._playwright is not None:
+                self._playwright.stop()
+        finally:
+            self._browser = None
+            self._playwright = None
+
+
+browser_pool = BrowserPool()
+
+
+@worker_process_shutdown.connect
+def _close_browser_pool(**kwargs) -> None:
+    browser_pool.close()
+
+
+# ========================================
+# 호스트별 동시 접속 제한
+# ========================================
+@contextmanager
+def host_slot(host: str) -> Iterator[None]:
+    """
+    대상 호스트 동시 접속 슬롯 확보 (한도 초과 시 대기)
+    슬롯은 보유자별로 만료 시각을 점수로 둔 sorted set 항목이라,
+    워커가 비정상 종료해 반납하지 못한 슬롯도 COLLECTION_JOB_TIMEOUT_SECONDS 뒤에는 다른 시도가 정리합니다.
+    """
+    redis = get_sync_redis()
+    key = f"secuhub:scraping:host:{host}"
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + settings.WEB_SCRAPING_HOST_WAIT_SECONDS
+    while True:
+        if try_acquire_slot(
+            redis, key, token, settings.WEB_SCRAPING_HOST_CONCURRENCY, settings.COLLECTION_JOB_TIMEOUT_SECONDS
+        ):
+            break
+        if time.monotonic() >= deadline:
+            raise CollectionError(f"대상 호스트 동시 접속 대기 시간을 초과했습니다: {host}")
+        time.sleep(0.5 + random.random())
+    try:
+        yield
+    finally:
+        redis.zrem(key, token)
+
+
+# ========================================
+# 수집기
+# ========================================
+def _save_trace(context: BrowserContext, execution: JobExecution) -> Optional[str]:
+    """실패한 실행의 추적 파일을 저장소에 보관 (추적 저장 실패가 원래 오류를 가리지 않도록)"""
+    tmp_dir = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, f"trace_{execution.id}.zip")
+    try:
+        context.tracing.stop(path=tmp_path)
+        return store_file(tmp_path).path
+    except Exception:
+        logger.exception("실행 %s 추적 파일 저장 실패", execution.id)
+        return None
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _capture(context: BrowserContext, target: dict) -> bytes:
+    page = context.new_page()
+    try:
+        page.goto(target["url"], wait_until=target.get("wait_until", "networkidle"))
+        if target.get("wait_for"):
+            page.wait_for_selector(target["wait_for"])
+        if target.get("capture", "screenshot") == "pdf":
+            return page.pdf(format="A4", print_background=True)
+        return page.screenshot(full_page=target.get("full_page", True))
+    finally:
+        page.close()
+
+
+@register_collector(JobType.WEB_SCRAPING)
+def collect_web_scraping(job: CollectionJob, execution: JobExecution, session: Session) -> None:
+    config = job.config or {}
+    targets = config.get("targets") or []
+    if not targets:
+        raise CollectionError("수집 대상 URL이 없습니다.")
+    for target in targets:
+        if not urlsplit(target.get("url", "")).hostname:
+            raise CollectionError(f"URL 형식이 올바르지 않습니다: {target.get('url')}")
+        if target.get("capture", "screenshot") not in CAPTURE_EXTENSIONS:
+            raise CollectionError(f"지원하지 않는 캡처 형식입니다: {target.get('capture')}")
+
+    options = {
+        "viewport": config.get("viewport") or {"width": 1920, "height": 1080},
+        "ignore_https_errors": bool(config.get("ignore_https_errors")),
+        "locale": "ko-KR",
+    }
+    today = f"{datetime.now():%Y%m%d}"
+
+    with browser_pool.context(**options) as context:
+        context.set_default_timeout(settings.WEB_SCRAPING_TIMEOUT_MS)
+        context.tracing.start(screenshots=True, snapshots=True)
+        captured: list[tuple[StoredObject, str]] = []
+        current = None
+        try:
+            for index, target in enumerate(targets, start=1):
+                current = target["url"]
+                with host_slot(urlsplit(current).hostname):
+                    data = _capture(context, target)
+
+                extension = CAPTURE_EXTENSIONS[target.get("capture", "screenshot")]
+                file_name = target.get("file_name") or f"{job.name}_{index}_{today}.{extension}"
+                captured.append((store_bytes(data), file_name))
+        except Exception as e:
+            trace_path = _save_trace(context, execution)
+            raise CollectionError(f"{current}: {e}", trace_file_path=trace_path) from e
+
+        context.tracing.stop()  # 성공 시 추적 데이터는 버림
+
+    for stored, file_name in captured:
+        register_evidence(session, job, execution, stored, file_name)
@@ -1,10 +1,17 @@
 from celery import Celery
+from celery.schedules import crontab
 from app.core.config import settings
 
 celery_app = Celery(
     "secuhub",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
+    include=[
+        "app.tasks.vulnerability_import",
+        "app.tasks.vulnerability_export",
+        "app.tasks.collection",
+        "app.tasks.sla",
+    ],
 )
 
 celery_app.conf.update(
@@ -16,7 +23,18 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    # 증빙 수집은 별도 큐로 분리 (일괄 등록/내보내기와 경쟁하지 않도록)
+    task_routes={
+        "collection.*": {"queue": "collection"},
+    },
+    # CollectionJob.schedule_cron 기반 동적 스케줄러
+    beat_scheduler="app.tasks.scheduler:CollectionScheduler",
 )
 
-# Beat 스케줄 (Phase 2에서 활성화)
-celery_app.conf.beat_schedule = {}
+# 정적 Beat 스케줄 (수집 작업은 CollectionScheduler가 DB에서 로드)
+celery_app.conf.beat_schedule = {
+    "vulnerabilities-sla-sweep": {
+        "task": "vulnerabilities.sla_sweep",
+        "schedule": crontab(minute=0, hour=settings.SLA_SWEEP_HOUR),
+    },
+}
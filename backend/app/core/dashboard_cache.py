@@ -0,0 +1,61 @@
+"""
+대시보드 스냅샷 캐시 (Redis)
+
+스냅샷은 역할/팀 범위별로 한 키에 직렬화된 JSON 그대로 저장하고,
+키에 세대 번호(generation)를 넣어 둡니다. 취약점/결재/증빙 파일이 바뀌면
+세대 번호만 INCR하므로 범위가 몇 개든 무효화는 명령 1회이고,
+이전 세대 키는 TTL로 자연히 사라집니다.
+
+Redis 장애 시에는 캐시 없이 매번 집계합니다 (무효화 실패도 TTL 내 지연으로 끝남).
+"""
+import logging
+from datetime import date
+from typing import Optional
+from app.core.config import settings
+from app.core.redis import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "secuhub:dashboard:"
+GENERATION_KEY = f"{KEY_PREFIX}generation"
+
+
+def snapshot_key(generation: Optional[str], scope: str) -> str:
+    # 날짜를 넣어 자정이 지나면 기한 초과 집계를 새로 계산
+    return f"{KEY_PREFIX}{generation or 0}:{date.today().isoformat()}:{scope}"
+
+
+async def get_snapshot(scope: str) -> tuple[Optional[str], Optional[str]]:
+    """(캐시된 JSON, 현재 세대) - 저장 시 같은 세대를 넘겨 조회 중 무효화된 결과를 새 세대에 싣지 않음"""
+    try:
+        redis = get_redis()
+        generation = await redis.get(GENERATION_KEY)
+        return await redis.get(snapshot_key(generation, scope)), generation
+    except Exception:
+        logger.exception("대시보드 캐시 조회 실패")
+        return None, None
+
+
+async def store_snapshot(scope: str, generation: Optional[str], payload: str) -> None:
+    try:
+        await get_redis().set(
+            snapshot_key(generation, scope), payload, ex=settings.DASHBOARD_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        logger.exception("대시보드 캐시 저장 실패")
+
+
+async def invalidate_dashboard() -> None:
+    """데이터 변경 커밋 후 호출"""
+    try:
+        await get_redis().incr(GENERATION_KEY)
+    except Exception:
+        logger.exception("대시보드 캐시 무효화 실패")
+
+
+def invalidate_dashboard_sync() -> None:
+    """Celery 워커용"""
+    try:
+        get_sync_redis().incr(GENERATION_KEY)
+    except Exception:
+        logger.exception("대시보드 캐시 무효화 실패")
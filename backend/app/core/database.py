@@ -1,13 +1,65 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+"""
+DB 엔진/세션
+
+- 주 DB(engine): 쓰기와 쓰기 직후 읽기
+- 읽기 엔진(read_engine): 조회 API와 보고서. DATABASE_READ_URL이 없으면 주 엔진을 그대로 씀
+  복제 지연이 있으므로 방금 쓴 데이터를 바로 다시 읽는 경로에는 get_db를 사용합니다.
+- 동기 엔진: Celery 워커 (이벤트 루프 없음)
+"""
+from uuid import uuid4
+from sqlalchemy import DDL, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from app.core.config import settings
+from app.core.metrics import InstrumentedAsyncQueuePool
+from app.core.sql_metrics import install_sql_metrics
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+
+def pool_options(pool_size: int, max_overflow: int) -> dict:
+    """프로세스당 풀 크기 (연결 예산이 있으면 워커 수로 나눈 값을 넘지 않게 축소)"""
+    if settings.DB_CONNECTION_BUDGET:
+        per_worker = max(1, settings.DB_CONNECTION_BUDGET // max(1, settings.WEB_CONCURRENCY))
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True,
+    }
+
+
+def asyncpg_connect_args() -> dict:
+    if settings.DB_PGBOUNCER:
+        # transaction pooling에서는 연결이 트랜잭션마다 바뀌어 이름 있는 prepared statement가 충돌함
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+
+
+def _async_engine(url: str, name: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        connect_args=asyncpg_connect_args(),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,  # 풀 지표 라벨
+        **pool_options(pool_size, max_overflow),
+    )
+
+
+engine = _async_engine(settings.DATABASE_URL, "primary", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+read_engine = (
+    _async_engine(settings.DATABASE_READ_URL, "read", settings.DB_READ_POOL_SIZE, settings.DB_READ_MAX_OVERFLOW)
+    if settings.DATABASE_READ_URL
+    else engine
 )
 
 async_session = async_sessionmaker(
@@ -16,14 +68,66 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Celery 워커용 동기 엔진 (워커 프로세스는 이벤트 루프가 없음)
+sync_engine = create_engine(
+    settings.DATABASE_URL_SYNC,
+    echo=settings.DB_ECHO,
+    pool_pre_ping=True,
+)
+sync_read_engine = (
+    create_engine(settings.DATABASE_READ_URL_SYNC, echo=settings.DB_ECHO, pool_pre_ping=True)
+    if settings.DATABASE_READ_URL_SYNC
+    else sync_engine
+)
+
+sync_session = sessionmaker(
+    sync_engine,
+    class_=Session,
+    expire_on_commit=False,
+)
+
+sync_read_session = sessionmaker(
+    sync_read_engine,
+    class_=Session,
+    expire_on_commit=False,
+)
+
+
+def all_engines() -> list[AsyncEngine]:
+    """종료/계측용 (복제본 미설정 시 중복 없이)"""
+    return [engine] if read_engine is engine else [engine, read_engine]
+
+
+for _engine in {*(e.sync_engine for e in all_engines()), sync_engine, sync_read_engine}:
+    install_sql_metrics(_engine)
+
 
 class Base(DeclarativeBase):
     pass
 
 
+# 트라이그램 인덱스(gin_trgm_ops)용 확장 - create_all 전에 생성
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """조회 전용 세션 (복제본) - GET 엔드포인트/보고서용"""
+    async with read_session() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
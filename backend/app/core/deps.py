@@ -1,21 +1,18 @@
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
 from app.core.security import decode_access_token
+from app.core.user_cache import AuthUser, user_cache
 from app.models.user import User, UserRole, UserStatus
 
 security_scheme = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """현재 인증된 사용자 반환"""
-    token = credentials.credentials
+async def authenticate_token(token: str, db: AsyncSession) -> AuthUser:
+    """액세스 토큰 → 사용자 (캐시 미스 시에만 DB 조회)"""
     payload = decode_access_token(token)
 
     if payload is None:
@@ -24,21 +21,27 @@ async def get_current_user(
             detail="유효하지 않은 인증 토큰입니다.",
         )
 
-    user_id: int = payload.get("sub")
-    if user_id is None:
+    sub = payload.get("sub")
+    if sub is None or not str(sub).isdigit():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="토큰에 사용자 정보가 없습니다.",
         )
+    user_id = int(sub)
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
+    user = await user_cache.get(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="사용자를 찾을 수 없습니다.",
-        )
+        result = await db.execute(select(User).where(User.id == user_id))
+        db_user = result.scalar_one_or_none()
+
+        if db_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="사용자를 찾을 수 없습니다.",
+            )
+
+        user = AuthUser.from_user(db_user)
+        await user_cache.set(user)
 
     if user.status != UserStatus.ACTIVE:
         raise HTTPException(
@@ -49,9 +52,25 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> AuthUser:
+    """현재 인증된 사용자 반환 (Authorization: Bearer)"""
+    return await authenticate_token(credentials.credentials, db)
+
+
+async def get_stream_user(
+    token: str = Query(..., description="액세스 토큰 (EventSource는 헤더를 지정할 수 없음)"),
+    db: AsyncSession = Depends(get_db),
+) -> AuthUser:
+    """스트리밍 엔드포인트용 인증 (?token= 쿼리 파라미터)"""
+    return await authenticate_token(token, db)
+
+
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: AuthUser = Depends(get_current_user),
+) -> AuthUser:
     """활성 상태의 현재 사용자"""
     return current_user
 
@@ -62,7 +81,7 @@ class RoleChecker:
     def __init__(self, allowed_roles: list[UserRole]):
         self.allowed_roles = allowed_roles
 
-    async def __call__(self, current_user: User = Depends(get_current_user)) -> User:
+    async def __call__(self, current_user: AuthUser = Depends(get_current_user)) -> AuthUser:
         if current_user.role not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -78,7 +97,7 @@ class PermissionChecker:
         self.require_evidence = require_evidence
         self.require_vuln = require_vuln
 
-    async def __call__(self, current_user: User = Depends(get_current_user)) -> User:
+    async def __call__(self, current_user: AuthUser = Depends(get_current_user)) -> AuthUser:
         if self.require_evidence and not current_user.permission_evidence:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
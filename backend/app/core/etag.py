@@ -0,0 +1,62 @@
+"""
+조건부 GET (약한 ETag)
+
+목록/참조 데이터 응답의 ETag는 대상 집합을 필터 그대로 집계한 (건수, max(updated_at))로 만들고,
+행을 읽거나 직렬화하기 전에 If-None-Match와 비교해 같으면 304를 돌려줍니다.
+- 추가/수정은 updated_at, 삭제는 건수로 드러납니다.
+  응답에 다른 테이블 값이 섞이면(담당자 이름 등) 그 테이블 상태도 함께 넣습니다.
+- URL(경로+쿼리)과 앱 버전을 함께 해시해 페이지/응답 형식이 다르면 ETag도 다릅니다.
+- 집계는 건수를 함께 세므로, 어차피 정확한 총 건수를 세는 요청(count=exact)에서만 씁니다.
+  count=none/estimated 요청은 ETag 없이 응답해 CountMode로 아낀 비용을 되살리지 않습니다.
+- updated_at은 트랜잭션 시작 시각(now())이라, 더 늦게 시작한 트랜잭션보다 나중에 커밋된 변경은
+  다음 변경 전까지 max에 드러나지 않을 수 있습니다. (짧은 API 트랜잭션 기준 실질적 영향은 작음)
+"""
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+
+# 브라우저가 저장하되 매번 재검증 (공유 캐시에는 저장하지 않음)
+CACHE_CONTROL = "private, no-cache"
+
+
+def collection_state(model: Any, *filters) -> Select:
+    """(건수, 최종 수정 시각) 집계 쿼리"""
+    return select(func.count(), func.max(model.updated_at)).select_from(model).where(*filters)
+
+
+async def read_states(db: AsyncSession, *states: Select) -> list[tuple[int, Optional[Any]]]:
+    return [tuple((await db.execute(state)).one()) for state in states]
+
+
+def weak_etag(request: Request, states: list[tuple]) -> str:
+    parts = [settings.APP_VERSION, request.url.path, *map(str, sorted(request.query_params.multi_items()))]
+    for count, updated_at in states:
+        parts.append(f"{count}:{updated_at.isoformat() if updated_at else '-'}")
+    digest = hashlib.blake2b("|".join(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두사 무시, * 허용)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def with_etag(response: Response, etag: Optional[str]) -> Response:
+    if etag is None:
+        return response
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
@@ -0,0 +1,195 @@
+"""
+Prometheus 지표 (/metrics)
+
+- HTTP: 라우트 템플릿(/api/v1/vulnerabilities/{vuln_id})별 지연시간 히스토그램과 처리 중 요청 수
+- DB 풀: 엔진(primary/read)별 사용 중/overflow 연결 수와 연결 획득 대기시간
+- bcrypt 풀: 대기열 길이와 대기시간 (security._run_in_hash_pool)
+- Celery 큐 길이, 수집 작업 실행 결과/소요시간은 스크랩 시점 수집기(services.metrics_service)
+
+uvicorn 워커가 여럿이면 PROMETHEUS_MULTIPROC_DIR을 지정해야 합니다.
+각 워커가 지표를 이 디렉터리의 mmap 파일에 쓰고, /metrics는 어느 워커가 받든 전체를 합산합니다.
+디렉터리는 서버 시작 전에 비워야 합니다. (이전 실행의 파일이 남으면 카운터가 이어서 합산됨)
+"""
+import os
+import time
+from typing import Iterable
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.routing import Match
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+METRICS_PATH = "/metrics"
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+# ========================================
+# 지표 정의
+# (Gauge는 multiprocess_mode="livesum": 살아있는 워커 값의 합)
+# ========================================
+HTTP_REQUEST_DURATION = Histogram(
+    "secuhub_http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "secuhub_http_requests_in_progress",
+    "처리 중인 HTTP 요청 수 (SSE 연결 포함)",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "secuhub_db_pool_checked_out_connections",
+    "사용 중인 DB 연결 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "secuhub_db_pool_overflow_connections",
+    "pool_size를 넘어 연 overflow 연결 수",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "secuhub_db_pool_size",
+    "설정된 풀 크기 (pool_size)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "secuhub_db_pool_wait_seconds",
+    "DB 연결 획득 시간 (풀 대기 + 새 연결 생성)",
+    ["pool"],
+    buckets=WAIT_BUCKETS,
+)
+
+PASSWORD_HASH_QUEUED = Gauge(
+    "secuhub_password_hash_queued",
+    "bcrypt 워커 슬롯을 기다리는 요청 수",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "secuhub_password_hash_in_flight",
+    "bcrypt 계산 중인 요청 수",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_WAIT = Histogram(
+    "secuhub_password_hash_wait_seconds",
+    "bcrypt 워커 슬롯 대기시간",
+    buckets=WAIT_BUCKETS,
+)
+
+
+# ========================================
+# HTTP 미들웨어
+# ========================================
+def route_template(scope) -> str:
+    """경로 파라미터를 템플릿으로 묶어 라벨 수를 라우트 수로 제한 (매칭 실패는 unmatched)"""
+    partial = None
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path  # 경로는 맞고 메서드만 다름 (405)
+    return partial or "unmatched"
+
+
+class PrometheusMiddleware:
+    """라우트별 지연시간/처리 중 요청 수 (순수 ASGI - 스트리밍 응답을 버퍼링하지 않음)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        status = 500  # 응답 시작 전 예외
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route, str(status)).observe(time.perf_counter() - started)
+            in_progress.dec()
+
+
+# ========================================
+# DB 커넥션 풀
+# ========================================
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    연결 획득 시간(풀이 가득 차면 반납 대기 포함)과 사용 중/overflow 연결 수
+    checkin 이벤트는 큐 반납 전에 불려 값이 한 박자 늦으므로 반납 후에 갱신합니다.
+    라벨은 create_async_engine(pool_logging_name=...)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        DB_POOL_SIZE.labels(self.logging_name).set(self.size())
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(self.logging_name).observe(time.perf_counter() - started)
+            self._update_gauges()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        DB_POOL_CHECKED_OUT.labels(self.logging_name).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(self.logging_name).set(max(self.overflow(), 0))  # 다 채우기 전에는 음수
+
+
+# ========================================
+# 출력
+# ========================================
+def render_metrics(collectors: Iterable = ()) -> bytes:
+    """
+    현재 지표를 텍스트 형식으로 (스크랩 시점 수집기는 collectors로)
+    멀티프로세스 모드면 모든 워커의 mmap 파일을 합산합니다.
+    """
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    extra = CollectorRegistry(auto_describe=False)
+    for collector in collectors:
+        extra.register(collector)
+    return generate_latest(registry) + generate_latest(extra)
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 livesum Gauge에서 이 프로세스 값을 제외"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
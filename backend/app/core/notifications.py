@@ -0,0 +1,151 @@
+"""
+실시간 알림 (Redis pub/sub → SSE)
+
+- 발행: 워크플로가 조치 이력/결재 요청을 기록한 뒤 이벤트 묶음을 한 메시지로 발행
+- 구독: API 프로세스당 Redis 구독 1개를 유지하고, 수신한 이벤트를 수신자(user_id)별
+  연결 큐로 나눠 전달합니다. 연결 수와 관계없이 Redis 연결은 프로세스당 하나입니다.
+- 보관 알림(PENDING_EVENT_TYPES): pub/sub는 접속 중인 사용자에게만 전달되므로
+  사용자·유형별 Redis 키에 최신 1건을 보관하고, 스트림 연결 시 꺼내 보냅니다.
+  실시간으로 전달되면 보관본은 지웁니다.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Optional
+from app.core.config import settings
+from app.core.redis import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "secuhub:notifications"
+PENDING_KEY_PREFIX = "secuhub:notifications:pending:"
+PENDING_EVENT_TYPES = ("sla_digest",)
+
+
+def build_event(event_type: str, recipients: Iterable[Optional[int]], **data) -> dict:
+    """recipients: 이벤트를 받을 사용자 ID (None은 무시)"""
+    return {"type": event_type, "recipients": sorted({r for r in recipients if r}), "data": data}
+
+
+async def publish_events(events: list[dict]) -> None:
+    """이벤트 묶음 발행 (실패해도 호출 측 트랜잭션에는 영향 없음)"""
+    if not events:
+        return
+    try:
+        await get_redis().publish(CHANNEL, json.dumps({"events": events}, ensure_ascii=False, default=str))
+    except Exception:
+        logger.exception("알림 발행 실패 (%d건)", len(events))
+
+
+def publish_events_sync(events: list[dict]) -> bool:
+    """Celery 워커용 발행 (성공 여부 반환)"""
+    if not events:
+        return True
+    try:
+        get_sync_redis().publish(CHANNEL, json.dumps({"events": events}, ensure_ascii=False, default=str))
+        return True
+    except Exception:
+        logger.exception("알림 발행 실패 (%d건)", len(events))
+        return False
+
+
+# ========================================
+# 보관 알림
+# ========================================
+def pending_key(user_id: int, event_type: str) -> str:
+    return f"{PENDING_KEY_PREFIX}{user_id}:{event_type}"
+
+
+def pending_message(event: dict) -> str:
+    """보관 값 (스트림 큐 메시지와 같은 형식)"""
+    return json.dumps({"type": event["type"], "data": event["data"]}, ensure_ascii=False, default=str)
+
+
+async def take_pending(user_id: int) -> list[dict]:
+    """연결 시 보관된 알림을 꺼냄 (GETDEL - 여러 연결이 동시에 열려도 한 번만)"""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for event_type in PENDING_EVENT_TYPES:
+            pipe.getdel(pending_key(user_id, event_type))
+        values = await pipe.execute()
+    except Exception:
+        logger.exception("보관 알림 조회 실패 (user_id=%s)", user_id)
+        return []
+    return [json.loads(value) for value in values if value]
+
+
+async def clear_pending(user_id: int, event_type: str) -> None:
+    """실시간으로 전달된 보관 알림 삭제"""
+    try:
+        await get_redis().delete(pending_key(user_id, event_type))
+    except Exception:
+        logger.exception("보관 알림 삭제 실패 (user_id=%s)", user_id)
+
+
+class NotificationHub:
+    def __init__(self):
+        self._queues: dict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._listener: Optional[asyncio.Task] = None
+
+    # ----------------------------------------
+    # Redis 구독 (프로세스당 1개)
+    # ----------------------------------------
+    async def _listen(self) -> None:
+        while True:
+            pubsub = get_redis().pubsub()
+            try:
+                await pubsub.subscribe(CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.dispatch(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("알림 구독 끊김, 재연결합니다.")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    def dispatch(self, payload: dict) -> None:
+        for event in payload.get("events", ()):
+            message = {"type": event["type"], "data": event["data"]}
+            for user_id in event["recipients"]:
+                for queue in self._queues.get(user_id, ()):
+                    if queue.full():
+                        queue.get_nowait()  # 느린 클라이언트는 오래된 이벤트부터 버림
+                    queue.put_nowait(message)
+
+    # ----------------------------------------
+    # 연결
+    # ----------------------------------------
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue]:
+        self._ensure_listener()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.NOTIFICATION_QUEUE_SIZE)
+        self._queues[user_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._queues.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._queues[user_id]
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+notification_hub = NotificationHub()
@@ -0,0 +1,73 @@
+"""
+Keyset(커서) 페이지네이션
+
+(created_at, id) 내림차순 정렬에서 마지막 행 위치를 커서로 전달해
+OFFSET 없이 다음 페이지를 조회합니다. 페이지 깊이와 무관하게 인덱스 범위 스캔 한 번으로 끝납니다.
+"""
+import base64
+import enum
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from sqlalchemy import Select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CountMode(str, enum.Enum):
+    EXACT = "exact"          # count(*) (필터 적용)
+    ESTIMATED = "estimated"  # pg_class.reltuples (필터 없을 때만, 아니면 exact)
+    NONE = "none"            # 총 건수 생략
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 디코딩 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def apply_keyset(query: Select, model: Any, cursor: Optional[str], size: int) -> Select:
+    """(created_at, id) 내림차순 keyset 조건 적용 (다음 페이지 확인용으로 size+1건 조회)"""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(size + 1)
+
+
+def split_page(rows: Sequence[Any], size: int) -> tuple[list[Any], Optional[str]]:
+    """size+1건 조회 결과를 (현재 페이지, 다음 커서)로 분리"""
+    items = list(rows[:size])
+    if len(rows) > size and items:
+        last = items[-1]
+        return items, encode_cursor(last.created_at, last.id)
+    return items, None
+
+
+async def count_rows(
+    db: AsyncSession,
+    count_query: Select,
+    table_name: str,
+    mode: CountMode,
+    filtered: bool,
+) -> Optional[int]:
+    """총 건수 계산 (mode에 따라 정확/추정/생략)"""
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.ESTIMATED and not filtered:
+        # 통계가 아직 없으면(-1 또는 0) 정확한 count로 대체
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:t AS regclass)"),
+            {"t": table_name},
+        )
+        estimate = result.scalar()
+        if estimate and estimate > 0:
+            return estimate
+    result = await db.execute(count_query)
+    return result.scalar()
@@ -0,0 +1,55 @@
+import time
+from typing import Optional
+import redis
+from redis import asyncio as aioredis
+from app.core.config import settings
+
+_redis: Optional[aioredis.Redis] = None
+_sync_redis: Optional[redis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """프로세스 공용 비동기 Redis 클라이언트 (커넥션 풀 공유)"""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def get_sync_redis() -> redis.Redis:
+    """Celery 워커/beat용 동기 Redis 클라이언트"""
+    global _sync_redis
+    if _sync_redis is None:
+        _sync_redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _sync_redis
+
+
+# ========================================
+# 동시 실행 슬롯
+# ========================================
+# 보유자별 만료 시각을 점수로 둔 sorted set 항목이라, 반납하지 못한 슬롯(워커 비정상 종료)도
+# 만료 뒤 다음 시도가 정리합니다. (정리 → 한도 확인 → 등록을 한 번에 실행)
+# KEYS[1]=슬롯 키, ARGV=[보유자 토큰, 현재 시각, 만료 시각, 한도, 키 TTL]
+ACQUIRE_SLOT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[4]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+
+def try_acquire_slot(client: redis.Redis, key: str, token: str, limit: int, ttl: int) -> bool:
+    """슬롯 확보 시도 (반납은 client.zrem(key, token))"""
+    now = time.time()
+    acquire = client.register_script(ACQUIRE_SLOT)
+    return bool(acquire(keys=[key], args=[token, now, now + ttl, limit, ttl]))
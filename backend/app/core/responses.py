@@ -0,0 +1,130 @@
+"""
+응답 직렬화/압축
+
+- response_model 엔드포인트가 모델을 반환하면 FastAPI는 이를 dict로 풀어 response_model로 다시 검증한 뒤
+  jsonable_encoder → json.dumps를 거칩니다. (목록이면 행마다 두 번 검증)
+  목록 엔드포인트는 json_response로 캐시된 TypeAdapter에서 한 번에 검증하고 pydantic-core로 바로 직렬화합니다.
+  response_model은 OpenAPI 문서용으로 그대로 둡니다.
+- CompressionMiddleware: 한 번에 보내는 JSON/텍스트 응답만 gzip (SSE·파일 다운로드 같은 스트리밍,
+  부분 응답(206/Content-Range)은 그대로)
+"""
+import gzip
+from functools import lru_cache
+from typing import Any
+from pydantic import TypeAdapter
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from app.core.config import settings
+
+COMPRESSIBLE_TYPES = {"application/json", "application/javascript", "application/xml", "image/svg+xml"}
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """타입별 검증기/직렬화기 (스키마 빌드는 타입당 한 번)"""
+    return TypeAdapter(tp)
+
+
+def json_response(tp: Any, data: Any, status_code: int = 200) -> Response:
+    """
+    data를 tp로 한 번 검증해 JSON 응답으로
+    ORM 객체는 from_attributes 스키마 자리에서만 받고, 이미 검증된 모델 인스턴스는 다시 검증하지 않습니다.
+    (from_attributes=True를 전체에 주면 dict 입력도 느린 경로로 검증됨)
+    """
+    adapter = type_adapter(tp)
+    body = adapter.dump_json(adapter.validate_python(data))
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+# ========================================
+# 압축
+# ========================================
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding의 gzip 허용 여부 (q=0은 거부, 명시가 없으면 * 따름)"""
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _compressible(status: int, headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    # 부분 응답의 범위는 원본 바이트 기준이라 압축하면 맞지 않음
+    if status == 206 or "content-range" in headers:
+        return False
+    media_type = headers.get("content-type", "").split(";")[0].strip()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+class CompressionMiddleware:
+    """
+    GZIP_MINIMUM_SIZE 이상인 단일 본문 응답만 gzip
+    Starlette GZipMiddleware는 스트리밍 응답도 압축해 SSE 이벤트가 압축 버퍼에 묶이므로 쓰지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        gzip_ok = accepts_gzip(Headers(scope=scope).get("accept-encoding", ""))
+        start = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                if not _compressible(message["status"], Headers(raw=message["headers"])):
+                    passthrough = True
+                    await send(start)
+                    return
+                # 압축 여부가 요청의 Accept-Encoding에 따라 달라지므로 압축하지 않은 응답에도 표시
+                # (공유 캐시가 비압축본을 gzip 요청에, 압축본을 비압축 요청에 내주지 않도록)
+                MutableHeaders(raw=start["headers"]).add_vary_header("Accept-Encoding")
+                if not gzip_ok:
+                    passthrough = True
+                    await send(start)
+                return
+
+            # 첫 본문: 더 이어지면 스트리밍 응답이므로 압축하지 않음
+            passthrough = True
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < settings.GZIP_MINIMUM_SIZE:
+                await send(start)
+                await send(message)
+                return
+
+            body = gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(body))
+            # 강한 ETag는 바이트 동일성을 뜻하므로 압축본에는 약한 ETag로
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,50 @@
+"""
+검색어 처리 공통 함수
+
+- 전문 검색: PostgreSQL 'simple' 설정 (한국어 형태소 분석기 없음)
+  어절 단위로 토큰화하고 각 토큰을 접두 일치(:*)로 묶어 "서버" → "서버에서"도 찾습니다.
+- 하이라이트: ts_headline에는 HTML이 아닌 제어 문자를 구분자로 넘기고,
+  애플리케이션에서 원문을 escape한 뒤 <mark>로 바꿔 저장형 XSS를 막습니다.
+"""
+import html
+import re
+from typing import Optional
+
+SEARCH_CONFIG = "simple"
+MAX_SEARCH_LENGTH = 200
+
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter= … "
+)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_query(text: str) -> str:
+    return " ".join(text.split())[:MAX_SEARCH_LENGTH]
+
+
+def prefix_tsquery(text: str) -> Optional[str]:
+    """'SQL 인젝션' → 'sql:* & 인젝션:*' (tsquery 연산자는 토큰화에서 제거됨)"""
+    tokens = _TOKEN.findall(text.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def render_highlight(fragment: Optional[str]) -> Optional[str]:
+    """ts_headline 결과 → HTML (<mark>만 허용)"""
+    if fragment is None:
+        return None
+    return (
+        html.escape(fragment)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
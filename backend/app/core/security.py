@@ -1,10 +1,21 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_IN_FLIGHT, PASSWORD_HASH_QUEUED, PASSWORD_HASH_WAIT
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+T = TypeVar("T")
 
 
 def get_password_hash(password: str) -> str:
@@ -17,6 +28,75 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# ========================================
+# bcrypt 전용 워커 풀
+# ========================================
+# bcrypt는 호출당 수백 ms 동안 CPU를 점유하므로 이벤트 루프에서 직접 호출하지 않고
+# 크기가 제한된 스레드 풀에서 실행합니다 (bcrypt는 해싱 중 GIL을 해제).
+@dataclass
+class PasswordPoolStats:
+    """bcrypt 풀 대기열 지표"""
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+_hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+password_pool_stats = PasswordPoolStats()
+
+
+async def _run_in_hash_pool(func: Callable[..., T], *args) -> T:
+    stats = password_pool_stats
+    enqueued_at = time.perf_counter()
+    stats.queued += 1
+    PASSWORD_HASH_QUEUED.inc()
+    try:
+        await _hash_slots.acquire()
+    finally:
+        stats.queued -= 1
+        PASSWORD_HASH_QUEUED.dec()
+
+    wait = time.perf_counter() - enqueued_at
+    stats.total_wait_seconds += wait
+    stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+    PASSWORD_HASH_WAIT.observe(wait)
+    stats.in_flight += 1
+    PASSWORD_HASH_IN_FLIGHT.inc()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        stats.in_flight -= 1
+        stats.completed += 1
+        PASSWORD_HASH_IN_FLIGHT.dec()
+        _hash_slots.release()
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (워커 풀)"""
+    return await _run_in_hash_pool(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (워커 풀)"""
+    return await _run_in_hash_pool(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """비밀번호 검증 + 재해싱 필요 시 새 해시 반환 (cost 변경 등)"""
+    return await _run_in_hash_pool(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성"""
     to_encode = data.copy()
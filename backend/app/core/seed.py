@@ -1,88 +1,58 @@
 """
 초기 데이터 시드 스크립트
 실행: python -m app.core.seed
+      python -m app.core.seed --rebuild-coverage  (증빙 수집 현황 집계만 재구축)
 """
 import asyncio
+import sys
 from datetime import datetime, date
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import async_session, engine, Base
 from app.core.security import get_password_hash
 from app.models import *
+from app.services.coverage_service import rebuild_coverage
+
+
+# (이메일, 이름, 비밀번호, 팀, 역할, 증빙 권한)
+SEED_USERS = [
+    ("admin@company.com", "보안팀 관리자", "admin1234", "보안팀", UserRole.ADMIN, True),
+    ("park_tl@company.com", "박팀장", "park1234", "백엔드팀", UserRole.APPROVER, False),
+    ("kim_tl@company.com", "김팀장", "kim1234", "프론트팀", UserRole.APPROVER, False),
+    ("kim@company.com", "김개발", "dev1234", "백엔드팀", UserRole.DEVELOPER, False),
+    ("lee@company.com", "이보안", "dev1234", "보안팀", UserRole.DEVELOPER, True),
+    ("park_dev@company.com", "박백엔드", "dev1234", "백엔드팀", UserRole.DEVELOPER, False),
+    ("choi@company.com", "최인프라", "dev1234", "인프라팀", UserRole.DEVELOPER, False),
+]
+
+
+def build_user(
+    email: str,
+    name: str,
+    team: Optional[str],
+    role: UserRole,
+    permission_evidence: bool = False,
+    password: Optional[str] = None,
+    hashed_password: Optional[str] = None,
+) -> User:
+    """사용자 객체 생성 (대량 생성 시 hashed_password를 한 번 계산해 재사용)"""
+    return User(
+        email=email,
+        name=name,
+        hashed_password=hashed_password or get_password_hash(password),
+        team=team,
+        role=role,
+        permission_evidence=permission_evidence,
+        permission_vuln=True,
+        status=UserStatus.ACTIVE,
+    )
 
 
 async def seed_users(session: AsyncSession):
     """기본 사용자 계정 생성"""
     users = [
-        User(
-            email="admin@company.com",
-            name="보안팀 관리자",
-            hashed_password=get_password_hash("admin1234"),
-            team="보안팀",
-            role=UserRole.ADMIN,
-            permission_evidence=True,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="park_tl@company.com",
-            name="박팀장",
-            hashed_password=get_password_hash("park1234"),
-            team="백엔드팀",
-            role=UserRole.APPROVER,
-            permission_evidence=False,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="kim_tl@company.com",
-            name="김팀장",
-            hashed_password=get_password_hash("kim1234"),
-            team="프론트팀",
-            role=UserRole.APPROVER,
-            permission_evidence=False,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="kim@company.com",
-            name="김개발",
-            hashed_password=get_password_hash("dev1234"),
-            team="백엔드팀",
-            role=UserRole.DEVELOPER,
-            permission_evidence=False,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="lee@company.com",
-            name="이보안",
-            hashed_password=get_password_hash("dev1234"),
-            team="보안팀",
-            role=UserRole.DEVELOPER,
-            permission_evidence=True,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="park_dev@company.com",
-            name="박백엔드",
-            hashed_password=get_password_hash("dev1234"),
-            team="백엔드팀",
-            role=UserRole.DEVELOPER,
-            permission_evidence=False,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
-        User(
-            email="choi@company.com",
-            name="최인프라",
-            hashed_password=get_password_hash("dev1234"),
-            team="인프라팀",
-            role=UserRole.DEVELOPER,
-            permission_evidence=False,
-            permission_vuln=True,
-            status=UserStatus.ACTIVE,
-        ),
+        build_user(email, name, team, role, permission_evidence, password=password)
+        for email, name, password, team, role, permission_evidence in SEED_USERS
     ]
     session.add_all(users)
     await session.flush()
@@ -221,6 +191,7 @@ async def seed_assessments(session: AsyncSession, users: list):
     session.add_all(vulns_data)
     await session.flush()
     print(f"  ✓ {len(assessments_data)}개 점검, {len(vulns_data)}개 취약점 생성")
+    return assessments_data
 
 
 async def seed():
@@ -229,6 +200,8 @@ async def seed():
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # 집계 테이블이 나중에 추가된 기존 DB 백필
+        await conn.run_sync(rebuild_coverage)
 
     async with async_session() as session:
         async with session.begin():
@@ -239,5 +212,12 @@ async def seed():
     print("✅ 시드 완료!")
 
 
+async def rebuild():
+    """증빙 수집 현황 집계 재구축 (기존 DB 업그레이드 후 1회)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(rebuild_coverage)
+    print("✅ 증빙 수집 현황 집계 재구축 완료!")
+
+
 if __name__ == "__main__":
-    asyncio.run(seed())
+    asyncio.run(rebuild() if "--rebuild-coverage" in sys.argv[1:] else seed())
@@ -0,0 +1,159 @@
+"""
+요청 단위 SQL 계측
+
+- 엔진 이벤트(before/after_cursor_execute)로 실행 수와 DB 시간을 현재 요청(contextvar)에 누적하고
+  SQLTimingMiddleware가 Server-Timing 헤더로 돌려줍니다. (요청 밖 실행은 느린 쿼리 로그만)
+- SQL_SLOW_QUERY_MS를 넘는 문장은 정규화된 SQL로 로그를 남기고,
+  SELECT는 SQL_EXPLAIN_SAMPLE_RATE 확률로 EXPLAIN (ANALYZE, BUFFERS) 결과를 함께 남깁니다.
+  EXPLAIN은 같은 연결의 별도 DBAPI 커서로 실행하므로 엔진 이벤트가 다시 불리지 않습니다.
+- 같은 모양(리터럴/파라미터 제거)의 문장이 요청 안에서 SQL_N_PLUS_ONE_THRESHOLD회를 넘으면
+  N+1 의심으로 경고합니다.
+"""
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """리터럴/파라미터를 ?로 바꾸고 IN 목록은 길이와 무관하게 한 모양으로"""
+    shape = _STRING.sub("?", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _IN_LIST.sub("(?...)", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestSQLStats:
+    count: int = 0
+    duration: float = 0.0  # 초
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[normalize_sql(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+_request_stats: ContextVar[Optional[RequestSQLStats]] = ContextVar("request_sql_stats", default=None)
+
+
+# ========================================
+# 엔진 이벤트
+# ========================================
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_sql_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        plan = None
+        if _should_explain(statement, context, executemany):
+            plan = _explain(conn, statement, parameters)
+        logger.warning(
+            "느린 쿼리 %.1fms: %s%s",
+            elapsed * 1000,
+            normalize_sql(statement),
+            f"\n{plan}" if plan else "",
+        )
+
+
+def _should_explain(statement: str, context, executemany: bool) -> bool:
+    if executemany or settings.SQL_EXPLAIN_SAMPLE_RATE <= 0:
+        return False
+    # ANALYZE는 문장을 다시 실행하므로 부수효과 없는 SELECT만 (WITH는 데이터 변경 CTE 가능성 때문에 제외)
+    if not statement.lstrip()[:6].upper() == "SELECT":
+        return False
+    if context.execution_options.get("stream_results"):
+        return False
+    return random.random() < settings.SQL_EXPLAIN_SAMPLE_RATE
+
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            return "\n".join(row[0] for row in cursor.fetchall())
+        finally:
+            cursor.close()
+    except Exception:
+        logger.exception("EXPLAIN 실패")
+        return None
+
+
+def install_sql_metrics(engine: Engine) -> None:
+    """동기 Engine에 계측 이벤트 등록 (AsyncEngine은 .sync_engine을 넘김)"""
+    if not settings.SQL_METRICS_ENABLED:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ========================================
+# 미들웨어
+# ========================================
+class SQLTimingMiddleware:
+    """요청별 SQL 집계 → Server-Timing 헤더 (순수 ASGI라 스트리밍 응답을 버퍼링하지 않음)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.SQL_METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.1f}"
+                )
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            repeated = stats.repeated_shapes(settings.SQL_N_PLUS_ONE_THRESHOLD)
+            if repeated:
+                route = scope.get("route")
+                endpoint = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+                for shape, n in repeated:
+                    logger.warning("N+1 의심 %s: 같은 문장 %d회 실행 - %s", endpoint, n, shape)
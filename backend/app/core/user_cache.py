@@ -0,0 +1,92 @@
+"""
+인증 사용자 캐시
+
+get_current_user가 매 요청마다 users 테이블을 조회하지 않도록
+권한 판단에 필요한 필드만 짧은 TTL로 캐시합니다.
+- memory: 워커 프로세스별 캐시 (다른 워커의 무효화는 TTL 만료로 반영)
+- redis: 워커 간 공유 캐시 (무효화 즉시 반영)
+"""
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.user import User, UserRole, UserStatus
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    """인증/인가에 필요한 사용자 정보"""
+    id: int
+    role: UserRole
+    status: UserStatus
+    team: Optional[str]
+    permission_evidence: bool
+    permission_vuln: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthUser":
+        return cls(
+            id=user.id,
+            role=user.role,
+            status=user.status,
+            team=user.team,
+            permission_evidence=user.permission_evidence,
+            permission_vuln=user.permission_vuln,
+        )
+
+
+class MemoryUserCache:
+    def __init__(self, ttl: int, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[int, tuple[float, AuthUser]] = {}
+
+    async def get(self, user_id: int) -> Optional[AuthUser]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        return user
+
+    async def set(self, user: AuthUser) -> None:
+        if len(self._entries) >= self.max_size:
+            self._entries.clear()
+        self._entries[user.id] = (time.monotonic() + self.ttl, user)
+
+    async def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+
+class RedisUserCache:
+    key_prefix = "secuhub:auth_user:"
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    async def get(self, user_id: int) -> Optional[AuthUser]:
+        raw = await get_redis().get(f"{self.key_prefix}{user_id}")
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return AuthUser(
+            **{**data, "role": UserRole(data["role"]), "status": UserStatus(data["status"])}
+        )
+
+    async def set(self, user: AuthUser) -> None:
+        data = {**asdict(user), "role": user.role.value, "status": user.status.value}
+        await get_redis().set(f"{self.key_prefix}{user.id}", json.dumps(data), ex=self.ttl)
+
+    async def invalidate(self, user_id: int) -> None:
+        await get_redis().delete(f"{self.key_prefix}{user_id}")
+
+
+user_cache = (
+    RedisUserCache(settings.USER_CACHE_TTL_SECONDS)
+    if settings.USER_CACHE_BACKEND == "redis"
+    else MemoryUserCache(settings.USER_CACHE_TTL_SECONDS)
+)
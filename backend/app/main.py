@@ -1,8 +1,15 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import all_engines, engine, Base
+from app.core.metrics import CONTENT_TYPE, METRICS_PATH, PrometheusMiddleware, mark_process_dead, render_metrics
+from app.core.notifications import notification_hub
+from app.core.responses import CompressionMiddleware
+from app.core.sql_metrics import SQLTimingMiddleware
+from app.core.redis import close_redis
+from app.services.coverage_service import rebuild_coverage
+from app.services.metrics_service import CeleryQueueCollector, JobExecutionCollector
 from app.api.v1.router import api_router
 
 # 모든 모델 import (테이블 생성용)
@@ -11,13 +18,19 @@ from app.models import *  # noqa
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: 개발환경에서 테이블 자동 생성
+    # Startup: 개발환경에서 테이블 자동 생성 + 증빙 수집 현황 집계 백필
+    # (운영은 bash manage.sh rebuild-coverage)
     if settings.ENVIRONMENT == "development":
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(rebuild_coverage)
     yield
     # Shutdown
-    await engine.dispose()
+    await notification_hub.close()
+    await close_redis()
+    for db_engine in all_engines():
+        await db_engine.dispose()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -38,6 +51,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 실행 수/DB 시간 (Server-Timing)
+app.add_middleware(SQLTimingMiddleware)
+
+# JSON/텍스트 응답 gzip (SSE 등 스트리밍 응답 제외)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 지연시간/처리 중 요청 수 (가장 바깥에서 측정)
+if settings.METRICS_ENABLED:
+    app.add_middleware(PrometheusMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -49,3 +72,12 @@ async def health_check():
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
+
+
+if settings.METRICS_ENABLED:
+    _scrape_collectors = (CeleryQueueCollector(), JobExecutionCollector())
+
+    @app.get(METRICS_PATH, include_in_schema=False)
+    def metrics():
+        # 동기 함수 → 스레드풀에서 실행 (Redis/DB 조회가 이벤트 루프를 막지 않음)
+        return Response(render_metrics(_scrape_collectors), media_type=CONTENT_TYPE)
@@ -11,6 +11,7 @@ from app.models.evidence import (
     JobType,
     ExecutionStatus,
 )
+from app.models.coverage import ControlCoverage, FrameworkCoverage
 from app.models.vulnerability import (
     Assessment,
     Vulnerability,
@@ -27,6 +28,7 @@ __all__ = [
     "Framework", "Control", "EvidenceType", "EvidenceFile",
     "CollectionJob", "JobExecution",
     "CollectionMethod", "JobType", "ExecutionStatus",
+    "ControlCoverage", "FrameworkCoverage",
     "Assessment", "Vulnerability", "VulnActionLog", "ApprovalRequest",
     "AssessmentStatus", "VulnStatus", "ActionType", "ApprovalStatus",
 ]
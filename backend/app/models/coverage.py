@@ -0,0 +1,51 @@
+"""
+증빙 수집 현황 집계 (Framework → Control → EvidenceType)
+
+대시보드/통제 목록이 통제마다 evidence_types → evidence_files를 순회하지 않도록
+통제별·프레임워크별 수집 건수를 집계 테이블에 유지합니다.
+갱신은 services.coverage_service (flush 시 영향받는 통제만 재계산)
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+from app.models.base import TimestampMixin
+
+
+# ========================================
+# 통제별 수집 현황
+# ========================================
+class ControlCoverage(Base, TimestampMixin):
+    __tablename__ = "control_coverage"
+
+    control_id: Mapped[int] = mapped_column(
+        ForeignKey("controls.id", ondelete="CASCADE"), primary_key=True
+    )
+    framework_id: Mapped[int] = mapped_column(
+        ForeignKey("frameworks.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    evidence_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    evidence_collected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_collected_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ControlCoverage(control_id={self.control_id}, {self.evidence_collected}/{self.evidence_total})>"
+
+
+# ========================================
+# 프레임워크별 수집 현황
+# ========================================
+class FrameworkCoverage(Base, TimestampMixin):
+    __tablename__ = "framework_coverage"
+
+    framework_id: Mapped[int] = mapped_column(
+        ForeignKey("frameworks.id", ondelete="CASCADE"), primary_key=True
+    )
+    control_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    evidence_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    evidence_collected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_collected_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<FrameworkCoverage(framework_id={self.framework_id}, {self.evidence_collected}/{self.evidence_total})>"
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Boolean, Integer, BigInteger, Text, Enum, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, Integer, BigInteger, Text, Enum, DateTime, ForeignKey, Index, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import TimestampMixin
@@ -31,7 +31,7 @@ class Control(Base, TimestampMixin):
     __tablename__ = "controls"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    framework_id: Mapped[int] = mapped_column(ForeignKey("frameworks.id"), nullable=False)
+    framework_id: Mapped[int] = mapped_column(ForeignKey("frameworks.id"), nullable=False, index=True)
     code: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     domain: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -52,14 +52,29 @@ class EvidenceType(Base, TimestampMixin):
     __tablename__ = "evidence_types"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    control_id: Mapped[int] = mapped_column(ForeignKey("controls.id"), nullable=False)
+    control_id: Mapped[int] = mapped_column(ForeignKey("controls.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(300), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     file_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # pdf, xlsx, png 등
+    # 버전 할당 카운터 (행 잠금으로 원자적 증가) / 최신 파일 포인터
+    current_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    current_file_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey(
+            "evidence_files.id", use_alter=True, ondelete="SET NULL",
+            name="fk_evidence_types_current_file_id",  # use_alter는 이름이 있어야 DROP 가능
+        ),
+        nullable=True,
+    )
 
     # Relationships
     control = relationship("Control", back_populates="evidence_types")
-    evidence_files = relationship("EvidenceFile", back_populates="evidence_type", cascade="all, delete-orphan")
+    evidence_files = relationship(
+        "EvidenceFile",
+        back_populates="evidence_type",
+        cascade="all, delete-orphan",
+        foreign_keys="EvidenceFile.evidence_type_id",
+    )
+    current_file = relationship("EvidenceFile", foreign_keys=[current_file_id], post_update=True)
     collection_jobs = relationship("CollectionJob", back_populates="evidence_type")
 
     def __repr__(self) -> str:
@@ -76,6 +91,10 @@ class CollectionMethod(str, enum.Enum):
 
 class EvidenceFile(Base, TimestampMixin):
     __tablename__ = "evidence_files"
+    __table_args__ = (
+        # 유형별 버전 중복 방지 + 이력 페이지 조회 (version 내림차순)
+        Index("uq_evidence_files_type_version", "evidence_type_id", text("version DESC"), unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     evidence_type_id: Mapped[int] = mapped_column(ForeignKey("evidence_types.id"), nullable=False)
@@ -84,6 +103,7 @@ class EvidenceFile(Base, TimestampMixin):
     file_name: Mapped[str] = mapped_column(String(500), nullable=False)
     file_path: Mapped[str] = mapped_column(String(1000), nullable=False)
     file_size: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    sha256: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)  # 내용 주소 저장소 키
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     collection_method: Mapped[CollectionMethod] = mapped_column(
         Enum(CollectionMethod, name="collection_method"),
@@ -93,7 +113,7 @@ class EvidenceFile(Base, TimestampMixin):
     collected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     # Relationships
-    evidence_type = relationship("EvidenceType", back_populates="evidence_files")
+    evidence_type = relationship("EvidenceType", back_populates="evidence_files", foreign_keys=[evidence_type_id])
     execution = relationship("JobExecution", back_populates="evidence_files")
 
     def __repr__(self) -> str:
@@ -120,6 +140,7 @@ class CollectionJob(Base, TimestampMixin):
         nullable=False,
     )
     script_path: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    config: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # 수집 유형별 설정 (원본 경로, 시트/컬럼 등)
     evidence_type_id: Mapped[Optional[int]] = mapped_column(ForeignKey("evidence_types.id"), nullable=True)
     schedule_cron: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -155,6 +176,10 @@ class JobExecution(Base, TimestampMixin):
     finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     trace_file_path: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    # 처리량 카운터 (로그 추출 등 대용량 수집)
+    bytes_processed: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    lines_processed: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    lines_matched: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     # Relationships
     job = relationship("CollectionJob", back_populates="executions")
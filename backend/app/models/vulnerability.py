@@ -1,7 +1,8 @@
 import enum
 from datetime import datetime, date
 from typing import Optional
-from sqlalchemy import String, Text, Enum, DateTime, Date, ForeignKey
+from sqlalchemy import String, Text, Enum, DateTime, Date, ForeignKey, Index, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.base import TimestampMixin
@@ -49,6 +50,30 @@ class VulnStatus(str, enum.Enum):
 
 class Vulnerability(Base, TimestampMixin):
     __tablename__ = "vulnerabilities"
+    __table_args__ = (
+        # 점검별 상태 집계 (GROUP BY assessment_id, status)
+        # 상태 필터 인덱스는 updated_at을 포함해 목록 ETag 집계(건수, max(updated_at))를 인덱스만으로 계산
+        Index(
+            "ix_vulnerabilities_assessment_id_status", "assessment_id", "status",
+            postgresql_include=["updated_at"],
+        ),
+        Index("ix_vulnerabilities_status", "status", postgresql_include=["updated_at"]),
+        # 목록 keyset 페이지네이션 (created_at, id)
+        Index("ix_vulnerabilities_created_at_id", "created_at", "id"),
+        # 전문 검색 (tsvector) + 한글 부분 일치 보조 (트라이그램)
+        Index("ix_vulnerabilities_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_vulnerabilities_item_trgm", "item", postgresql_using="gin", postgresql_ops={"item": "gin_trgm_ops"}),
+        Index(
+            "ix_vulnerabilities_content_trgm", "content",
+            postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        # SLA 점검 (미완료 건의 기한 범위 조회, 담당자/결재자까지 인덱스만으로 읽음)
+        Index(
+            "ix_vulnerabilities_due_date_open", "due_date",
+            postgresql_where=text("status <> 'DONE'"),
+            postgresql_include=["assignee_id", "approver_id"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     assessment_id: Mapped[int] = mapped_column(ForeignKey("assessments.id"), nullable=False)
@@ -70,12 +95,24 @@ class Vulnerability(Base, TimestampMixin):
         Enum(VulnStatus, name="vuln_status"),
         default=VulnStatus.UNASSIGNED,
         nullable=False,
-        index=True,
     )
     action_plan: Mapped[Optional[str]] = mapped_column(Text, nullable=True)    # 조치 계획
     action_result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # 조치 결과
     note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)           # 비고
 
+    # 검색용 문서 벡터 (항목 > 내용/문제점 > 조치 계획 가중치)
+    # 한국어는 형태소 분석기가 없어 'simple' 설정으로 어절 단위 토큰화 후 접두 검색
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(item, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(content, '') || ' ' || coalesce(issue, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(action_plan, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Relationships
     assessment = relationship("Assessment", back_populates="vulnerabilities")
     assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_vulnerabilities")
@@ -101,6 +138,11 @@ class ActionType(str, enum.Enum):
 
 class VulnActionLog(Base, TimestampMixin):
     __tablename__ = "vuln_action_logs"
+    __table_args__ = (
+        # 취약점별 조치 이력 keyset 페이지네이션
+        Index("ix_vuln_action_logs_vulnerability_id_created_at_id", "vulnerability_id", "created_at", "id"),
+        Index("ix_vuln_action_logs_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     vulnerability_id: Mapped[int] = mapped_column(ForeignKey("vulnerabilities.id"), nullable=False)
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from app.models.vulnerability import VulnStatus
+
+
+class VulnerabilitySummary(BaseModel):
+    """취약점 조치 현황"""
+    total: int = 0
+    open: int = 0  # 완료 외 전체
+    by_status: dict[VulnStatus, int] = {}
+
+
+class TeamOverdue(BaseModel):
+    """팀별 기한 초과 (담당자 팀 기준, 미배정은 team=None)"""
+    team: Optional[str] = None
+    count: int
+
+
+class FrameworkCoverageSummary(BaseModel):
+    framework_id: int
+    name: str
+    evidence_total: int = 0
+    evidence_collected: int = 0
+    coverage_percent: float = 0.0
+
+
+class EvidenceCoverageSummary(BaseModel):
+    """증빙 수집 현황"""
+    evidence_total: int = 0
+    evidence_collected: int = 0
+    coverage_percent: float = 0.0
+    frameworks: list[FrameworkCoverageSummary] = []
+
+
+class DashboardResponse(BaseModel):
+    # 관리자는 전체, 그 외는 본인 팀 범위 (기한 초과/결재 대기)
+    scope: str
+    vulnerabilities: Optional[VulnerabilitySummary] = None   # 취약점 관리 권한이 있을 때
+    overdue_by_team: list[TeamOverdue] = []
+    approvals_waiting: int = 0
+    evidence: Optional[EvidenceCoverageSummary] = None       # 증빙 수집 권한이 있을 때
+    generated_at: datetime
@@ -19,6 +19,11 @@ class FrameworkCreate(FrameworkBase):
 class FrameworkResponse(FrameworkBase):
     id: int
     created_at: datetime
+    # 동적 필드: 증빙 수집 현황
+    control_total: Optional[int] = None
+    evidence_collected: Optional[int] = None
+    evidence_total: Optional[int] = None
+    last_collected_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -44,6 +49,7 @@ class ControlResponse(ControlBase):
     # 동적 필드: 증빙 수집 현황
     evidence_collected: Optional[int] = None
     evidence_total: Optional[int] = None
+    last_collected_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
@@ -79,6 +85,7 @@ class EvidenceFileResponse(BaseModel):
     file_name: str
     file_path: str
     file_size: int
+    sha256: Optional[str] = None
     version: int
     collection_method: CollectionMethod
     collected_at: datetime
@@ -88,9 +95,10 @@ class EvidenceFileResponse(BaseModel):
 
 
 class EvidenceFileWithHistory(BaseModel):
-    """증빙 파일 + 버전 이력"""
+    """증빙 파일 + 버전 이력 (이력은 next_before_version으로 이어서 조회)"""
     current: EvidenceFileResponse
     history: list[EvidenceFileResponse]
+    next_before_version: Optional[int] = None
 
 
 # ========================================
@@ -101,6 +109,7 @@ class CollectionJobBase(BaseModel):
     description: Optional[str] = None
     job_type: JobType
     script_path: Optional[str] = None
+    config: Optional[dict] = None
     schedule_cron: Optional[str] = None
     is_active: bool = True
 
@@ -129,6 +138,9 @@ class JobExecutionResponse(BaseModel):
     finished_at: Optional[datetime] = None
     error_message: Optional[str] = None
     trace_file_path: Optional[str] = None
+    bytes_processed: Optional[int] = None
+    lines_processed: Optional[int] = None
+    lines_matched: Optional[int] = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
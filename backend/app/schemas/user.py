@@ -52,7 +52,8 @@ class UserResponse(UserBase):
 
 class UserListResponse(BaseModel):
     items: list[UserResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 생략
+    next_cursor: Optional[str] = None
 
 
 class UserBrief(BaseModel):
@@ -1,6 +1,6 @@
 from datetime import datetime, date
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.models.vulnerability import AssessmentStatus, VulnStatus, ActionType, ApprovalStatus
 from app.schemas.user import UserBrief
 
@@ -41,6 +41,11 @@ class AssessmentResponse(AssessmentBase):
     model_config = {"from_attributes": True}
 
 
+class AssessmentListResponse(BaseModel):
+    items: list[AssessmentResponse]
+    total: int
+
+
 # ========================================
 # Vulnerability
 # ========================================
@@ -104,7 +109,19 @@ class VulnerabilityResponse(VulnerabilityBase):
 
 class VulnerabilityListResponse(BaseModel):
     items: list[VulnerabilityResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 생략
+    next_cursor: Optional[str] = None
+
+
+class VulnerabilitySearchHit(VulnerabilityResponse):
+    rank: float
+    item_highlight: Optional[str] = None     # <mark>로 일치 부분 표시 (나머지는 HTML escape)
+    content_highlight: Optional[str] = None
+
+
+class VulnerabilitySearchResponse(BaseModel):
+    items: list[VulnerabilitySearchHit]
+    next_page: Optional[int] = None
 
 
 # ========================================
@@ -123,6 +140,12 @@ class VulnActionLogResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class VulnActionLogListResponse(BaseModel):
+    items: list[VulnActionLogResponse]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
 # ========================================
 # Approval Request
 # ========================================
@@ -147,3 +170,76 @@ class ApprovalAction(BaseModel):
     """결재 승인/반려"""
     action: ApprovalStatus  # approved or rejected
     reject_reason: Optional[str] = None
+
+
+# ========================================
+# Workflow (일괄 상태 전이)
+# ========================================
+class VulnerabilityBulkTarget(BaseModel):
+    """일괄 처리 대상 (둘 다 생략 시 본인 담당/결재 범위 전체)"""
+    vulnerability_ids: Optional[list[int]] = Field(None, max_length=10000)
+    assessment_id: Optional[int] = None
+    comment: Optional[str] = None
+
+
+class VulnerabilityBulkAssign(VulnerabilityBulkTarget, VulnerabilityAssign):
+    pass
+
+
+class VulnerabilityBulkSchedule(VulnerabilityBulkTarget, VulnerabilitySchedule):
+    pass
+
+
+class VulnerabilityBulkApproval(VulnerabilityBulkTarget, ApprovalAction):
+    pass
+
+
+class VulnerabilityBulkResult(VulnerabilityBulkTarget, VulnerabilityActionResult):
+    pass
+
+
+class VulnerabilityTransitionResponse(BaseModel):
+    action: str
+    updated: int
+    updated_ids: list[int]
+    skipped_ids: list[int] = []  # 지정했지만 현재 상태/권한상 전이되지 않은 항목
+
+
+# ========================================
+# Excel Import
+# ========================================
+class VulnerabilityImportError(BaseModel):
+    row: int
+    message: str
+
+
+class VulnerabilityImportTask(BaseModel):
+    """일괄 등록 작업 접수 결과"""
+    task_id: str
+    assessment_id: int
+
+
+class VulnerabilityImportStatus(BaseModel):
+    """일괄 등록 진행 현황"""
+    task_id: str
+    state: str  # PENDING, STARTED, PROGRESS, SUCCESS, FAILURE
+    processed: int = 0
+    total_rows: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    errors: list[VulnerabilityImportError] = []
+    detail: Optional[str] = None
+
+
+class VulnerabilityExportTask(BaseModel):
+    """관리대장 내보내기 작업 접수 결과"""
+    task_id: str
+
+
+class VulnerabilityExportStatus(BaseModel):
+    """관리대장 내보내기 진행 현황"""
+    task_id: str
+    state: str  # PENDING, STARTED, PROGRESS, SUCCESS, FAILURE
+    rows: int = 0
+    evidence_file_id: Optional[int] = None
+    detail: Optional[str] = None
@@ -1 +1,2 @@
-
+# 증빙 수집 현황 집계 세션 훅 등록 (서비스를 쓰는 모든 프로세스: API/Celery 워커/시드)
+from app.services import coverage_service  # noqa: F401
@@ -0,0 +1,97 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from app.models.vulnerability import Assessment, Vulnerability, VulnStatus
+from app.schemas.vulnerability import AssessmentCreate, AssessmentUpdate, AssessmentResponse
+
+
+class AssessmentService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, assessment_id: int) -> Optional[Assessment]:
+        result = await self.db.execute(select(Assessment).where(Assessment.id == assessment_id))
+        return result.scalar_one_or_none()
+
+    async def get_list(
+        self,
+        page: int = 1,
+        size: int = 20,
+        status: Optional[str] = None,
+    ) -> tuple[list[Assessment], int]:
+        """점검 목록 조회 (필터, 페이지네이션)"""
+        query = select(Assessment)
+        count_query = select(func.count()).select_from(Assessment)
+
+        if status:
+            query = query.where(Assessment.status == status)
+            count_query = count_query.where(Assessment.status == status)
+
+        total_result = await self.db.execute(count_query)
+        total = total_result.scalar()
+
+        offset = (page - 1) * size
+        query = query.order_by(Assessment.assessed_at.desc().nulls_last(), Assessment.id.desc())
+        result = await self.db.execute(query.offset(offset).limit(size))
+        assessments = list(result.scalars().all())
+
+        return assessments, total
+
+    async def get_status_counts(self, assessment_ids: list[int]) -> dict[int, dict[VulnStatus, int]]:
+        """점검별 취약점 상태 건수 (단일 GROUP BY, (assessment_id, status) 인덱스 사용)"""
+        if not assessment_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(Vulnerability.assessment_id, Vulnerability.status, func.count())
+            .where(Vulnerability.assessment_id.in_(assessment_ids))
+            .group_by(Vulnerability.assessment_id, Vulnerability.status)
+        )
+
+        counts: dict[int, dict[VulnStatus, int]] = {}
+        for assessment_id, vuln_status, count in result.all():
+            counts.setdefault(assessment_id, {})[vuln_status] = count
+        return counts
+
+    async def to_responses(self, assessments: list[Assessment]) -> list[AssessmentResponse]:
+        """점검 목록에 진행 현황 집계를 채워 응답 생성"""
+        counts = await self.get_status_counts([a.id for a in assessments])
+        return [build_assessment_response(a, counts.get(a.id, {})) for a in assessments]
+
+    async def create(self, data: AssessmentCreate) -> Assessment:
+        """점검 생성"""
+        assessment = Assessment(**data.model_dump())
+        self.db.add(assessment)
+        await self.db.commit()
+        await self.db.refresh(assessment)
+        return assessment
+
+    async def update(self, assessment_id: int, data: AssessmentUpdate) -> Optional[Assessment]:
+        """점검 정보 수정"""
+        assessment = await self.get_by_id(assessment_id)
+        if assessment is None:
+            return None
+
+        for field, value in data.model_dump(exclude_unset=True).items():
+            setattr(assessment, field, value)
+
+        await self.db.commit()
+        await self.db.refresh(assessment)
+        return assessment
+
+
+def build_assessment_response(
+    assessment: Assessment, status_counts: dict[VulnStatus, int]
+) -> AssessmentResponse:
+    """상태별 건수로 진행 현황 필드 계산 (미조치 = 완료/조치중 외 나머지)"""
+    total = sum(status_counts.values())
+    done = status_counts.get(VulnStatus.DONE, 0)
+    in_progress = status_counts.get(VulnStatus.IN_PROGRESS, 0)
+
+    response = AssessmentResponse.model_validate(assessment)
+    response.total_count = total
+    response.done_count = done
+    response.in_progress_count = in_progress
+    response.pending_count = total - done - in_progress
+    response.progress_percent = round(done / total * 100, 1) if total else 0.0
+    return response
@@ -3,7 +3,7 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.user import User, UserStatus
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_and_update_password_async, create_access_token
 
 
 class AuthService:
@@ -19,11 +19,16 @@ class AuthService:
 
         if user is None:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not valid:
             return None
         if user.status != UserStatus.ACTIVE:
             return None
 
+        # bcrypt cost 변경 등으로 재해싱이 필요하면 교체 (login에서 커밋)
+        if new_hash is not None:
+            user.hashed_password = new_hash
+
         return user
 
     async def login(self, email: str, password: str) -> Optional[dict]:
@@ -39,7 +44,7 @@ class AuthService:
 
         # JWT 토큰 생성
         access_token = create_access_token(
-            data={"sub": user.id, "role": user.role.value}
+            data={"sub": str(user.id), "role": user.role.value}
         )
 
         return {
@@ -0,0 +1,177 @@
+"""
+증빙 수집 현황 집계 갱신 (Framework → Control → EvidenceType)
+
+EvidenceFile / EvidenceType / Control 변경이 flush될 때 영향받는 통제만
+control_coverage / framework_coverage에 다시 계산합니다.
+
+동시성:
+재계산은 INSERT ... SELECT 한 문장이라 READ COMMITTED에서는 문장 시작 시점 스냅샷으로 셉니다.
+같은 통제/프레임워크에 동시 업로드가 있으면 먼저 커밋한 쪽의 파일을 못 본 채
+나중 트랜잭션이 덮어쓸 수 있으므로, 재계산 전에 관련 프레임워크 행을 id 순서로 잠급니다.
+잠금을 얻은 뒤 실행되는 재계산 문장은 앞선 트랜잭션의 커밋 결과를 봅니다.
+(통제 집계와 프레임워크 합산을 함께 보호하므로 통제가 아닌 프레임워크 단위로 잠금)
+
+기존 DB의 집계는 마이그레이션(alembic upgrade head)이 채우며, 필요하면 다시 재구축할 수 있습니다.
+    python -m app.core.seed --rebuild-coverage   (bash manage.sh rebuild-coverage)
+"""
+from typing import Iterable, Optional
+from sqlalchemy import delete, event, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.models.coverage import ControlCoverage, FrameworkCoverage
+from app.models.evidence import Control, EvidenceFile, EvidenceType, Framework
+
+
+# ========================================
+# 잠금
+# ========================================
+def lock_frameworks(conn: Connection, framework_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    집계 재계산 직렬화 (framework_ids=None이면 전체)
+    여러 프레임워크를 잠글 때 교착이 없도록 항상 id 순서로 잠급니다.
+    FOR NO KEY UPDATE: 통제 INSERT의 FK 확인(FOR KEY SHARE)과는 충돌하지 않아
+    같은 프레임워크에 통제를 추가하는 트랜잭션끼리 교착되지 않습니다.
+    """
+    stmt = select(Framework.id).order_by(Framework.id).with_for_update(key_share=True)
+    if framework_ids is not None:
+        ids = sorted(set(framework_ids))
+        if not ids:
+            return
+        stmt = stmt.where(Framework.id.in_(ids))
+    conn.execute(stmt).all()
+
+
+# ========================================
+# 집계 갱신
+# ========================================
+def refresh_control_coverage(conn: Connection, control_ids: Optional[Iterable[int]] = None) -> None:
+    """통제별 집계 재계산 (control_ids=None이면 전체 재구축, 호출 전에 lock_frameworks)"""
+    has_file = exists().where(EvidenceFile.evidence_type_id == EvidenceType.id)
+    last_collected = (
+        select(func.max(EvidenceFile.collected_at))
+        .join(EvidenceType, EvidenceType.id == EvidenceFile.evidence_type_id)
+        .where(EvidenceType.control_id == Control.id)
+        .correlate(Control)
+        .scalar_subquery()
+    )
+    source = (
+        select(
+            Control.id,
+            Control.framework_id,
+            func.count(EvidenceType.id),
+            func.count(EvidenceType.id).filter(has_file),
+            last_collected,
+        )
+        .outerjoin(EvidenceType, EvidenceType.control_id == Control.id)
+        .group_by(Control.id)
+    )
+    if control_ids is not None:
+        source = source.where(Control.id.in_(list(control_ids)))
+
+    stmt = pg_insert(ControlCoverage).from_select(
+        ["control_id", "framework_id", "evidence_total", "evidence_collected", "last_collected_at"],
+        source,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ControlCoverage.control_id],
+        set_={
+            "framework_id": stmt.excluded.framework_id,
+            "evidence_total": stmt.excluded.evidence_total,
+            "evidence_collected": stmt.excluded.evidence_collected,
+            "last_collected_at": stmt.excluded.last_collected_at,
+            "updated_at": func.now(),
+        },
+    )
+    conn.execute(stmt)
+
+
+def refresh_framework_coverage(conn: Connection, framework_ids: Optional[Iterable[int]] = None) -> None:
+    """프레임워크별 집계 재계산 (통제 집계 합산)"""
+    source = select(
+        ControlCoverage.framework_id,
+        func.count(),
+        func.sum(ControlCoverage.evidence_total),
+        func.sum(ControlCoverage.evidence_collected),
+        func.max(ControlCoverage.last_collected_at),
+    ).group_by(ControlCoverage.framework_id)
+    if framework_ids is not None:
+        source = source.where(ControlCoverage.framework_id.in_(list(framework_ids)))
+
+    stmt = pg_insert(FrameworkCoverage).from_select(
+        ["framework_id", "control_total", "evidence_total", "evidence_collected", "last_collected_at"],
+        source,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FrameworkCoverage.framework_id],
+        set_={
+            "control_total": stmt.excluded.control_total,
+            "evidence_total": stmt.excluded.evidence_total,
+            "evidence_collected": stmt.excluded.evidence_collected,
+            "last_collected_at": stmt.excluded.last_collected_at,
+            "updated_at": func.now(),
+        },
+    )
+    conn.execute(stmt)
+
+    # 통제가 모두 삭제된 프레임워크는 집계 행 제거
+    if framework_ids is not None:
+        conn.execute(
+            delete(FrameworkCoverage).where(
+                FrameworkCoverage.framework_id.in_(list(framework_ids)),
+                ~exists().where(ControlCoverage.framework_id == FrameworkCoverage.framework_id),
+            )
+        )
+
+
+def rebuild_coverage(conn: Connection) -> None:
+    """전체 집계 재구축 (기존 데이터 백필용, 여러 번 실행해도 같은 결과)"""
+    lock_frameworks(conn)
+    refresh_control_coverage(conn)
+    refresh_framework_coverage(conn)
+
+
+# ========================================
+# 세션 훅
+# (app.services를 import하는 프로세스(API/워커/시드)에 등록됨)
+# ========================================
+@event.listens_for(Session, "after_flush")
+def _refresh_coverage_after_flush(session: Session, flush_context) -> None:
+    control_ids: set[int] = set()
+    evidence_type_ids: set[int] = set()
+    framework_ids: set[int] = set()
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, EvidenceFile):
+            evidence_type_ids.add(obj.evidence_type_id)
+        elif isinstance(obj, EvidenceType):
+            control_ids.add(obj.control_id)
+        elif isinstance(obj, Control):
+            framework_ids.add(obj.framework_id)
+            if obj not in session.deleted:
+                control_ids.add(obj.id)
+
+    if not (control_ids or evidence_type_ids or framework_ids):
+        return
+
+    conn = session.connection()
+    if evidence_type_ids:
+        control_ids.update(conn.execute(
+            select(EvidenceType.control_id).where(EvidenceType.id.in_(evidence_type_ids))
+        ).scalars())
+
+    # 통제가 속한(옮겨가기 전 포함) 프레임워크를 모두 잠근 뒤 재계산
+    if control_ids:
+        framework_ids.update(conn.execute(
+            select(Control.framework_id).where(Control.id.in_(control_ids))
+        ).scalars())
+        framework_ids.update(conn.execute(
+            select(ControlCoverage.framework_id).where(ControlCoverage.control_id.in_(control_ids))
+        ).scalars())
+    lock_frameworks(conn, framework_ids)
+
+    if control_ids:
+        refresh_control_coverage(conn, control_ids)
+    if framework_ids:
+        refresh_framework_coverage(conn, framework_ids)
+
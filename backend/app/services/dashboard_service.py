@@ -0,0 +1,111 @@
+from datetime import date, datetime, timezone
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.user_cache import AuthUser
+from app.models.coverage import FrameworkCoverage
+from app.models.evidence import Framework
+from app.models.user import User, UserRole
+from app.models.vulnerability import ApprovalRequest, ApprovalStatus, Vulnerability, VulnStatus
+from app.schemas.dashboard import (
+    DashboardResponse,
+    EvidenceCoverageSummary,
+    FrameworkCoverageSummary,
+    TeamOverdue,
+    VulnerabilitySummary,
+)
+
+
+def _percent(part: int, total: int) -> float:
+    return round(part / total * 100, 1) if total else 0.0
+
+
+def dashboard_scope(user: AuthUser) -> str:
+    """캐시 범위 - 역할/팀 + 기능 권한 (같은 범위의 사용자는 같은 스냅샷을 공유)"""
+    team = "*" if user.role == UserRole.ADMIN else (user.team or "-")
+    return f"{user.role.value}:{team}:{int(user.permission_vuln)}{int(user.permission_evidence)}"
+
+
+class DashboardService:
+    """대시보드 집계 - 카드별 집계 쿼리 1개 (증빙 현황은 집계 테이블 조회)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def build(self, user: AuthUser) -> DashboardResponse:
+        all_teams = user.role == UserRole.ADMIN
+        response = DashboardResponse(
+            scope=dashboard_scope(user),
+            generated_at=datetime.now(timezone.utc),
+        )
+        if user.permission_vuln:
+            response.vulnerabilities = await self.get_vulnerability_summary()
+            response.overdue_by_team = await self.get_overdue_by_team(user.team, all_teams)
+            response.approvals_waiting = await self.count_approvals_waiting(user.team, all_teams)
+        if user.permission_evidence:
+            response.evidence = await self.get_evidence_coverage()
+        return response
+
+    async def get_vulnerability_summary(self) -> VulnerabilitySummary:
+        """상태별 건수 (전체 점검 대상)"""
+        result = await self.db.execute(
+            select(Vulnerability.status, func.count()).group_by(Vulnerability.status)
+        )
+        by_status = {vuln_status: 0 for vuln_status in VulnStatus}
+        by_status.update(dict(result.all()))
+        total = sum(by_status.values())
+        return VulnerabilitySummary(total=total, open=total - by_status[VulnStatus.DONE], by_status=by_status)
+
+    async def get_overdue_by_team(self, team: Optional[str], all_teams: bool) -> list[TeamOverdue]:
+        """조치 기한이 지났는데 완료되지 않은 건수 (담당자 팀별, 팀이 없는 사용자는 빈 범위)"""
+        if not all_teams and team is None:
+            return []
+        query = (
+            select(User.team, func.count())
+            .select_from(Vulnerability)
+            .outerjoin(User, User.id == Vulnerability.assignee_id)
+            .where(Vulnerability.due_date < date.today(), Vulnerability.status != VulnStatus.DONE)
+            .group_by(User.team)
+            .order_by(func.count().desc())
+        )
+        if not all_teams:
+            query = query.where(User.team == team)
+        result = await self.db.execute(query)
+        return [TeamOverdue(team=row_team, count=count) for row_team, count in result.all()]
+
+    async def count_approvals_waiting(self, team: Optional[str], all_teams: bool) -> int:
+        """결재 대기 건수 (결재자 팀 기준, 팀이 없는 사용자는 0)"""
+        if not all_teams and team is None:
+            return 0
+        query = select(func.count()).select_from(ApprovalRequest).where(
+            ApprovalRequest.status == ApprovalStatus.PENDING
+        )
+        if not all_teams:
+            query = query.join(User, User.id == ApprovalRequest.approver_id).where(User.team == team)
+        return (await self.db.execute(query)).scalar_one()
+
+    async def get_evidence_coverage(self) -> EvidenceCoverageSummary:
+        """프레임워크별 증빙 수집률 (framework_coverage 집계 테이블)"""
+        result = await self.db.execute(
+            select(Framework.id, Framework.name, FrameworkCoverage.evidence_total, FrameworkCoverage.evidence_collected)
+            .outerjoin(FrameworkCoverage, FrameworkCoverage.framework_id == Framework.id)
+            .order_by(Framework.id)
+        )
+        frameworks = [
+            FrameworkCoverageSummary(
+                framework_id=framework_id,
+                name=name,
+                evidence_total=total or 0,
+                evidence_collected=collected or 0,
+                coverage_percent=_percent(collected or 0, total or 0),
+            )
+            for framework_id, name, total, collected in result.all()
+        ]
+        total = sum(f.evidence_total for f in frameworks)
+        collected = sum(f.evidence_collected for f in frameworks)
+        return EvidenceCoverageSummary(
+            evidence_total=total,
+            evidence_collected=collected,
+            coverage_percent=_percent(collected, total),
+            frameworks=frameworks,
+        )
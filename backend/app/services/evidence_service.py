@@ -0,0 +1,151 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update, Update
+from app.core.dashboard_cache import invalidate_dashboard
+from app.models.evidence import EvidenceType, EvidenceFile, CollectionMethod
+from app.services.evidence_storage import StoredObject
+
+
+# ========================================
+# 버전 할당 (API/수집 워커 공용)
+# ========================================
+def allocate_version_stmt(evidence_type_id: int) -> Update:
+    """
+    유형의 버전 카운터를 1 증가시키고 새 버전을 반환하는 UPDATE ... RETURNING
+    증빙 유형 행을 트랜잭션 종료까지 잠그므로 동시 업로드도 버전이 겹치지 않습니다.
+    """
+    return (
+        update(EvidenceType)
+        .where(EvidenceType.id == evidence_type_id)
+        .values(current_version=EvidenceType.current_version + 1)
+        .returning(EvidenceType.current_version)
+    )
+
+
+def set_current_stmt(evidence_type_id: int, file_id: int) -> Update:
+    return (
+        update(EvidenceType)
+        .where(EvidenceType.id == evidence_type_id)
+        .values(current_file_id=file_id)
+    )
+
+
+def build_evidence_file(
+    evidence_type_id: int,
+    version: int,
+    file_name: str,
+    stored: StoredObject,
+    collection_method: CollectionMethod,
+    execution_id: Optional[int] = None,
+) -> EvidenceFile:
+    return EvidenceFile(
+        evidence_type_id=evidence_type_id,
+        execution_id=execution_id,
+        file_name=file_name,
+        file_path=stored.path,
+        file_size=stored.size,
+        sha256=stored.sha256,
+        version=version,
+        collection_method=collection_method,
+        collected_at=datetime.now(timezone.utc),
+    )
+
+
+def register_file(
+    session: Session,
+    evidence_type_id: int,
+    file_name: str,
+    stored: StoredObject,
+    collection_method: CollectionMethod,
+    execution_id: Optional[int] = None,
+) -> EvidenceFile:
+    """
+    워커(동기 세션)용 새 버전 등록 (커밋은 호출 측)
+    버전 할당 시 증빙 유형 행이 커밋까지 잠기므로 작업 마지막 단계에서 호출합니다.
+    """
+    version = session.execute(allocate_version_stmt(evidence_type_id)).scalar_one()
+    evidence_file = build_evidence_file(
+        evidence_type_id, version, file_name, stored, collection_method, execution_id,
+    )
+    session.add(evidence_file)
+    session.flush()
+    session.execute(set_current_stmt(evidence_type_id, evidence_file.id))
+    return evidence_file
+
+
+class EvidenceService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_type(self, evidence_type_id: int) -> Optional[EvidenceType]:
+        result = await self.db.execute(select(EvidenceType).where(EvidenceType.id == evidence_type_id))
+        return result.scalar_one_or_none()
+
+    async def get_file(self, file_id: int) -> Optional[EvidenceFile]:
+        result = await self.db.execute(select(EvidenceFile).where(EvidenceFile.id == file_id))
+        return result.scalar_one_or_none()
+
+    async def get_current(self, evidence_type_id: int) -> Optional[EvidenceFile]:
+        """
+        유형의 현재 버전 (current_file_id 포인터 조인)
+        현재 파일이 삭제돼 포인터가 NULL이 되면(ON DELETE SET NULL) 남은 최신 버전으로 대체합니다.
+        (포인터가 있으면 COALESCE가 서브쿼리를 실행하지 않음)
+        """
+        latest = (
+            select(EvidenceFile.id)
+            .where(EvidenceFile.evidence_type_id == evidence_type_id)
+            .order_by(EvidenceFile.version.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(EvidenceFile)
+            .join(EvidenceType, func.coalesce(EvidenceType.current_file_id, latest) == EvidenceFile.id)
+            .where(EvidenceType.id == evidence_type_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_history(
+        self,
+        evidence_type_id: int,
+        before_version: int,
+        size: int = 20,
+    ) -> tuple[list[EvidenceFile], Optional[int]]:
+        """before_version 미만 버전을 최신순으로 size개 (다음 페이지 기준 버전 함께 반환)"""
+        result = await self.db.execute(
+            select(EvidenceFile)
+            .where(
+                EvidenceFile.evidence_type_id == evidence_type_id,
+                EvidenceFile.version < before_version,
+            )
+            .order_by(EvidenceFile.version.desc())
+            .limit(size + 1)
+        )
+        files = list(result.scalars().all())
+        if len(files) > size:
+            files = files[:size]
+            return files, files[-1].version
+        return files, None
+
+    async def add_file(
+        self,
+        evidence_type_id: int,
+        file_name: str,
+        stored: StoredObject,
+        collection_method: CollectionMethod = CollectionMethod.MANUAL,
+        execution_id: Optional[int] = None,
+    ) -> EvidenceFile:
+        """저장된 파일을 새 버전으로 등록하고 현재 버전 포인터를 옮김"""
+        version = (await self.db.execute(allocate_version_stmt(evidence_type_id))).scalar_one()
+        evidence_file = build_evidence_file(
+            evidence_type_id, version, file_name, stored, collection_method, execution_id,
+        )
+        self.db.add(evidence_file)
+        await self.db.flush()
+        await self.db.execute(set_current_stmt(evidence_type_id, evidence_file.id))
+        await self.db.commit()
+        await invalidate_dashboard()
+        await self.db.refresh(evidence_file)
+        return evidence_file
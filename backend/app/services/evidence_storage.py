@@ -0,0 +1,113 @@
+"""
+증빙 파일 저장소 (내용 주소 방식)
+
+파일은 SHA-256 해시 기준으로 objects/ab/cd/<sha256> 경로에 한 번만 저장됩니다.
+업로드는 고정 크기 청크로 임시 파일에 쓰면서 해시를 계산하고, 완료 후 원자적으로 이동합니다.
+"""
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator
+import anyio
+from app.core.config import settings
+
+
+class FileTooLargeError(ValueError):
+    pass
+
+
+@dataclass
+class StoredObject:
+    path: str  # STORAGE_PATH 기준 상대 경로
+    size: int
+    sha256: str
+
+
+def object_path(sha256: str) -> str:
+    return os.path.join("objects", sha256[:2], sha256[2:4], sha256)
+
+
+def absolute_path(relative_path: str) -> str:
+    return os.path.join(settings.STORAGE_PATH, relative_path)
+
+
+def _temp_path() -> str:
+    tmp_dir = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    return os.path.join(tmp_dir, uuid.uuid4().hex)
+
+
+def _commit_temp(tmp_path: str, sha256: str) -> str:
+    """임시 파일을 내용 주소 경로로 이동 (이미 같은 내용이 있으면 임시 파일 삭제)"""
+    relative = object_path(sha256)
+    target = absolute_path(relative)
+    if os.path.exists(target):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(tmp_path, target)
+    return relative
+
+
+async def store_stream(chunks: AsyncIterator[bytes]) -> StoredObject:
+    """요청 본문 스트림을 청크 단위로 저장 (본문 전체를 메모리에 올리지 않음)"""
+    max_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    tmp_path = _temp_path()
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with await anyio.open_file(tmp_path, "wb") as out:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise FileTooLargeError(
+                        f"파일 크기는 {settings.MAX_FILE_SIZE_MB}MB를 초과할 수 없습니다."
+                    )
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    sha256 = digest.hexdigest()
+    relative = await anyio.to_thread.run_sync(_commit_temp, tmp_path, sha256)
+    return StoredObject(path=relative, size=size, sha256=sha256)
+
+
+def store_file(src_path: str, chunk_size: int = 1024 * 1024) -> StoredObject:
+    """로컬 파일을 저장소에 복사 (수집 워커용, 청크 단위 해싱)"""
+    tmp_path = _temp_path()
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(src_path, "rb") as src, open(tmp_path, "wb") as out:
+            while chunk := src.read(chunk_size):
+                size += len(chunk)
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    sha256 = digest.hexdigest()
+    return StoredObject(path=_commit_temp(tmp_path, sha256), size=size, sha256=sha256)
+
+
+def store_bytes(data: bytes) -> StoredObject:
+    """메모리의 결과물(스크린샷/PDF 등)을 바로 저장소에 기록"""
+    tmp_path = _temp_path()
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(data)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    sha256 = hashlib.sha256(data).hexdigest()
+    return StoredObject(path=_commit_temp(tmp_path, sha256), size=len(data), sha256=sha256)
@@ -0,0 +1,57 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.evidence import Framework, Control
+from app.models.coverage import ControlCoverage, FrameworkCoverage
+from app.schemas.evidence import FrameworkResponse, ControlResponse
+
+
+class FrameworkService:
+    """프레임워크/통제 조회 (수집 현황은 집계 테이블에서 조인)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _framework_query(self):
+        return select(Framework, FrameworkCoverage).outerjoin(
+            FrameworkCoverage, FrameworkCoverage.framework_id == Framework.id
+        )
+
+    async def get_list(self) -> list[FrameworkResponse]:
+        """프레임워크 목록 + 수집 현황"""
+        result = await self.db.execute(self._framework_query().order_by(Framework.id))
+        return [_framework_response(fw, cov) for fw, cov in result.all()]
+
+    async def get_by_id(self, framework_id: int) -> Optional[FrameworkResponse]:
+        result = await self.db.execute(
+            self._framework_query().where(Framework.id == framework_id)
+        )
+        row = result.first()
+        return _framework_response(*row) if row else None
+
+    async def get_controls(self, framework_id: int) -> list[ControlResponse]:
+        """프레임워크의 통제 목록 + 통제별 수집 현황 (단일 인덱스 조회)"""
+        result = await self.db.execute(
+            select(Control, ControlCoverage)
+            .outerjoin(ControlCoverage, ControlCoverage.control_id == Control.id)
+            .where(Control.framework_id == framework_id)
+            .order_by(Control.code)
+        )
+        return [_control_response(control, cov) for control, cov in result.all()]
+
+
+def _framework_response(framework: Framework, coverage: Optional[FrameworkCoverage]) -> FrameworkResponse:
+    response = FrameworkResponse.model_validate(framework)
+    response.control_total = coverage.control_total if coverage else 0
+    response.evidence_total = coverage.evidence_total if coverage else 0
+    response.evidence_collected = coverage.evidence_collected if coverage else 0
+    response.last_collected_at = coverage.last_collected_at if coverage else None
+    return response
+
+
+def _control_response(control: Control, coverage: Optional[ControlCoverage]) -> ControlResponse:
+    response = ControlResponse.model_validate(control)
+    response.evidence_total = coverage.evidence_total if coverage else 0
+    response.evidence_collected = coverage.evidence_collected if coverage else 0
+    response.last_collected_at = coverage.last_collected_at if coverage else None
+    return response
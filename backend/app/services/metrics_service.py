@@ -0,0 +1,98 @@
+"""
+스크랩 시점 지표 수집기
+
+워커(Celery) 쪽 상태는 API 프로세스의 지표에 남지 않으므로 /metrics 요청 때 원본에서 읽습니다.
+- Celery 큐 길이: Redis 브로커 리스트 길이 (우선순위 하위 큐 포함)
+- 수집 작업 실행 결과/소요시간: job_executions 집계 (행이 지워지지 않는 한 단조 증가)
+"""
+import logging
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from sqlalchemy import func, select
+from app.core.celery_app import celery_app
+from app.core.database import sync_read_session
+from app.core.redis import get_sync_redis
+from app.models.evidence import CollectionJob, JobExecution
+
+logger = logging.getLogger(__name__)
+
+# kombu Redis 전송의 우선순위 큐 이름: "{queue}\x06\x16{priority}" (0은 큐 이름 그대로)
+PRIORITY_SEPARATOR = "\x06\x16"
+PRIORITY_STEPS = (3, 6, 9)
+
+JOB_DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+
+def celery_queues() -> list[str]:
+    queues = {celery_app.conf.task_default_queue}
+    queues.update(route["queue"] for route in (celery_app.conf.task_routes or {}).values())
+    return sorted(queues)
+
+
+class CeleryQueueCollector:
+    """큐별 대기 메시지 수"""
+
+    def collect(self):
+        metric = GaugeMetricFamily(
+            "secuhub_celery_queue_length", "Celery 큐에 쌓인 메시지 수", labels=["queue"],
+        )
+        queues = celery_queues()
+        try:
+            pipe = get_sync_redis().pipeline(transaction=False)
+            for queue in queues:
+                pipe.llen(queue)
+                for step in PRIORITY_STEPS:
+                    pipe.llen(f"{queue}{PRIORITY_SEPARATOR}{step}")
+            lengths = pipe.execute()
+        except Exception:
+            logger.exception("Celery 큐 길이 조회 실패")
+            return
+
+        per_queue = len(PRIORITY_STEPS) + 1
+        for i, queue in enumerate(queues):
+            metric.add_metric([queue], sum(lengths[i * per_queue:(i + 1) * per_queue]))
+        yield metric
+
+
+class JobExecutionCollector:
+    """수집 작업 유형별 실행 결과 수와 소요시간 분포 (쿼리 1회)"""
+
+    def collect(self):
+        duration = func.extract("epoch", JobExecution.finished_at - JobExecution.started_at)
+        query = (
+            select(
+                CollectionJob.job_type,
+                JobExecution.status,
+                func.count(),
+                func.count(duration),
+                func.coalesce(func.sum(duration), 0),
+                *(func.count().filter(duration <= bound) for bound in JOB_DURATION_BUCKETS),
+            )
+            .join(CollectionJob, CollectionJob.id == JobExecution.job_id)
+            .group_by(CollectionJob.job_type, JobExecution.status)
+        )
+        try:
+            with sync_read_session() as session:
+                rows = session.execute(query).all()
+        except Exception:
+            logger.exception("수집 작업 실행 지표 조회 실패")
+            return
+
+        executions = CounterMetricFamily(
+            "secuhub_collection_job_executions",
+            "수집 작업 실행 수 (running 포함)",
+            labels=["job_type", "status"],
+        )
+        durations = HistogramMetricFamily(
+            "secuhub_collection_job_duration_seconds",
+            "종료된 수집 작업 소요시간",
+            labels=["job_type", "status"],
+        )
+        for job_type, status, total, finished, duration_sum, *cumulative in rows:
+            labels = [job_type.value, status.value]
+            executions.add_metric(labels, total)
+            if finished:
+                buckets = [(str(bound), count) for bound, count in zip(JOB_DURATION_BUCKETS, cumulative)]
+                buckets.append(("+Inf", finished))
+                durations.add_metric(labels, buckets, float(duration_sum))
+        yield executions
+        yield durations
@@ -2,7 +2,11 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.models.user import User, UserStatus
-from app.core.security import get_password_hash, verify_password
+from app.core.dashboard_cache import invalidate_dashboard
+from app.core.pagination import CountMode, apply_keyset, count_rows, split_page
+from app.core.search import escape_like
+from app.core.security import get_password_hash_async, verify_password_async
+from app.core.user_cache import user_cache
 from app.schemas.user import UserCreate, UserUpdate
 
 
@@ -25,8 +29,10 @@ class UserService:
         role: Optional[str] = None,
         status: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> tuple[list[User], int]:
-        """사용자 목록 조회 (필터, 페이지네이션)"""
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[User], Optional[int], Optional[str]]:
+        """사용자 목록 조회 (필터, 페이지네이션) - (목록, 총 건수, 다음 커서)"""
         query = select(User)
         count_query = select(func.count()).select_from(User)
 
@@ -38,22 +44,24 @@ class UserService:
             query = query.where(User.status == status)
             count_query = count_query.where(User.status == status)
         if search:
-            search_filter = User.name.ilike(f"%{search}%") | User.email.ilike(f"%{search}%")
+            pattern = f"%{escape_like(search)}%"
+            search_filter = User.name.ilike(pattern, escape="\\") | User.email.ilike(pattern, escape="\\")
             query = query.where(search_filter)
             count_query = count_query.where(search_filter)
 
         # 총 건수
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-
-        # 페이지네이션
-        offset = (page - 1) * size
-        query = query.order_by(User.created_at.desc()).offset(offset).limit(size)
+        total = await count_rows(
+            self.db, count_query, User.__tablename__, count_mode,
+            filtered=bool(role or status or search),
+        )
 
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
+        # 페이지네이션 (cursor가 있으면 keyset, 없으면 offset)
+        if not cursor:
+            query = query.offset((page - 1) * size)
+        result = await self.db.execute(apply_keyset(query, User, cursor, size))
+        users, next_cursor = split_page(result.scalars().all(), size)
 
-        return users, total
+        return users, total, next_cursor
 
     async def create(self, data: UserCreate) -> User:
         """사용자 생성"""
@@ -65,7 +73,7 @@ class UserService:
         user = User(
             email=data.email,
             name=data.name,
-            hashed_password=get_password_hash(data.password),
+            hashed_password=await get_password_hash_async(data.password),
             team=data.team,
             role=data.role,
             permission_evidence=data.permission_evidence,
@@ -87,6 +95,8 @@ class UserService:
             setattr(user, field, value)
 
         await self.db.commit()
+        await user_cache.invalidate(user_id)
+        await invalidate_dashboard()  # 팀별 기한 초과/결재 대기 집계가 사용자 팀 기준
         await self.db.refresh(user)
         return user
 
@@ -98,10 +108,10 @@ class UserService:
         if user is None:
             return False
 
-        if not verify_password(current_password, user.hashed_password):
+        if not await verify_password_async(current_password, user.hashed_password):
             raise ValueError("현재 비밀번호가 일치하지 않습니다.")
 
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await get_password_hash_async(new_password)
         await self.db.commit()
         return True
 
@@ -113,6 +123,8 @@ class UserService:
 
         user.status = UserStatus.INACTIVE
         await self.db.commit()
+        await user_cache.invalidate(user_id)
+        await invalidate_dashboard()
         return True
 
     async def get_approvers(self) -> list[User]:
@@ -0,0 +1,102 @@
+"""
+취약점 관리대장 엑셀 내보내기
+
+서버 측 커서(yield_per)로 필요한 컬럼만 행 단위로 읽어 openpyxl write-only 시트에 바로 기록합니다.
+ORM 객체를 만들지 않으므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+from datetime import date
+from typing import Callable, Optional
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+from app.models.user import User
+from app.models.vulnerability import Assessment, Vulnerability, VulnStatus
+
+EXPORT_COLUMNS = [
+    "점검명", "점검 분류", "자산 구분", "취약 항목", "상태",
+    "담당자", "조치 예정일", "조치 계획", "조치 결과",
+]
+
+STATUS_LABELS = {
+    VulnStatus.UNASSIGNED: "미배정",
+    VulnStatus.PENDING_SCHEDULE: "일정대기",
+    VulnStatus.PENDING_APPROVAL: "결재대기",
+    VulnStatus.IN_PROGRESS: "조치중",
+    VulnStatus.DONE: "완료",
+}
+
+EXPORT_FETCH_SIZE = 1000
+PROGRESS_EVERY = 5000
+
+ProgressCallback = Callable[[int], None]
+
+
+class VulnerabilityExportService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _query(self, assessment_id: Optional[int], status: Optional[str]):
+        assignee = aliased(User)
+        query = (
+            select(
+                Assessment.name,
+                Vulnerability.category,
+                Vulnerability.asset,
+                Vulnerability.item,
+                Vulnerability.status,
+                assignee.name,
+                Vulnerability.due_date,
+                Vulnerability.action_plan,
+                Vulnerability.action_result,
+            )
+            .join(Assessment, Assessment.id == Vulnerability.assessment_id)
+            .outerjoin(assignee, assignee.id == Vulnerability.assignee_id)
+            .order_by(Vulnerability.assessment_id, Vulnerability.id)
+        )
+        if assessment_id:
+            query = query.where(Vulnerability.assessment_id == assessment_id)
+        if status:
+            query = query.where(Vulnerability.status == status)
+        return query.execution_options(yield_per=EXPORT_FETCH_SIZE)
+
+    def export_workbook(
+        self,
+        out_path: str,
+        assessment_id: Optional[int] = None,
+        status: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """조건에 맞는 취약점을 out_path에 xlsx로 기록하고 행 수 반환"""
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("취약점 관리대장")
+        ws.freeze_panes = "A2"
+        bold = Font(bold=True)
+        header = []
+        for name in EXPORT_COLUMNS:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = bold
+            header.append(cell)
+        ws.append(header)
+
+        rows = 0
+        for (
+            assessment_name, category, asset, item, vuln_status,
+            assignee_name, due_date, action_plan, action_result,
+        ) in self.db.execute(self._query(assessment_id, status)):
+            ws.append([
+                assessment_name, category, asset, item, STATUS_LABELS.get(vuln_status, vuln_status),
+                assignee_name, due_date, action_plan, action_result,
+            ])
+            rows += 1
+            if on_progress and rows % PROGRESS_EVERY == 0:
+                on_progress(rows)
+
+        wb.save(out_path)
+        return rows
+
+
+def export_file_name(assessment_id: Optional[int] = None) -> str:
+    suffix = f"_점검{assessment_id}" if assessment_id else ""
+    return f"취약점관리대장{suffix}_{date.today():%Y%m%d}.xlsx"
@@ -0,0 +1,173 @@
+"""
+점검 결과 엑셀 일괄 등록
+
+openpyxl read-only 모드로 행을 한 줄씩 읽고, 배치 단위로 multi-row INSERT 합니다.
+파일 크기와 관계없이 메모리에는 배치 하나 분량의 행만 유지됩니다.
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.vulnerability import Assessment, Vulnerability
+from app.schemas.vulnerability import VulnerabilityCreate
+
+# 엑셀 헤더 → 컬럼 매핑 (공백 제거 / 소문자 비교)
+COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "category": ("점검분류", "분류", "category"),
+    "asset": ("자산구분", "자산", "asset"),
+    "item": ("취약항목", "점검항목", "항목", "item"),
+    "content": ("취약내용", "내용", "content"),
+    "issue": ("현황및문제점", "문제점", "현황", "issue"),
+    "note": ("비고", "note"),
+}
+
+# 제목/설명 행이 앞에 붙은 보고서를 위해 헤더를 찾는 최대 행 수
+HEADER_SCAN_ROWS = 20
+
+
+@dataclass
+class ImportResult:
+    """일괄 등록 결과"""
+    total_rows: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, row: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "message": message})
+
+    def to_dict(self) -> dict:
+        return {
+            "total_rows": self.total_rows,
+            "inserted": self.inserted,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+
+def _normalize_header(value) -> str:
+    return "".join(str(value).split()).lower() if value is not None else ""
+
+
+def _resolve_columns(header: tuple) -> dict[str, int]:
+    """헤더 행에서 필드별 컬럼 인덱스 계산"""
+    normalized = [_normalize_header(v) for v in header]
+    columns: dict[str, int] = {}
+    for field_name, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                columns[field_name] = normalized.index(alias)
+                break
+    return columns
+
+
+def _cell_text(value) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+# 문자열 길이 제한 (VulnerabilityCreate에는 길이 제약이 없어 모델에서 가져옴)
+_MAX_LENGTHS = {
+    name: Vulnerability.__table__.c[name].type.length
+    for name in COLUMN_ALIASES
+    if getattr(Vulnerability.__table__.c[name].type, "length", None)
+}
+
+
+class VulnerabilityImportService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _iter_rows(self, path: str, result: ImportResult) -> Iterator[tuple[int, dict]]:
+        """워크시트를 스트리밍으로 읽어 (행 번호, 필드 dict) 생성"""
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            rows = ws.iter_rows(values_only=True)
+
+            columns: dict[str, int] = {}
+            row_no = 0
+            for header in rows:
+                row_no += 1
+                columns = _resolve_columns(header)
+                if "item" in columns or row_no >= HEADER_SCAN_ROWS:
+                    break
+
+            if "item" not in columns:
+                raise ValueError("엑셀에서 '취약 항목' 헤더를 찾을 수 없습니다.")
+
+            if ws.max_row:
+                result.total_rows = max(ws.max_row - row_no, 0)
+
+            for values in rows:
+                row_no += 1
+                data = {
+                    name: _cell_text(values[idx]) if idx < len(values) else None
+                    for name, idx in columns.items()
+                }
+                if not any(data.values()):
+                    continue  # 빈 행
+                yield row_no, data
+        finally:
+            wb.close()
+
+    def _validate(self, assessment_id: int, data: dict) -> dict:
+        for name, max_length in _MAX_LENGTHS.items():
+            if data.get(name) and len(data[name]) > max_length:
+                raise ValueError(f"{name} 값이 최대 길이({max_length})를 초과합니다.")
+        return VulnerabilityCreate(assessment_id=assessment_id, **data).model_dump()
+
+    def _flush(self, batch: list[dict]) -> None:
+        self.db.execute(insert(Vulnerability).values(batch))
+
+    def import_workbook(
+        self,
+        path: str,
+        assessment_id: int,
+        on_progress: Optional[Callable[[int, ImportResult], None]] = None,
+    ) -> ImportResult:
+        """엑셀 파일을 점검에 일괄 등록 (유효한 행만 단일 트랜잭션으로 커밋)"""
+        assessment = self.db.execute(
+            select(Assessment.id).where(Assessment.id == assessment_id)
+        ).scalar_one_or_none()
+        if assessment is None:
+            raise ValueError("점검을 찾을 수 없습니다.")
+
+        result = ImportResult()
+        batch: list[dict] = []
+        processed = 0
+
+        for row_no, data in self._iter_rows(path, result):
+            processed += 1
+            try:
+                batch.append(self._validate(assessment_id, data))
+            except ValidationError as e:
+                result.add_error(row_no, "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                ))
+            except ValueError as e:
+                result.add_error(row_no, str(e))
+
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                self._flush(batch)
+                result.inserted += len(batch)
+                batch = []
+                if on_progress:
+                    on_progress(processed, result)
+
+        if batch:
+            self._flush(batch)
+            result.inserted += len(batch)
+
+        self.db.commit()
+        result.total_rows = processed
+        if on_progress:
+            on_progress(processed, result)
+        return result
@@ -0,0 +1,279 @@
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, inspect, select, func, or_
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from app.core.pagination import CountMode, apply_keyset, count_rows, split_page
+from app.core.search import (
+    HEADLINE_OPTIONS,
+    SEARCH_CONFIG,
+    escape_like,
+    normalize_query,
+    prefix_tsquery,
+    render_highlight,
+)
+from app.models.user import User
+from app.models.vulnerability import ApprovalRequest, Vulnerability, VulnActionLog
+from app.schemas.user import UserBrief
+from app.schemas.vulnerability import VulnerabilityResponse
+
+# UserBrief에 필요한 컬럼만 로드
+USER_BRIEF_COLUMNS = (User.id, User.name, User.email, User.team, User.role)
+
+
+# ========================================
+# 쿼리 빌더
+# 응답에 포함되는 관계만 즉시 로드하고 나머지는 raiseload로 막아
+# 비동기 세션에서 암묵적 lazy load(N+1, MissingGreenlet)가 생기지 않도록 합니다.
+# ========================================
+def vuln_list_query() -> Select:
+    return select(Vulnerability).options(
+        selectinload(Vulnerability.assignee).load_only(*USER_BRIEF_COLUMNS),
+        selectinload(Vulnerability.approver).load_only(*USER_BRIEF_COLUMNS),
+        raiseload("*"),
+    )
+
+
+def vuln_list_filters(
+    assessment_id: Optional[int] = None,
+    status: Optional[str] = None,
+    assignee_id: Optional[int] = None,
+    approver_id: Optional[int] = None,
+) -> list:
+    filters = []
+    if assessment_id:
+        filters.append(Vulnerability.assessment_id == assessment_id)
+    if status:
+        filters.append(Vulnerability.status == status)
+    if assignee_id:
+        filters.append(Vulnerability.assignee_id == assignee_id)
+    if approver_id:
+        filters.append(Vulnerability.approver_id == approver_id)
+    return filters
+
+
+def vuln_detail_query(vuln_id: int) -> Select:
+    return (
+        select(Vulnerability)
+        .where(Vulnerability.id == vuln_id)
+        .options(
+            joinedload(Vulnerability.assignee).load_only(*USER_BRIEF_COLUMNS),
+            joinedload(Vulnerability.approver).load_only(*USER_BRIEF_COLUMNS),
+            raiseload("*"),
+        )
+    )
+
+
+def action_log_query(vuln_id: int) -> Select:
+    return (
+        select(VulnActionLog)
+        .where(VulnActionLog.vulnerability_id == vuln_id)
+        .options(selectinload(VulnActionLog.user).load_only(*USER_BRIEF_COLUMNS), raiseload("*"))
+    )
+
+
+def approval_query(vuln_id: int) -> Select:
+    return (
+        select(ApprovalRequest)
+        .where(ApprovalRequest.vulnerability_id == vuln_id)
+        .options(
+            selectinload(ApprovalRequest.requester).load_only(*USER_BRIEF_COLUMNS),
+            selectinload(ApprovalRequest.approver).load_only(*USER_BRIEF_COLUMNS),
+            raiseload("*"),
+        )
+        .order_by(ApprovalRequest.created_at.desc(), ApprovalRequest.id.desc())
+    )
+
+
+@lru_cache(maxsize=None)
+def _column_keys(cls) -> tuple[str, ...]:
+    # deferred 컬럼(search_vector 등)은 응답에 없으므로 로드하지 않음
+    return tuple(attr.key for attr in inspect(cls).column_attrs if not attr.deferred)
+
+
+def _columns(obj) -> dict:
+    # 로드된 값은 인스턴스 __dict__에서 바로 (계측 속성 접근이 목록 변환 비용의 대부분)
+    state = obj.__dict__
+    return {key: state[key] if key in state else getattr(obj, key) for key in _column_keys(type(obj))}
+
+
+class UserBriefCache:
+    """요청 단위 UserBrief 캐시 - 같은 사용자가 여러 행에 나와도 변환은 한 번"""
+
+    def __init__(self):
+        self._briefs: dict[int, UserBrief] = {}
+
+    def brief(self, user: Optional[User]) -> Optional[UserBrief]:
+        if user is None:
+            return None
+        cached = self._briefs.get(user.id)
+        if cached is None:
+            cached = self._briefs[user.id] = UserBrief.model_validate(user)
+        return cached
+
+
+class VulnerabilityService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.users = UserBriefCache()
+
+    # ----------------------------------------
+    # 응답 변환
+    # 목록은 *_data(dict)를 모아 core.responses.json_response로 한 번에 검증/직렬화
+    # ----------------------------------------
+    def response_data(self, vuln: Vulnerability) -> dict:
+        return {
+            **_columns(vuln),
+            "assignee": self.users.brief(vuln.assignee),
+            "approver": self.users.brief(vuln.approver),
+        }
+
+    def to_response(self, vuln: Vulnerability) -> VulnerabilityResponse:
+        return VulnerabilityResponse.model_validate(self.response_data(vuln))
+
+    def log_data(self, log: VulnActionLog) -> dict:
+        return {**_columns(log), "user": self.users.brief(log.user)}
+
+    def approval_data(self, request: ApprovalRequest) -> dict:
+        return {
+            **_columns(request),
+            "requester": self.users.brief(request.requester),
+            "approver": self.users.brief(request.approver),
+        }
+
+    def search_hit_data(self, vuln: Vulnerability, rank: float, item_hl, content_hl) -> dict:
+        return {
+            **self.response_data(vuln),
+            "rank": rank,
+            "item_highlight": render_highlight(item_hl),
+            "content_highlight": render_highlight(content_hl),
+        }
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    async def get_by_id(self, vuln_id: int) -> Optional[Vulnerability]:
+        result = await self.db.execute(vuln_detail_query(vuln_id))
+        return result.scalar_one_or_none()
+
+    async def get_list(
+        self,
+        page: int = 1,
+        size: int = 20,
+        assessment_id: Optional[int] = None,
+        status: Optional[str] = None,
+        assignee_id: Optional[int] = None,
+        approver_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        total: Optional[int] = None,
+    ) -> tuple[list[Vulnerability], Optional[int], Optional[str]]:
+        """
+        취약점 목록 조회 (필터, 페이지네이션) - (목록, 총 건수, 다음 커서)
+        total을 넘기면(ETag 계산 때 같은 필터로 센 건수) 다시 세지 않습니다.
+        """
+        filters = vuln_list_filters(assessment_id, status, assignee_id, approver_id)
+
+        if count_mode == CountMode.NONE:
+            total = None
+        elif total is None:
+            total = await count_rows(
+                self.db,
+                select(func.count()).select_from(Vulnerability).where(*filters),
+                Vulnerability.__tablename__,
+                count_mode,
+                filtered=bool(filters),
+            )
+
+        query = vuln_list_query().where(*filters)
+        if not cursor:
+            query = query.offset((page - 1) * size)
+        result = await self.db.execute(apply_keyset(query, Vulnerability, cursor, size))
+        vulns, next_cursor = split_page(result.scalars().all(), size)
+
+        return vulns, total, next_cursor
+
+    async def get_action_logs(
+        self,
+        vuln_id: int,
+        size: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> tuple[list[VulnActionLog], Optional[int], Optional[str]]:
+        """취약점 조치 이력 조회 (최신순 keyset 페이지네이션)"""
+        total = await count_rows(
+            self.db,
+            select(func.count()).select_from(VulnActionLog).where(VulnActionLog.vulnerability_id == vuln_id),
+            VulnActionLog.__tablename__,
+            count_mode,
+            filtered=True,
+        )
+
+        result = await self.db.execute(apply_keyset(action_log_query(vuln_id), VulnActionLog, cursor, size))
+        logs, next_cursor = split_page(result.scalars().all(), size)
+
+        return logs, total, next_cursor
+
+    async def get_approval_requests(self, vuln_id: int) -> list[ApprovalRequest]:
+        """취약점 결재 요청 이력 (최신순)"""
+        result = await self.db.execute(approval_query(vuln_id))
+        return list(result.scalars().all())
+
+    async def search(
+        self,
+        text: str,
+        page: int = 1,
+        size: int = 20,
+        assessment_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> tuple[list[tuple], Optional[int]]:
+        """
+        취약점 검색 - ([(취약점, 점수, 항목 하이라이트, 내용 하이라이트)], 다음 페이지)
+        tsvector 접두 검색(GIN)과 항목/내용 부분 일치(트라이그램 GIN)를 OR로 묶고,
+        ts_rank_cd + 항목 유사도로 정렬합니다. 하이라이트는 현재 페이지 행에만 계산합니다.
+        """
+        text = normalize_query(text)
+        tsquery_text = prefix_tsquery(text)
+        if not text or tsquery_text is None:
+            return [], None
+
+        tsquery = func.to_tsquery(SEARCH_CONFIG, tsquery_text)
+        pattern = f"%{escape_like(text)}%"
+        match = or_(
+            Vulnerability.search_vector.op("@@")(tsquery),
+            Vulnerability.item.ilike(pattern, escape="\\"),
+            Vulnerability.content.ilike(pattern, escape="\\"),
+        )
+        rank = func.ts_rank_cd(Vulnerability.search_vector, tsquery) + func.similarity(Vulnerability.item, text)
+
+        filters = [match]
+        if assessment_id:
+            filters.append(Vulnerability.assessment_id == assessment_id)
+        if status:
+            filters.append(Vulnerability.status == status)
+
+        hits = (
+            select(Vulnerability.id, rank.label("rank"))
+            .where(*filters)
+            .order_by(rank.desc(), Vulnerability.id.desc())
+            .offset((page - 1) * size)
+            .limit(size + 1)
+            .subquery()
+        )
+        query = (
+            vuln_list_query()
+            .join(hits, hits.c.id == Vulnerability.id)
+            .add_columns(
+                hits.c.rank,
+                func.ts_headline(SEARCH_CONFIG, Vulnerability.item, tsquery, HEADLINE_OPTIONS),
+                func.ts_headline(SEARCH_CONFIG, func.coalesce(Vulnerability.content, ""), tsquery, HEADLINE_OPTIONS),
+            )
+            .order_by(hits.c.rank.desc(), Vulnerability.id.desc())
+        )
+        rows = (await self.db.execute(query)).all()
+
+        next_page = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_page = page + 1
+        return [tuple(row) for row in rows], next_page
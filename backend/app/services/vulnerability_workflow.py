@@ -0,0 +1,291 @@
+"""
+취약점 조치 워크플로
+
+상태 전이는 TRANSITIONS 표에 정의된 것만 허용합니다.
+  미배정 ─assign→ 일정대기 ─schedule→ 결재대기 ─approve→ 조치중 ─complete→ 완료
+                     ↑                        │                 │
+                     └────────reject──────────┘                 └─start (중간 결과 보고)
+
+대량 처리는 전이 1건당 UPDATE ... RETURNING 한 번으로 대상 행을 모두 바꾸고,
+조치 이력/결재 요청은 바뀐 행에 대해 다중 행 INSERT로 한 번에 기록합니다.
+현재 상태가 전이 출발 상태가 아닌 행은 UPDATE 조건에서 걸러져 skipped로 보고됩니다.
+"""
+import enum
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dashboard_cache import invalidate_dashboard
+from app.core.notifications import build_event, publish_events
+from app.core.user_cache import AuthUser
+from app.models.user import User, UserRole, UserStatus
+from app.models.vulnerability import (
+    ActionType,
+    ApprovalRequest,
+    ApprovalStatus,
+    VulnActionLog,
+    Vulnerability,
+    VulnStatus,
+)
+
+
+class WorkflowError(ValueError):
+    pass
+
+
+class WorkflowAction(str, enum.Enum):
+    ASSIGN = "assign"        # 담당자 지정
+    SCHEDULE = "schedule"    # 일정 등록 + 결재 요청
+    APPROVE = "approve"      # 결재 승인
+    REJECT = "reject"        # 결재 반려 (일정 재입력)
+    START = "start"          # 조치 중간 결과 보고
+    COMPLETE = "complete"    # 조치 완료
+
+
+@dataclass(frozen=True)
+class Transition:
+    sources: frozenset[VulnStatus]
+    target: VulnStatus
+    action_type: ActionType
+    # 관리자가 아니면 이 컬럼이 본인인 행만 대상
+    actor_scope: Optional[str] = None
+
+
+TRANSITIONS: dict[WorkflowAction, Transition] = {
+    WorkflowAction.ASSIGN: Transition(
+        frozenset({VulnStatus.UNASSIGNED, VulnStatus.PENDING_SCHEDULE}),
+        VulnStatus.PENDING_SCHEDULE,
+        ActionType.ASSIGNED,
+    ),
+    WorkflowAction.SCHEDULE: Transition(
+        frozenset({VulnStatus.PENDING_SCHEDULE}),
+        VulnStatus.PENDING_APPROVAL,
+        ActionType.SCHEDULED,
+        actor_scope="assignee_id",
+    ),
+    WorkflowAction.APPROVE: Transition(
+        frozenset({VulnStatus.PENDING_APPROVAL}),
+        VulnStatus.IN_PROGRESS,
+        ActionType.APPROVED,
+        actor_scope="approver_id",
+    ),
+    WorkflowAction.REJECT: Transition(
+        frozenset({VulnStatus.PENDING_APPROVAL}),
+        VulnStatus.PENDING_SCHEDULE,
+        ActionType.REJECTED,
+        actor_scope="approver_id",
+    ),
+    WorkflowAction.START: Transition(
+        frozenset({VulnStatus.IN_PROGRESS}),
+        VulnStatus.IN_PROGRESS,
+        ActionType.STARTED,
+        actor_scope="assignee_id",
+    ),
+    WorkflowAction.COMPLETE: Transition(
+        frozenset({VulnStatus.IN_PROGRESS}),
+        VulnStatus.DONE,
+        ActionType.COMPLETED,
+        actor_scope="assignee_id",
+    ),
+}
+
+
+# 전이 값으로 지정하는 사용자: (표시 이름, 허용 역할 - None이면 제한 없음)
+USER_FIELDS: dict[str, tuple[str, Optional[frozenset[UserRole]]]] = {
+    "assignee_id": ("담당자", None),
+    "approver_id": ("결재자", frozenset({UserRole.APPROVER, UserRole.ADMIN})),
+}
+
+
+def target_conditions(
+    transition: Transition,
+    actor: AuthUser,
+    vulnerability_ids: Optional[list[int]] = None,
+    assessment_id: Optional[int] = None,
+) -> list:
+    """
+    전이 대상 UPDATE 조건
+    관리자가 아니면 actor_scope 컬럼이 본인인 행으로 제한하고,
+    본인 범위가 없는 전이(관리자 포함)는 대상 지정이 필수입니다.
+    """
+    conditions = [Vulnerability.status.in_(transition.sources)]
+    if vulnerability_ids:
+        conditions.append(Vulnerability.id.in_(vulnerability_ids))
+    if assessment_id:
+        conditions.append(Vulnerability.assessment_id == assessment_id)
+    if transition.actor_scope and actor.role != UserRole.ADMIN:
+        conditions.append(getattr(Vulnerability, transition.actor_scope) == actor.id)
+    elif not vulnerability_ids and not assessment_id:
+        raise WorkflowError("대상 취약점을 지정해야 합니다.")
+    return conditions
+
+
+def check_users(values: dict, users: dict) -> None:
+    """values의 담당자/결재자가 활성 사용자이고 역할이 맞는지 (users: id → role/status 행)"""
+    for field_name, (label, roles) in USER_FIELDS.items():
+        user_id = values.get(field_name)
+        if user_id is None:
+            continue
+        user = users.get(user_id)
+        if user is None or user.status != UserStatus.ACTIVE:
+            raise WorkflowError(f"{label}를 찾을 수 없거나 비활성 사용자입니다.")
+        if roles is not None and user.role not in roles:
+            raise WorkflowError(f"{label}는 팀장 또는 관리자만 지정할 수 있습니다.")
+
+
+@dataclass
+class TransitionResult:
+    action: WorkflowAction
+    updated_ids: list[int] = field(default_factory=list)
+    skipped_ids: list[int] = field(default_factory=list)
+
+
+class VulnerabilityWorkflow:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(
+        self,
+        action: WorkflowAction,
+        actor: AuthUser,
+        vulnerability_ids: Optional[list[int]] = None,
+        assessment_id: Optional[int] = None,
+        values: Optional[dict] = None,
+        comment: Optional[str] = None,
+        attachment_path: Optional[str] = None,
+        reject_reason: Optional[str] = None,
+    ) -> TransitionResult:
+        """
+        대상 취약점에 전이를 일괄 적용
+        대상은 vulnerability_ids / assessment_id로 좁히며, 둘 다 없으면
+        본인 범위(actor_scope)의 전이 가능 행 전체 (관리자는 대상 지정 필수)
+        """
+        transition = TRANSITIONS[action]
+        values = values or {}
+        conditions = target_conditions(transition, actor, vulnerability_ids, assessment_id)
+        # 없는/비활성 사용자는 FK 오류(500) 대신 400으로
+        check_users(values, await self._load_users(values))
+
+        result = await self.db.execute(
+            update(Vulnerability)
+            .where(*conditions)
+            .values(status=transition.target, **values)
+            .returning(Vulnerability.id, Vulnerability.assignee_id, Vulnerability.approver_id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = result.all()
+        updated_ids = sorted(row.id for row in updated)
+
+        if updated_ids:
+            await self._write_logs(updated_ids, actor, transition, comment, attachment_path)
+            if action == WorkflowAction.SCHEDULE:
+                await self._open_approvals(updated_ids, actor, values)
+            elif action in (WorkflowAction.APPROVE, WorkflowAction.REJECT):
+                await self._close_approvals(updated_ids, action, reject_reason)
+        await self.db.commit()
+        if updated_ids:
+            await invalidate_dashboard()
+        await publish_events(self._events(action, transition, actor, updated))
+
+        skipped = sorted(set(vulnerability_ids or ()) - set(updated_ids))
+        return TransitionResult(action=action, updated_ids=updated_ids, skipped_ids=skipped)
+
+    async def _load_users(self, values: dict) -> dict:
+        """values에 지정된 사용자를 한 번에 조회"""
+        user_ids = {values[name] for name in USER_FIELDS if values.get(name) is not None}
+        if not user_ids:
+            return {}
+        result = await self.db.execute(
+            select(User.id, User.role, User.status).where(User.id.in_(user_ids))
+        )
+        return {row.id: row for row in result}
+
+    @staticmethod
+    def _events(action: WorkflowAction, transition: Transition, actor: AuthUser, updated) -> list[dict]:
+        """담당자/결재자에게 보낼 알림 (본인 조치는 본인에게 알리지 않음)"""
+        events = []
+        approval_status = {
+            WorkflowAction.SCHEDULE: ApprovalStatus.PENDING,
+            WorkflowAction.APPROVE: ApprovalStatus.APPROVED,
+            WorkflowAction.REJECT: ApprovalStatus.REJECTED,
+        }.get(action)
+        for row in updated:
+            recipients = {row.assignee_id, row.approver_id} - {actor.id}
+            events.append(build_event(
+                "action_log", recipients,
+                vulnerability_id=row.id,
+                action_type=transition.action_type.value,
+                status=transition.target.value,
+                actor_id=actor.id,
+            ))
+            if approval_status is not None:
+                events.append(build_event(
+                    "approval_request", recipients,
+                    vulnerability_id=row.id,
+                    status=approval_status.value,
+                    actor_id=actor.id,
+                ))
+        return events
+
+    # ----------------------------------------
+    # 부가 기록 (다중 행 INSERT / 일괄 UPDATE)
+    # ----------------------------------------
+    async def _write_logs(
+        self,
+        vuln_ids: list[int],
+        actor: AuthUser,
+        transition: Transition,
+        comment: Optional[str],
+        attachment_path: Optional[str],
+    ) -> None:
+        await self.db.execute(
+            insert(VulnActionLog),
+            [
+                {
+                    "vulnerability_id": vuln_id,
+                    "user_id": actor.id,
+                    "action_type": transition.action_type,
+                    "comment": comment,
+                    "attachment_path": attachment_path,
+                }
+                for vuln_id in vuln_ids
+            ],
+        )
+
+    async def _open_approvals(self, vuln_ids: list[int], actor: AuthUser, values: dict) -> None:
+        await self.db.execute(
+            insert(ApprovalRequest),
+            [
+                {
+                    "vulnerability_id": vuln_id,
+                    "requester_id": actor.id,
+                    "approver_id": values["approver_id"],
+                    "due_date": values.get("due_date"),
+                    "action_plan": values.get("action_plan"),
+                    "status": ApprovalStatus.PENDING,
+                }
+                for vuln_id in vuln_ids
+            ],
+        )
+
+    async def _close_approvals(
+        self,
+        vuln_ids: list[int],
+        action: WorkflowAction,
+        reject_reason: Optional[str],
+    ) -> None:
+        approved = action == WorkflowAction.APPROVE
+        await self.db.execute(
+            update(ApprovalRequest)
+            .where(
+                ApprovalRequest.vulnerability_id.in_(vuln_ids),
+                ApprovalRequest.status == ApprovalStatus.PENDING,
+            )
+            .values(
+                status=ApprovalStatus.APPROVED if approved else ApprovalStatus.REJECTED,
+                approved_at=datetime.now(timezone.utc) if approved else None,
+                reject_reason=None if approved else reject_reason,
+            )
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,78 @@
+import logging
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+from app.collectors import CollectionError, get_collector
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.dashboard_cache import invalidate_dashboard_sync
+from app.core.database import sync_session
+from app.core.redis import get_sync_redis, try_acquire_slot
+from app.models.evidence import CollectionJob, ExecutionStatus, JobExecution
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def job_slot(job_id: int) -> Iterator[bool]:
+    """
+    작업별 동시 실행 제한 (한도 초과면 False, 대기하지 않음)
+    슬롯은 실행별 토큰을 만료 시각 점수로 둔 sorted set 항목이라 (collectors.web_scraping.host_slot과 같은 방식),
+    워커가 비정상 종료해 반납하지 못한 슬롯도 COLLECTION_JOB_TIMEOUT_SECONDS 뒤에는 다음 실행이 정리합니다.
+    """
+    redis = get_sync_redis()
+    key = f"secuhub:collection:slots:{job_id}"  # 이전 카운터 키(running)와 타입이 달라 새 이름 사용
+    token = uuid.uuid4().hex
+    if not try_acquire_slot(
+        redis, key, token, settings.COLLECTION_JOB_MAX_CONCURRENCY, settings.COLLECTION_JOB_TIMEOUT_SECONDS
+    ):
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        redis.zrem(key, token)
+
+
+@celery_app.task(
+    name="collection.run_job",
+    soft_time_limit=settings.COLLECTION_JOB_TIMEOUT_SECONDS,
+)
+def run_collection_job(job_id: int) -> Optional[int]:
+    """수집 작업 1회 실행 - JobExecution 기록 후 유형별 수집기 호출"""
+    with job_slot(job_id) as acquired:
+        if not acquired:
+            logger.info("수집 작업 %s: 이전 실행이 진행 중이라 건너뜁니다.", job_id)
+            return None
+
+        with sync_session() as session:
+            job = session.get(CollectionJob, job_id)
+            if job is None or not job.is_active:
+                return None
+
+            execution = JobExecution(
+                job_id=job.id,
+                status=ExecutionStatus.RUNNING,
+                started_at=datetime.now(timezone.utc),
+            )
+            session.add(execution)
+            session.commit()
+
+            try:
+                collector = get_collector(job.job_type)
+                collector(job, execution, session)
+                execution.status = ExecutionStatus.SUCCESS
+            except Exception as e:
+                logger.exception("수집 작업 %s 실패", job_id)
+                session.rollback()
+                execution.status = ExecutionStatus.FAILED
+                execution.error_message = str(e) or e.__class__.__name__
+                if isinstance(e, CollectionError) and e.trace_file_path:
+                    execution.trace_file_path = e.trace_file_path
+
+            execution.finished_at = datetime.now(timezone.utc)
+            session.commit()
+            if execution.status == ExecutionStatus.SUCCESS:
+                invalidate_dashboard_sync()  # 증빙 파일 새 버전 등록
+            return execution.id
@@ -0,0 +1,155 @@
+"""
+수집 작업 스케줄러 (Celery beat)
+
+CollectionJob.schedule_cron을 DB에서 읽어 다음 실행 시각을 힙으로 관리합니다.
+- 작업 추가/수정/비활성화는 COLLECTION_SCHEDULE_SYNC_SECONDS마다 반영 (beat 재시작 불필요)
+- 같은 시각에 몰린 작업은 작업 ID 기반 고정 지연(jitter)으로 분산
+- 정적 beat_schedule 항목은 기본 PersistentScheduler가 그대로 처리
+"""
+import heapq
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from celery.beat import PersistentScheduler
+from celery.schedules import crontab
+from sqlalchemy import select, func
+from app.core.config import settings
+from app.core.database import sync_session
+from app.models.evidence import CollectionJob
+
+logger = logging.getLogger(__name__)
+
+
+def parse_cron(expr: str, app=None) -> crontab:
+    """'분 시 일 월 요일' 5필드 cron 문자열 → crontab"""
+    fields = expr.split()
+    if len(fields) != 5:
+        raise ValueError(f"cron 형식이 올바르지 않습니다: {expr!r}")
+    minute, hour, day_of_month, month_of_year, day_of_week = fields
+    return crontab(
+        minute=minute,
+        hour=hour,
+        day_of_month=day_of_month,
+        month_of_year=month_of_year,
+        day_of_week=day_of_week,
+        app=app,
+    )
+
+
+def job_jitter(job_id: int) -> int:
+    """작업별 고정 지연(초) - 매 실행 같은 오프셋으로 대상 시스템 부하 분산"""
+    if settings.COLLECTION_JITTER_SECONDS <= 0:
+        return 0
+    return (job_id * 2654435761) % settings.COLLECTION_JITTER_SECONDS
+
+
+@dataclass
+class ScheduledJob:
+    job_id: int
+    cron: crontab
+    signature: tuple  # (schedule_cron, updated_at) - 변경 감지용
+    generation: int   # 힙에 남은 이전 항목 무효화용
+
+
+class CollectionScheduler(PersistentScheduler):
+    def __init__(self, *args, **kwargs):
+        self._jobs: dict[int, ScheduledJob] = {}
+        self._job_heap: list[tuple[float, int, int]] = []  # (실행 시각, job_id, generation)
+        self._generation = 0
+        self._next_sync = 0.0
+        self._last_fingerprint: Optional[tuple] = None
+        super().__init__(*args, **kwargs)
+
+    # ----------------------------------------
+    # DB 동기화
+    # ----------------------------------------
+    def _next_fire(self, entry: ScheduledJob, after: datetime) -> float:
+        remaining = entry.cron.remaining_estimate(after)
+        return time.time() + max(remaining.total_seconds(), 0)
+
+    def sync_jobs(self) -> None:
+        """활성 작업 목록을 다시 읽어 추가/변경/삭제 반영"""
+        with sync_session() as session:
+            active = (
+                CollectionJob.is_active.is_(True),
+                CollectionJob.schedule_cron.isnot(None),
+            )
+            fingerprint = tuple(session.execute(
+                select(func.count(), func.max(CollectionJob.updated_at)).where(*active)
+            ).one())
+            if fingerprint == self._last_fingerprint:
+                return
+
+            rows = session.execute(
+                select(CollectionJob.id, CollectionJob.schedule_cron, CollectionJob.updated_at).where(*active)
+            ).all()
+
+        now = self.app.now()
+        seen: set[int] = set()
+        for job_id, cron_expr, updated_at in rows:
+            seen.add(job_id)
+            signature = (cron_expr, updated_at)
+            current = self._jobs.get(job_id)
+            if current is not None and current.signature == signature:
+                continue
+            try:
+                cron = parse_cron(cron_expr, app=self.app)
+            except ValueError as e:
+                logger.warning("수집 작업 %s 스케줄 무시: %s", job_id, e)
+                self._jobs.pop(job_id, None)
+                continue
+
+            self._generation += 1
+            entry = ScheduledJob(job_id, cron, signature, self._generation)
+            self._jobs[job_id] = entry
+            heapq.heappush(self._job_heap, (self._next_fire(entry, now), job_id, entry.generation))
+
+        for job_id in set(self._jobs) - seen:
+            del self._jobs[job_id]  # 힙 항목은 꺼낼 때 generation 불일치로 버림
+
+        self._last_fingerprint = fingerprint
+        logger.info("수집 스케줄 동기화: 활성 작업 %d개", len(self._jobs))
+
+    # ----------------------------------------
+    # 실행
+    # ----------------------------------------
+    def dispatch(self, entry: ScheduledJob) -> None:
+        from app.tasks.collection import run_collection_job
+
+        jitter = job_jitter(entry.job_id)
+        run_collection_job.apply_async(
+            args=[entry.job_id],
+            countdown=jitter,
+            # 워커 적체 시 다음 주기와 겹치지 않도록 오래된 실행은 폐기
+            expires=jitter + settings.COLLECTION_JOB_TIMEOUT_SECONDS,
+        )
+
+    def tick(self, *args, **kwargs) -> float:
+        delay = super().tick(*args, **kwargs)
+
+        now = time.time()
+        if now >= self._next_sync:
+            try:
+                self.sync_jobs()
+            except Exception:
+                logger.exception("수집 스케줄 동기화 실패")
+            self._next_sync = now + settings.COLLECTION_SCHEDULE_SYNC_SECONDS
+
+        heap = self._job_heap
+        while heap and heap[0][0] <= now:
+            _, job_id, generation = heapq.heappop(heap)
+            entry = self._jobs.get(job_id)
+            if entry is None or entry.generation != generation:
+                continue
+            try:
+                self.dispatch(entry)
+            except Exception:
+                logger.exception("수집 작업 %s 발행 실패", job_id)
+            heapq.heappush(heap, (self._next_fire(entry, self.app.now()), job_id, generation))
+
+        waits = [delay, self._next_sync - now]
+        if heap:
+            waits.append(heap[0][0] - now)
+        return max(min(waits), 0)
@@ -0,0 +1,134 @@
+"""
+조치 기한(SLA) 점검 (Celery beat, 매일 SLA_SWEEP_HOUR시)
+
+미완료 취약점 중 기한이 지났거나 SLA_DUE_SOON_DAYS일 이내인 건을
+부분 인덱스(ix_vulnerabilities_due_date_open) 범위 조회 한 번으로 읽고,
+담당자/결재자별로 묶어 사람당 요약 알림 1건을 발행합니다.
+
+같은 날 다시 실행돼도(beat 재시작, 수동 실행) 사람당 하루 1건만 나가도록
+(날짜, 사용자) 발송 권한을 SET NX로 확보하는데, 같은 스크립트 안에서 요약을 보관 알림
+(notifications.pending_key)으로 함께 저장합니다. 권한을 얻은 요약은 항상 보관되므로
+pub/sub 발행을 놓친 오프라인 사용자도 다음 스트림 연결 때 받습니다.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from sqlalchemy import Select, func, select, union_all
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import sync_read_session
+from app.core.notifications import build_event, pending_key, pending_message, publish_events_sync
+from app.core.redis import get_sync_redis
+from app.models.vulnerability import Vulnerability, VulnStatus
+
+logger = logging.getLogger(__name__)
+
+DIGEST_KEY_PREFIX = "secuhub:sla:digest:"
+DIGEST_KEY_TTL_SECONDS = 2 * 24 * 3600
+
+# KEYS[1]=발송 권한 키, KEYS[2]=보관 알림 키, ARGV=[요약 메시지, TTL]
+_CLAIM_AND_STORE = """
+if redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[2]) then
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+def sweep_query(today: date) -> Select:
+    """
+    사용자별 요약 (user_id, 초과 건수, 임박 건수, 초과 ID/기한, 임박 ID/기한)
+    대상 행은 부분 인덱스 조건(status <> 'DONE')을 그대로 포함해 인덱스 범위 조회로 읽고,
+    담당자/결재자로 펼친 뒤 DB에서 묶어 사람당 한 행만 가져옵니다.
+    """
+    due = (
+        select(Vulnerability.id, Vulnerability.due_date, Vulnerability.assignee_id, Vulnerability.approver_id)
+        .where(
+            Vulnerability.status != VulnStatus.DONE,
+            Vulnerability.due_date <= today + timedelta(days=settings.SLA_DUE_SOON_DAYS),
+        )
+        .cte("due")
+    )
+    recipients = union_all(
+        select(due.c.assignee_id.label("user_id"), due.c.id, due.c.due_date)
+        .where(due.c.assignee_id.is_not(None)),
+        # 담당자와 결재자가 같은 사람이면 한 번만
+        select(due.c.approver_id, due.c.id, due.c.due_date)
+        .where(due.c.approver_id.is_not(None), due.c.approver_id.is_distinct_from(due.c.assignee_id)),
+    ).subquery("recipients")
+
+    overdue = recipients.c.due_date < today
+    limit = settings.SLA_DIGEST_MAX_ITEMS
+
+    def first_items(column, condition):
+        ordered = aggregate_order_by(column, recipients.c.due_date, recipients.c.id)
+        return array_agg(ordered).filter(condition)[1:limit]
+
+    return select(
+        recipients.c.user_id,
+        func.count().filter(overdue),
+        func.count().filter(~overdue),
+        first_items(recipients.c.id, overdue),
+        first_items(recipients.c.due_date, overdue),
+        first_items(recipients.c.id, ~overdue),
+        first_items(recipients.c.due_date, ~overdue),
+    ).group_by(recipients.c.user_id)
+
+
+def digest_data(row, today: date) -> dict:
+    _, overdue_count, due_soon_count, overdue_ids, overdue_dates, soon_ids, soon_dates = row
+
+    def items(ids, dates) -> list[dict]:
+        return [
+            {"vulnerability_id": vuln_id, "due_date": due_date.isoformat()}
+            for vuln_id, due_date in zip(ids or (), dates or ())
+        ]
+
+    return {
+        "date": today.isoformat(),
+        "overdue_count": overdue_count,
+        "due_soon_count": due_soon_count,
+        "overdue": items(overdue_ids, overdue_dates),
+        "due_soon": items(soon_ids, soon_dates),
+    }
+
+
+def claim_and_store(events: dict[int, dict], today: date) -> list[int]:
+    """
+    오늘 아직 요약을 받지 않은 사용자만 발송 권한을 얻고 요약을 보관 (사용자별로 원자적)
+    권한을 얻은 사용자 ID 반환
+    """
+    redis = get_sync_redis()
+    claim = redis.register_script(_CLAIM_AND_STORE)
+    pipe = redis.pipeline(transaction=False)
+    user_ids = sorted(events)
+    for user_id in user_ids:
+        claim(
+            keys=[f"{DIGEST_KEY_PREFIX}{today.isoformat()}:{user_id}", pending_key(user_id, "sla_digest")],
+            args=[pending_message(events[user_id]), DIGEST_KEY_TTL_SECONDS],
+            client=pipe,
+        )
+    return [user_id for user_id, claimed in zip(user_ids, pipe.execute()) if claimed]
+
+
+@celery_app.task(name="vulnerabilities.sla_sweep")
+def sweep_vulnerability_sla() -> dict:
+    """기한 초과/임박 취약점 요약 알림 (사람당 하루 1건)"""
+    today = datetime.now(ZoneInfo(celery_app.conf.timezone)).date()
+    with sync_read_session() as session:
+        digests = {row[0]: row for row in session.execute(sweep_query(today))}
+
+    events = {
+        user_id: build_event("sla_digest", [user_id], **digest_data(row, today))
+        for user_id, row in digests.items()
+    }
+    recipients = claim_and_store(events, today)
+    # 접속 중인 사용자에게 바로 전달 (실패해도 보관본이 다음 연결 때 전달됨)
+    if not publish_events_sync([events[user_id] for user_id in recipients]):
+        logger.warning("SLA 요약 실시간 발행 실패 - %d명은 다음 연결 때 전달", len(recipients))
+
+    skipped = len(digests) - len(recipients)
+    logger.info("SLA 점검: 요약 대상 %d명 중 %d명 발송 (%d명은 오늘 이미 발송)", len(digests), len(recipients), skipped)
+    return {"recipients": len(digests), "sent": len(recipients), "skipped": skipped}
@@ -0,0 +1,48 @@
+import os
+import uuid
+from typing import Optional
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.dashboard_cache import invalidate_dashboard_sync
+from app.core.database import sync_read_session, sync_session
+from app.models.evidence import CollectionMethod
+from app.services.evidence_service import register_file
+from app.services.evidence_storage import store_file
+from app.services.vulnerability_export_service import VulnerabilityExportService, export_file_name
+
+
+@celery_app.task(bind=True, name="vulnerabilities.export_excel")
+def export_vulnerabilities_excel(
+    self,
+    evidence_type_id: int,
+    assessment_id: Optional[int] = None,
+    status: Optional[str] = None,
+) -> dict:
+    """취약점 관리대장 내보내기 → 증빙 파일 새 버전으로 등록 (진행률은 PROGRESS meta)"""
+    tmp_dir = os.path.join(settings.STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    out_path = os.path.join(tmp_dir, f"export_{uuid.uuid4().hex}.xlsx")
+
+    def report(rows: int) -> None:
+        self.update_state(state="PROGRESS", meta={"rows": rows})
+
+    try:
+        # 대량 조회는 복제본, 증빙 등록만 주 DB
+        with sync_read_session() as session:
+            rows = VulnerabilityExportService(session).export_workbook(
+                out_path, assessment_id=assessment_id, status=status, on_progress=report,
+            )
+        with sync_session() as session:
+            evidence_file = register_file(
+                session,
+                evidence_type_id,
+                export_file_name(assessment_id),
+                store_file(out_path),
+                CollectionMethod.AUTO,
+            )
+            session.commit()
+            invalidate_dashboard_sync()
+            return {"rows": rows, "evidence_file_id": evidence_file.id}
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
@@ -0,0 +1,27 @@
+import os
+from app.core.celery_app import celery_app
+from app.core.dashboard_cache import invalidate_dashboard_sync
+from app.core.database import sync_session
+from app.services.vulnerability_import_service import ImportResult, VulnerabilityImportService
+
+
+@celery_app.task(bind=True, name="vulnerabilities.import_excel")
+def import_vulnerabilities_excel(self, assessment_id: int, file_path: str) -> dict:
+    """점검 결과 엑셀 일괄 등록 (진행률은 PROGRESS 상태 meta로 보고)"""
+
+    def report(processed: int, result: ImportResult) -> None:
+        self.update_state(
+            state="PROGRESS",
+            meta={"processed": processed, **result.to_dict()},
+        )
+
+    try:
+        with sync_session() as session:
+            service = VulnerabilityImportService(session)
+            result = service.import_workbook(file_path, assessment_id, on_progress=report)
+        if result.inserted:
+            invalidate_dashboard_sync()
+        return {"processed": result.total_rows, **result.to_dict()}
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
@@ -0,0 +1,10 @@
+"""
+API 성능 기준선 측정
+
+실행 (backend/ 에서):
+    python -m benchmarks.run --reset --vulnerabilities 50000 --output bench.json
+    python -m benchmarks.run --compare bench.json
+
+--reset은 DATABASE_URL 대상 DB의 테이블을 모두 지우고 다시 만드므로 벤치마크 전용 DB에서만 지정하세요.
+(지정하지 않으면 기존 데이터로 측정)
+"""
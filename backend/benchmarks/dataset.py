@@ -0,0 +1,151 @@
+"""
+벤치마크용 합성 데이터 (app.core.seed의 기본 데이터 + 규모별 대량 데이터)
+"""
+import hashlib
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import Base, async_session, engine
+from app.core.security import get_password_hash
+from app.core.seed import build_user, seed_assessments, seed_frameworks, seed_users
+from app.models import Assessment, CollectionMethod, EvidenceType, UserRole, Vulnerability, VulnStatus
+from app.services.evidence_service import build_evidence_file, set_current_stmt
+from app.services.evidence_storage import StoredObject, object_path
+
+BENCH_PASSWORD = "bench1234"
+BATCH_SIZE = 2000
+TEAMS = ["백엔드팀", "프론트팀", "인프라팀", "보안팀", "데이터팀"]
+CATEGORIES = ["웹 취약점", "인프라", "데이터 보안", "인증/권한", "설정 오류"]
+ITEMS = ["SQL Injection", "XSS", "CSRF", "불필요 포트 오픈", "민감정보 평문저장", "인증 우회", "디렉터리 리스팅"]
+
+
+@dataclass
+class Scale:
+    users: int = 500
+    assessments: int = 20
+    vulnerabilities: int = 20000
+    evidence_files: int = 2000
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+async def _add_batches(session: AsyncSession, objects) -> int:
+    count = 0
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= BATCH_SIZE:
+            session.add_all(batch)
+            await session.flush()
+            session.expunge_all()
+            count += len(batch)
+            batch = []
+    if batch:
+        session.add_all(batch)
+        await session.flush()
+        session.expunge_all()
+        count += len(batch)
+    return count
+
+
+def _vulnerabilities(scale: Scale, assessment_ids: list[int], user_ids: list[int], approver_ids: list[int], rng):
+    statuses = list(VulnStatus)
+    today = date.today()
+    for i in range(scale.vulnerabilities):
+        vuln_status = statuses[i % len(statuses)]
+        assigned = vuln_status != VulnStatus.UNASSIGNED
+        scheduled = vuln_status not in (VulnStatus.UNASSIGNED, VulnStatus.PENDING_SCHEDULE)
+        yield Vulnerability(
+            assessment_id=assessment_ids[i % len(assessment_ids)],
+            category=CATEGORIES[i % len(CATEGORIES)],
+            asset=f"자산-{i % 300:03d}",
+            item=f"{ITEMS[i % len(ITEMS)]} #{i}",
+            content=f"{ITEMS[i % len(ITEMS)]} 취약점 상세 내용 {i}",
+            issue="공격자가 권한 없이 데이터에 접근 가능",
+            assignee_id=rng.choice(user_ids) if assigned else None,
+            approver_id=rng.choice(approver_ids) if scheduled else None,
+            due_date=today + timedelta(days=rng.randint(-60, 60)) if scheduled else None,
+            status=vuln_status,
+        )
+
+
+async def _seed_evidence_files(session: AsyncSession, scale: Scale) -> None:
+    """증빙 유형마다 버전을 나눠 등록하고 현재 버전 포인터를 맞춤"""
+    type_ids = list((await session.execute(select(EvidenceType.id).order_by(EvidenceType.id))).scalars())
+    per_type = max(1, scale.evidence_files // len(type_ids))
+    collected_at = datetime.now(timezone.utc)
+    for type_id in type_ids:
+        files = []
+        for version in range(1, per_type + 1):
+            sha256 = hashlib.sha256(f"{type_id}:{version}".encode()).hexdigest()
+            stored = StoredObject(path=object_path(sha256), size=1024 * version, sha256=sha256)
+            evidence_file = build_evidence_file(
+                type_id, version, f"evidence_{type_id}_v{version}.xlsx", stored, CollectionMethod.AUTO,
+            )
+            evidence_file.collected_at = collected_at
+            files.append(evidence_file)
+        session.add_all(files)
+        await session.flush()
+        await session.execute(
+            update(EvidenceType).where(EvidenceType.id == type_id).values(current_version=per_type)
+        )
+        await session.execute(set_current_stmt(type_id, files[-1].id))
+        session.expunge_all()
+
+
+async def seed_dataset(scale: Scale, seed: int = 42) -> None:
+    """대상 DB의 테이블을 모두 지우고 합성 데이터 생성 (run.py --reset으로만 호출)"""
+    if settings.ENVIRONMENT == "production":
+        raise RuntimeError("운영 환경에서는 벤치마크 데이터를 생성할 수 없습니다.")
+    rng = random.Random(seed)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_session() as session:
+        async with session.begin():
+            users = await seed_users(session)
+            await seed_frameworks(session)
+            await seed_assessments(session, users)
+
+            hashed = get_password_hash(BENCH_PASSWORD)
+            extra_users = [
+                build_user(
+                    f"bench{i:06d}@company.com",
+                    f"사용자{i:06d}",
+                    TEAMS[i % len(TEAMS)],
+                    UserRole.APPROVER if i % 10 == 0 else UserRole.DEVELOPER,
+                    hashed_password=hashed,
+                )
+                for i in range(scale.users)
+            ]
+            session.add_all(extra_users)
+            await session.flush()
+            user_ids = [u.id for u in users + extra_users]
+            approver_ids = [u.id for u in users + extra_users if u.role == UserRole.APPROVER]
+
+            assessments = [
+                Assessment(name=f"벤치마크 점검 {i:03d}", assessor="벤치마크", assessed_at=date.today())
+                for i in range(scale.assessments)
+            ]
+            session.add_all(assessments)
+            await session.flush()
+            assessment_ids = [a.id for a in assessments] or [1]
+            session.expunge_all()
+
+            created = await _add_batches(
+                session, _vulnerabilities(scale, assessment_ids, user_ids, approver_ids, rng),
+            )
+            print(f"  ✓ 사용자 {len(extra_users)}명, 점검 {len(assessments)}개, 취약점 {created}개 추가")
+
+            await _seed_evidence_files(session, scale)
+            print(f"  ✓ 증빙 파일 약 {scale.evidence_files}개 추가")
+
+    async with engine.begin() as conn:
+        for table in ("users", "vulnerabilities", "evidence_files", "approval_requests"):
+            await conn.exec_driver_sql(f"ANALYZE {table}")
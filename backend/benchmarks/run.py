@@ -0,0 +1,259 @@
+"""
+in-process 부하 측정 (httpx → ASGI 앱 직접 호출, 네트워크/uvicorn 제외)
+
+시나리오별로 지연시간 p50/p95/p99와 요청당 SQL 실행 수를 재고 JSON으로 저장합니다.
+--compare로 이전 결과를 넘기면 p95/쿼리 수 변화를 함께 출력합니다.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+import httpx
+from sqlalchemy import event, select
+from app.core.database import all_engines, async_session
+from app.main import app
+from app.models import EvidenceType, Vulnerability
+from benchmarks.dataset import BENCH_PASSWORD, Scale, seed_dataset
+
+API = "/api/v1"
+ADMIN = ("admin@company.com", "admin1234")
+
+
+# ========================================
+# SQL 실행 수 집계
+# ========================================
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+    def install(self) -> None:
+        for db_engine in all_engines():
+            event.listen(db_engine.sync_engine, "before_cursor_execute", self)
+
+
+# ========================================
+# 시나리오
+# ========================================
+@dataclass
+class Scenario:
+    name: str
+    request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+    requests: Optional[int] = None  # None이면 --requests
+
+
+@dataclass
+class Fixtures:
+    vulnerability_ids: list[int]
+    evidence_type_ids: list[int]
+    bench_emails: list[str]
+
+
+async def load_fixtures() -> Fixtures:
+    async with async_session() as session:
+        vuln_ids = list((await session.execute(
+            select(Vulnerability.id).order_by(Vulnerability.id.desc()).limit(1000)
+        )).scalars())
+        type_ids = list((await session.execute(select(EvidenceType.id))).scalars())
+    return Fixtures(vuln_ids, type_ids, [f"bench{i:06d}@company.com" for i in range(10)])
+
+
+def build_scenarios(fixtures: Fixtures, login_requests: int) -> list[Scenario]:
+    rng = random.Random(7)
+
+    def login(client):
+        return client.post(f"{API}/auth/login", json={
+            "email": rng.choice(fixtures.bench_emails), "password": BENCH_PASSWORD,
+        })
+
+    return [
+        Scenario("auth.login", login, requests=login_requests),
+        Scenario("auth.me", lambda c: c.get(f"{API}/auth/me")),
+        Scenario("users.list", lambda c: c.get(f"{API}/users", params={"size": 50})),
+        Scenario("users.list_keyset", lambda c: c.get(f"{API}/users", params={"size": 50, "count": "none"})),
+        Scenario("users.search", lambda c: c.get(f"{API}/users", params={"size": 20, "search": "사용자00"})),
+        Scenario("vulnerabilities.list", lambda c: c.get(f"{API}/vulnerabilities", params={"size": 50})),
+        Scenario(
+            "vulnerabilities.list_filtered",
+            lambda c: c.get(f"{API}/vulnerabilities", params={"size": 50, "status": "in_progress", "count": "none"}),
+        ),
+        Scenario(
+            "vulnerabilities.detail",
+            lambda c: c.get(f"{API}/vulnerabilities/{rng.choice(fixtures.vulnerability_ids)}"),
+        ),
+        Scenario(
+            "vulnerabilities.logs",
+            lambda c: c.get(f"{API}/vulnerabilities/{rng.choice(fixtures.vulnerability_ids)}/logs"),
+        ),
+        Scenario("frameworks.list", lambda c: c.get(f"{API}/frameworks")),
+        Scenario(
+            "evidence.files",
+            lambda c: c.get(f"{API}/evidence/types/{rng.choice(fixtures.evidence_type_ids)}/files"),
+        ),
+        Scenario("dashboard", lambda c: c.get(f"{API}/dashboard")),
+    ]
+
+
+# ========================================
+# 측정
+# ========================================
+def summarize(latencies: list[float], errors: int, queries: int, elapsed: float) -> dict:
+    latencies_ms = sorted(value * 1000 for value in latencies)
+    cuts = statistics.quantiles(latencies_ms, n=100, method="inclusive") if len(latencies_ms) > 1 else latencies_ms * 99
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "mean_ms": round(statistics.fmean(latencies_ms), 3),
+        "max_ms": round(latencies_ms[-1], 3),
+        "rps": round(len(latencies_ms) / elapsed, 1) if elapsed else None,
+        "queries_per_request": round(queries / len(latencies_ms), 2),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    counter: QueryCounter,
+    requests: int,
+    warmup: int,
+    concurrency: int,
+) -> dict:
+    for _ in range(warmup):
+        await scenario.request(client)
+
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await scenario.request(client)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    counter.count = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return summarize(latencies, errors, counter.count, time.perf_counter() - started)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: dict, baseline: Optional[dict]) -> None:
+    header = f"{'scenario':32} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6} {'err':>4}"
+    if baseline:
+        header += f" {'Δp95':>8} {'Δq/req':>7}"
+    print(header)
+    for name, r in results.items():
+        line = f"{name:32} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f} {r['queries_per_request']:6.1f} {r['errors']:4d}"
+        before = (baseline or {}).get(name)
+        if before:
+            line += f" {r['p95_ms'] - before['p95_ms']:+8.2f} {r['queries_per_request'] - before['queries_per_request']:+7.1f}"
+        print(line)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    # SQL 로그가 측정을 왜곡하지 않도록
+    for db_engine in all_engines():
+        db_engine.echo = False
+    logging.disable(logging.ERROR)  # 실패는 시나리오별 errors로 집계
+
+    scale = Scale(args.users, args.assessments, args.vulnerabilities, args.evidence_files)
+    if args.reset:
+        print(f"🌱 벤치마크 데이터 생성 (DB 초기화): {scale}")
+        await seed_dataset(scale)
+
+    counter = QueryCounter()
+    counter.install()
+    fixtures = await load_fixtures()
+    scenarios = build_scenarios(fixtures, args.login_requests)
+    if args.scenario:
+        scenarios = [s for s in scenarios if any(s.name.startswith(prefix) for prefix in args.scenario)]
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post(f"{API}/auth/login", json={"email": ADMIN[0], "password": ADMIN[1]})
+        response.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        for scenario in scenarios:
+            results[scenario.name] = await run_scenario(
+                client, scenario, counter,
+                requests=scenario.requests or args.requests,
+                warmup=args.warmup,
+                concurrency=args.concurrency,
+            )
+    for db_engine in all_engines():
+        await db_engine.dispose()
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "scale": scale.to_dict() if args.reset else None,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    defaults = Scale()
+    parser = argparse.ArgumentParser(description="SecuHub API 벤치마크")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--assessments", type=int, default=defaults.assessments)
+    parser.add_argument("--vulnerabilities", type=int, default=defaults.vulnerabilities)
+    parser.add_argument("--evidence-files", type=int, default=defaults.evidence_files)
+    parser.add_argument("--reset", action="store_true",
+                        help="대상 DB의 테이블을 모두 지우고 합성 데이터 생성 (지정하지 않으면 기존 데이터 사용)")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--login-requests", type=int, default=20, help="로그인은 bcrypt 비용 때문에 별도 지정")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--scenario", action="append", help="이름 접두사로 시나리오 선택 (여러 번 지정 가능)")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_report(report["results"], baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
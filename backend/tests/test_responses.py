@@ -0,0 +1,117 @@
+"""
+응답 압축 (core.responses.CompressionMiddleware / accepts_gzip) - DB 없이 ASGI 앱으로 검사
+"""
+import gzip
+import httpx
+import pytest
+from app.core.config import settings
+from app.core.responses import CompressionMiddleware, accepts_gzip
+
+BODY = b'{"items": [' + b", ".join(b'{"id": %d}' % i for i in range(500)) + b"]}"
+
+
+def _app(status: int = 200, headers: list[tuple[bytes, bytes]] = (), chunks: list[bytes] = (BODY,)):
+    """chunks가 여러 개면 more_body로 나눠 보내는 스트리밍 응답"""
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"etag", b'"v1"'), *headers],
+        })
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return CompressionMiddleware(app)
+
+
+async def _get(app, accept_encoding: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/", headers={"Accept-Encoding": accept_encoding})
+
+
+# ========================================
+# Accept-Encoding 해석
+# ========================================
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("GZIP;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip;q=0.0, br", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("*;q=0, gzip", True),
+    ("gzip;q=0, *", False),
+    ("identity", False),
+    ("", False),
+    ("gzip;q=abc", False),
+])
+def test_accepts_gzip(accept_encoding, expected):
+    assert accepts_gzip(accept_encoding) is expected
+
+
+# ========================================
+# 미들웨어
+# ========================================
+@pytest.mark.asyncio
+async def test_compresses_single_body():
+    response = await _get(_app(), "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept_encoding", ["gzip;q=0", "*;q=0", "identity"])
+async def test_refused_gzip_sends_identity_with_vary(accept_encoding):
+    response = await _get(_app(), accept_encoding)
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == '"v1"'
+    assert response.content == BODY
+
+
+@pytest.mark.asyncio
+async def test_small_body_is_not_compressed():
+    small = b'{"id": 1}'
+    assert len(small) < settings.GZIP_MINIMUM_SIZE
+    response = await _get(_app(chunks=[small]), "gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == small
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_passes_through():
+    half = len(BODY) // 2
+    response = await _get(_app(chunks=[BODY[:half], BODY[half:]]), "gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.content == BODY
+
+
+@pytest.mark.asyncio
+async def test_partial_content_passes_through():
+    part = BODY[:2048]
+    app = _app(
+        status=206,
+        headers=[(b"content-range", b"bytes 0-2047/%d" % len(BODY))],
+        chunks=[part],
+    )
+    response = await _get(app, "gzip")
+    assert response.status_code == 206
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.content == part
+
+
+@pytest.mark.asyncio
+async def test_encoded_body_is_not_compressed_twice():
+    encoded = gzip.compress(BODY)
+    app = _app(headers=[(b"content-encoding", b"gzip")], chunks=[encoded])
+    response = await _get(app, "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == BODY
@@ -0,0 +1,124 @@
+"""
+취약점 조치 워크플로 (services.vulnerability_workflow) - DB 없이 검사하는 규칙
+"""
+from types import SimpleNamespace
+import pytest
+from app.core.user_cache import AuthUser
+from app.models.user import UserRole, UserStatus
+from app.models.vulnerability import Vulnerability, VulnStatus
+from app.services.vulnerability_workflow import (
+    TRANSITIONS,
+    WorkflowAction,
+    WorkflowError,
+    check_users,
+    target_conditions,
+)
+
+
+def _actor(role: UserRole, user_id: int = 7) -> AuthUser:
+    return AuthUser(
+        id=user_id, role=role, status=UserStatus.ACTIVE, team="백엔드팀",
+        permission_evidence=False, permission_vuln=True,
+    )
+
+
+def _has(conditions: list, expected) -> bool:
+    return any(condition.compare(expected) for condition in conditions)
+
+
+# ========================================
+# 전이 표
+# ========================================
+@pytest.mark.parametrize("action, sources, target, actor_scope", [
+    (WorkflowAction.ASSIGN, {VulnStatus.UNASSIGNED, VulnStatus.PENDING_SCHEDULE}, VulnStatus.PENDING_SCHEDULE, None),
+    (WorkflowAction.SCHEDULE, {VulnStatus.PENDING_SCHEDULE}, VulnStatus.PENDING_APPROVAL, "assignee_id"),
+    (WorkflowAction.APPROVE, {VulnStatus.PENDING_APPROVAL}, VulnStatus.IN_PROGRESS, "approver_id"),
+    (WorkflowAction.REJECT, {VulnStatus.PENDING_APPROVAL}, VulnStatus.PENDING_SCHEDULE, "approver_id"),
+    (WorkflowAction.START, {VulnStatus.IN_PROGRESS}, VulnStatus.IN_PROGRESS, "assignee_id"),
+    (WorkflowAction.COMPLETE, {VulnStatus.IN_PROGRESS}, VulnStatus.DONE, "assignee_id"),
+])
+def test_transition_table(action, sources, target, actor_scope):
+    transition = TRANSITIONS[action]
+    assert transition.sources == sources
+    assert transition.target == target
+    assert transition.actor_scope == actor_scope
+
+
+def test_every_action_has_a_transition():
+    assert set(TRANSITIONS) == set(WorkflowAction)
+
+
+def test_done_is_terminal():
+    assert all(VulnStatus.DONE not in transition.sources for transition in TRANSITIONS.values())
+
+
+def test_actor_scopes_are_vulnerability_columns():
+    for transition in TRANSITIONS.values():
+        if transition.actor_scope:
+            assert transition.actor_scope in Vulnerability.__table__.columns
+
+
+# ========================================
+# 본인 범위
+# ========================================
+@pytest.mark.parametrize("action, column", [
+    (WorkflowAction.SCHEDULE, Vulnerability.assignee_id),
+    (WorkflowAction.START, Vulnerability.assignee_id),
+    (WorkflowAction.COMPLETE, Vulnerability.assignee_id),
+    (WorkflowAction.APPROVE, Vulnerability.approver_id),
+    (WorkflowAction.REJECT, Vulnerability.approver_id),
+])
+def test_non_admin_is_limited_to_own_rows(action, column):
+    actor = _actor(UserRole.APPROVER if column is Vulnerability.approver_id else UserRole.DEVELOPER)
+    conditions = target_conditions(TRANSITIONS[action], actor)  # 대상 생략 = 본인 범위 전체
+    assert _has(conditions, column == actor.id)
+
+
+def test_admin_is_not_limited_to_own_rows():
+    conditions = target_conditions(TRANSITIONS[WorkflowAction.APPROVE], _actor(UserRole.ADMIN), vulnerability_ids=[1, 2])
+    assert not _has(conditions, Vulnerability.approver_id == 7)
+    assert _has(conditions, Vulnerability.id.in_([1, 2]))
+
+
+def test_admin_must_name_targets():
+    with pytest.raises(WorkflowError):
+        target_conditions(TRANSITIONS[WorkflowAction.APPROVE], _actor(UserRole.ADMIN))
+
+
+def test_unscoped_transition_must_name_targets():
+    with pytest.raises(WorkflowError):
+        target_conditions(TRANSITIONS[WorkflowAction.ASSIGN], _actor(UserRole.ADMIN))
+    conditions = target_conditions(TRANSITIONS[WorkflowAction.ASSIGN], _actor(UserRole.ADMIN), assessment_id=3)
+    assert _has(conditions, Vulnerability.assessment_id == 3)
+
+
+def test_only_source_statuses_are_targeted():
+    conditions = target_conditions(TRANSITIONS[WorkflowAction.COMPLETE], _actor(UserRole.DEVELOPER))
+    assert _has(conditions, Vulnerability.status.in_(TRANSITIONS[WorkflowAction.COMPLETE].sources))
+
+
+# ========================================
+# 담당자/결재자 검증
+# ========================================
+def _user(role: UserRole, status: UserStatus = UserStatus.ACTIVE):
+    return SimpleNamespace(role=role, status=status)
+
+
+def test_accepts_active_assignee_and_approver():
+    check_users(
+        {"assignee_id": 1, "approver_id": 2},
+        {1: _user(UserRole.DEVELOPER), 2: _user(UserRole.APPROVER)},
+    )
+    check_users({"approver_id": 3}, {3: _user(UserRole.ADMIN)})
+    check_users({"due_date": None}, {})
+
+
+@pytest.mark.parametrize("values, users", [
+    ({"assignee_id": 1}, {}),                                                  # 없는 사용자
+    ({"assignee_id": 1}, {1: _user(UserRole.DEVELOPER, UserStatus.INACTIVE)}),  # 비활성
+    ({"approver_id": 2}, {2: _user(UserRole.APPROVER, UserStatus.INACTIVE)}),
+    ({"approver_id": 2}, {2: _user(UserRole.DEVELOPER)}),                      # 결재 권한 없음
+])
+def test_rejects_invalid_users(values, users):
+    with pytest.raises(WorkflowError):
+        check_users(values, users)
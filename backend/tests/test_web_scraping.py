@@ -0,0 +1,188 @@
+"""
+웹 화면 수집기 (collectors.web_scraping)
+
+로컬 http.server로 띄운 고정 페이지를 실제 브라우저로 캡처합니다.
+Playwright 브라우저가 설치되지 않았으면 건너뜁니다. (python -m playwright install chromium)
+"""
+import functools
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from app.collectors import web_scraping
+from app.collectors.base import CollectionError
+from app.core.config import settings
+from app.models.evidence import CollectionJob, JobExecution, JobType
+from app.tasks.collection import job_slot
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>계정 현황</title></head>
+<body><h1>계정 현황</h1><table id="grid"><tr><td>admin</td><td>활성</td></tr></table></body></html>
+"""
+
+
+# ========================================
+# Fixtures
+# ========================================
+@pytest.fixture(scope="module")
+def browser_installed():
+    sync_api = pytest.importorskip("playwright.sync_api")
+    try:
+        with sync_api.sync_playwright() as p:
+            getattr(p, settings.WEB_SCRAPING_BROWSER).launch(headless=True).close()
+    except Exception as e:
+        pytest.skip(f"Playwright 브라우저를 실행할 수 없습니다: {e}")
+    yield
+    web_scraping.browser_pool.close()
+
+
+@pytest.fixture
+def site(tmp_path):
+    root = tmp_path / "site"
+    root.mkdir()
+    (root / "users.html").write_text(PAGE, encoding="utf-8")
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registered(tmp_path, monkeypatch):
+    """저장소는 임시 디렉터리로, 증빙 등록(DB)은 호출 기록으로 대체"""
+    monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.setattr(settings, "WEB_SCRAPING_TIMEOUT_MS", 3000)
+
+    @contextmanager
+    def no_limit(host):
+        yield
+
+    calls = []
+    monkeypatch.setattr(web_scraping, "host_slot", no_limit)
+    monkeypatch.setattr(
+        web_scraping, "register_evidence",
+        lambda session, job, execution, stored, file_name: calls.append((stored, file_name)),
+    )
+    return calls
+
+
+def _job(targets: list[dict]) -> CollectionJob:
+    return CollectionJob(name="화면수집", job_type=JobType.WEB_SCRAPING, config={"targets": targets})
+
+
+def _read(stored) -> bytes:
+    with open(os.path.join(settings.STORAGE_PATH, stored.path), "rb") as f:
+        return f.read()
+
+
+# ========================================
+# 수집기
+# ========================================
+def test_captures_screenshot_and_pdf(browser_installed, site, registered):
+    job = _job([
+        {"url": f"{site}/users.html", "capture": "screenshot", "wait_for": "#grid"},
+        {"url": f"{site}/users.html", "capture": "pdf", "file_name": "계정현황.pdf"},
+    ])
+
+    web_scraping.collect_web_scraping(job, JobExecution(id=1), session=None)
+
+    (png, png_name), (pdf, pdf_name) = registered
+    assert png_name.startswith("화면수집_1_") and png_name.endswith(".png")
+    assert _read(png).startswith(b"\x89PNG")
+    assert pdf_name == "계정현황.pdf"
+    assert _read(pdf).startswith(b"%PDF")
+
+
+def test_failed_target_saves_trace(browser_installed, site, registered):
+    job = _job([
+        {"url": f"{site}/users.html", "capture": "screenshot"},
+        {"url": f"{site}/users.html", "capture": "screenshot", "wait_for": "#missing"},
+    ])
+
+    with pytest.raises(CollectionError) as exc_info:
+        web_scraping.collect_web_scraping(job, JobExecution(id=2), session=None)
+
+    assert f"{site}/users.html" in str(exc_info.value)
+    trace_path = exc_info.value.trace_file_path
+    assert trace_path is not None
+    assert os.path.getsize(os.path.join(settings.STORAGE_PATH, trace_path)) > 0
+    assert registered == []  # 하나라도 실패하면 아무것도 등록하지 않음
+    assert not os.listdir(os.path.join(settings.STORAGE_PATH, "tmp"))
+
+
+def test_rejects_invalid_target(registered):
+    with pytest.raises(CollectionError):
+        web_scraping.collect_web_scraping(_job([{"url": "not-a-url"}]), JobExecution(id=3), session=None)
+    with pytest.raises(CollectionError):
+        web_scraping.collect_web_scraping(
+            _job([{"url": "http://127.0.0.1/", "capture": "html"}]), JobExecution(id=4), session=None,
+        )
+
+
+# ========================================
+# 호스트별 동시 접속 / 작업별 동시 실행 제한 (Redis 필요)
+# ========================================
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = web_scraping.get_sync_redis()
+    try:
+        client.ping()
+    except Exception as e:
+        pytest.skip(f"Redis에 연결할 수 없습니다: {e}")
+    monkeypatch.setattr(settings, "WEB_SCRAPING_HOST_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "WEB_SCRAPING_HOST_WAIT_SECONDS", 0)
+    monkeypatch.setattr(settings, "COLLECTION_JOB_MAX_CONCURRENCY", 1)
+    return client
+
+
+def test_host_slot_limits_and_releases(redis_client):
+    host = f"test-{uuid.uuid4().hex}"
+    key = f"secuhub:scraping:host:{host}"
+
+    with web_scraping.host_slot(host):
+        assert redis_client.zcard(key) == 1
+        with pytest.raises(CollectionError):
+            with web_scraping.host_slot(host):
+                pass
+    assert redis_client.zcard(key) == 0
+
+
+def test_host_slot_reclaims_leaked_slot(redis_client):
+    host = f"test-{uuid.uuid4().hex}"
+    key = f"secuhub:scraping:host:{host}"
+    redis_client.zadd(key, {"crashed-worker": time.time() - 1})  # 반납되지 않고 만료된 슬롯
+    try:
+        with web_scraping.host_slot(host):
+            assert redis_client.zscore(key, "crashed-worker") is None
+    finally:
+        redis_client.delete(key)
+
+
+def test_job_slot_limits_and_releases(redis_client):
+    job_id = uuid.uuid4().int % 10**9
+    key = f"secuhub:collection:slots:{job_id}"
+
+    with job_slot(job_id) as acquired:
+        assert acquired
+        with job_slot(job_id) as second:
+            assert not second
+        assert redis_client.zcard(key) == 1
+    assert redis_client.zcard(key) == 0
+
+
+def test_job_slot_reclaims_leaked_slot(redis_client):
+    job_id = uuid.uuid4().int % 10**9
+    key = f"secuhub:collection:slots:{job_id}"
+    redis_client.zadd(key, {"killed-worker": time.time() - 1})  # acks_late 재전달 전에 종료된 실행
+    try:
+        with job_slot(job_id) as acquired:
+            assert acquired
+            assert redis_client.zscore(key, "killed-worker") is None
+    finally:
+        redis_client.delete(key)
@@ -33,10 +33,19 @@ case "$1" in
       docker compose -f docker-compose.offline.yml down -v
       docker compose -f docker-compose.offline.yml up -d
       sleep 5
+      docker compose -f docker-compose.offline.yml exec api alembic upgrade head
       docker compose -f docker-compose.offline.yml exec api python -m app.core.seed
       echo "✓ DB 초기화 및 시드 완료"
     fi
     ;;
+  migrate)
+    echo "DB 마이그레이션 적용..."
+    docker compose -f docker-compose.offline.yml exec api alembic upgrade head
+    ;;
+  rebuild-coverage)
+    echo "증빙 수집 현황 집계 재구축..."
+    docker compose -f docker-compose.offline.yml exec api python -m app.core.seed --rebuild-coverage
+    ;;
   db)
     echo "PostgreSQL 접속..."
     docker compose -f docker-compose.offline.yml exec postgres psql -U secuhub -d secuhub
@@ -53,6 +62,8 @@ case "$1" in
     echo "  logs [서비스]  로그 확인 (기본: api)"
     echo "  seed       DB 시드 데이터 생성"
     echo "  reset-db   DB 초기화 (주의!)"
+    echo "  migrate    DB 마이그레이션 적용 (업그레이드 후)"
+    echo "  rebuild-coverage  증빙 수집 현황 집계 재구축 (업그레이드 후 1회)"
     echo "  db         PostgreSQL 직접 접속"
     ;;
 esac